@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the frame time of the render backends.
+
+A dense generated level is rendered in a window with the pygame surface
+Renderer and with the GpuRenderer at 1080p and 4K. Every frame includes
+showing it in the window. The median and the 95th percentile of the frame
+times are printed.
+
+The dummy SDL video driver is used unless SDL_VIDEODRIVER is set. Without
+a graphics driver SDL renders with its software renderer, which can be
+forced with SDL_RENDER_DRIVER=software.
+
+Usage:
+    python3 benchmarks/render_backend_benchmark.py
+    python3 benchmarks/render_backend_benchmark.py --frames 300
+"""
+from time import perf_counter
+from typing import List
+from typing import NamedTuple
+
+import argparse
+import gc
+import os
+import statistics
+
+RESOLUTIONS = (("1080p", 1920, 1080), ("4K", 3840, 2160))
+FRAMES = 120
+WARMUP_FRAMES = 5
+
+
+class FrameTimes(NamedTuple):
+    backend: str
+    resolution: str
+    p50_in_ms: float
+    p95_in_ms: float
+
+
+def dense_level(seed: int = 0):
+    """Level full of half sized bricks with all hitpoints."""
+    from bricks.level_generator import GeneratorParameters
+    from bricks.level_generator import generate_level
+
+    parameters = GeneratorParameters(
+        brick_width=0.5,
+        brick_height=0.5,
+        brick_area_height=0.75,
+        density=1.0,
+        hitpoint_weights=(1,) * 9,
+    )
+    return generate_level(seed, parameters)
+
+
+def measure_frame_times(
+    renderer_class, level, width: int, height: int, frame_count: int
+) -> List[float]:
+    """Times in ms of rendering frame_count frames in a window."""
+    renderer = renderer_class(
+        screen_width=width,
+        screen_height=height,
+        grid_width=level.grid_width,
+        grid_height=level.grid_height,
+    )
+    for _ in range(WARMUP_FRAMES):
+        renderer.render(level)
+    times = []
+    for frame_idx in range(frame_count):
+        # Moves the ball so not the same frame is shown every time.
+        ball = level.balls[0]
+        ball.top_left.x = 1.0 + frame_idx % (level.grid_width - 2)
+        start = perf_counter()
+        renderer.render(level)
+        times.append((perf_counter() - start) * 1000.0)
+    del renderer
+    gc.collect()
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure frame times of the render backends."
+    )
+    parser.add_argument(
+        "--frames", type=int, default=FRAMES, help="Frames per measurement"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Level seed")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from bricks.gpu_renderer import GpuRenderer
+    from bricks.renderer import Renderer
+
+    level = dense_level(args.seed)
+    print("dense level with %d bricks" % len(level.bricks))
+    print("%-12s %-6s %10s %10s" % ("backend", "size", "p50 ms", "p95 ms"))
+    for name, width, height in RESOLUTIONS:
+        for backend, renderer_class in (
+            ("surface", Renderer),
+            ("gpu", GpuRenderer),
+        ):
+            times = measure_frame_times(
+                renderer_class, level, width, height, args.frames
+            )
+            result = FrameTimes(
+                backend,
+                name,
+                statistics.median(times),
+                statistics.quantiles(times, n=20)[-1],
+            )
+            print(
+                "%-12s %-6s %10.2f %10.2f"
+                % (
+                    result.backend,
+                    result.resolution,
+                    result.p50_in_ms,
+                    result.p95_in_ms,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
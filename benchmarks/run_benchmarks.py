@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for physics, rendering and level loading.
+
+Every benchmark reports operations per second and the peak memory allocated
+by a single operation.
+Results can be saved as a baseline and later runs can be compared against
+it. A benchmark which got slower than the threshold is flagged as regression
+and the run exits with code 1.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py --save benchmarks/baseline.json
+    python3 benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.fixed_point_ball import FixedPointBall
+from bricks.game_objects.physics import _clamp_angle
+from bricks.game_objects.physics import reflect_from_game_objects
+from bricks.game_objects.physics import reflect_balls_from_game_objects
+from bricks.game_objects.spatial_grid import SpatialGrid
+from bricks.level import read_level_from_json_file
+from bricks.level_generator import GeneratorParameters
+from bricks.level_generator import generate_level_data
+from bricks.level_generator import write_level_to_json_file
+from bricks.types.angle import Angle
+from bricks.types.angle import QuantizedAngle
+from bricks.types.point import Point
+
+from time import perf_counter
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+
+import argparse
+import json
+import sys
+import tempfile
+import tracemalloc
+
+from numpy import deg2rad
+
+MIN_TIME_IN_S = 0.2
+REPEATS = 5
+REGRESSION_THRESHOLD = 0.1
+
+
+class Benchmark(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], None]]
+
+
+class Result(NamedTuple):
+    ops_per_sec: float
+    peak_bytes_per_op: int
+
+
+def _make_brick_field(brick_count: int) -> List[Brick]:
+    columns = 100
+    return [
+        Brick(
+            top_left=Point(
+                1.0 + (idx % columns) * 0.5, 1.0 + (idx // columns) * 0.25
+            ),
+            width=0.5,
+            height=0.25,
+        )
+        for idx in range(brick_count)
+    ]
+
+
+def _make_ball_hitting_brick_field(x: float, bricks: List[Brick]) -> Ball:
+    """
+    Ball which overlaps the bottom edge of the lowest row of bricks, so it
+    hits two bricks if x is on the edge between them.
+    """
+    lowest_y = bricks[-1].bottom_right.y
+    return Ball(
+        top_left=Point(x, lowest_y - 0.1),
+        width=0.75,
+        height=0.75,
+        velocity=16.0,
+        angle=Angle(deg2rad(45.0)),
+    )
+
+
+def _reset_hits(
+    balls: List[Ball], starts: List[Point], hit_objects: List[List[Brick]]
+):
+    """Undoes the reflection, so every run of a benchmark hits again."""
+    for ball, start, hits in zip(balls, starts, hit_objects):
+        ball.top_left = Point(start.x, start.y)
+        ball.angle = Angle(deg2rad(45.0))
+        for brick in hits:
+            brick.hitpoints = brick.start_hitpoints
+
+
+def _setup_reflect(brick_count: int) -> Callable[[], Callable[[], None]]:
+    def setup():
+        bricks = _make_brick_field(brick_count)
+        ball = _make_ball_hitting_brick_field(10.0, bricks)
+        start = ball.top_left
+
+        def op():
+            hits = reflect_from_game_objects(ball, bricks)
+            _reset_hits([ball], [start], [hits])
+
+        return op
+
+    return setup
+
+
+def _setup_reflect_balls(ball_count: int, brick_count: int):
+    def setup():
+        bricks = _make_brick_field(brick_count)
+        grid = SpatialGrid(bricks)
+        balls = [
+            _make_ball_hitting_brick_field(1.0 + idx * 1.5, bricks)
+            for idx in range(ball_count)
+        ]
+        starts = [ball.top_left for ball in balls]
+
+        def op():
+            hit_objects = reflect_balls_from_game_objects(balls, grid)
+            _reset_hits(balls, starts, hit_objects)
+
+        return op
+
+    return setup
+
+
+def _setup_ball_move(ball_type=Ball):
+    ball = ball_type(
+        top_left=Point(10.0, 10.0),
+        width=0.75,
+        height=0.75,
+        velocity=16.0,
+        angle=Angle(deg2rad(135.0)),
+        gravity=1.5,
+    )
+    ball.is_active = True
+    start = Point(10.0, 10.0)
+
+    def op():
+        ball.move(1000.0 / 60.0)
+        ball.top_left = Point(start.x, start.y)
+
+    return op
+
+
+def _setup_angle_normalisation(angle_type=Angle):
+    angle = angle_type()
+    values = [deg2rad(value) for value in (-725.0, -30.0, 390.0, 1085.0)]
+
+    def op():
+        for value in values:
+            angle.value = value
+
+    return op
+
+
+def _setup_angle_clamp(angle_type=Angle):
+    angle = angle_type()
+    values = [deg2rad(value) for value in (10.0, 80.0, 135.0, 350.0)]
+
+    def op():
+        for value in values:
+            angle.value = value
+            _clamp_angle(angle)
+
+    return op
+
+
+def _setup_render(
+    screen_width: int = 780,
+    screen_height: int = 540,
+    render_scale: float = 1.0,
+):
+    def setup():
+        from bricks.level_pack import load_level_pack
+        from bricks.renderer import Renderer
+
+        level = load_level_pack("level").make_level(5)
+        renderer = Renderer(
+            screen_width=screen_width,
+            screen_height=screen_height,
+            grid_width=level.grid_width,
+            grid_height=level.grid_height,
+            render_scale=render_scale,
+        )
+        return lambda: renderer.render(level)
+
+    return setup
+
+
+def _setup_render_offscreen(screen_width: int, screen_height: int):
+    def setup():
+        from bricks.level_pack import load_level_pack
+        from bricks.renderer import Renderer
+
+        import numpy
+
+        level = load_level_pack("level").make_level(5)
+        renderer = Renderer(
+            screen_width=screen_width,
+            screen_height=screen_height,
+            grid_width=level.grid_width,
+            grid_height=level.grid_height,
+            is_offscreen=True,
+        )
+        frame = numpy.empty((screen_height, screen_width, 3), numpy.uint8)
+
+        def op():
+            renderer.render(level)
+            renderer.frame_as_array(frame)
+
+        return op
+
+    return setup
+
+
+def _setup_array_rasterizer(width: int, height: int):
+    def setup():
+        from bricks.array_rasterizer import ArrayRasterizer
+        from bricks.level_pack import load_level_pack
+
+        level = load_level_pack("level").make_level(5)
+        rasterizer = ArrayRasterizer(
+            width, height, level.grid_width, level.grid_height
+        )
+        return lambda: rasterizer.render(level)
+
+    return setup
+
+
+def _setup_snapshot_restore():
+    from bricks.level_pack import load_level_pack
+    from bricks.simulation import Action
+    from bricks.simulation import Simulation
+
+    simulation = Simulation(load_level_pack("level"))
+    simulation.step(Action.SPACE)
+    for _ in range(60):
+        simulation.step(Action.NONE)
+
+    def op():
+        simulation.restore(simulation.snapshot())
+
+    return op
+
+
+def _setup_mcts_search():
+    from bricks.level_pack import load_level_pack
+    from bricks.mcts_bot import MctsBot
+    from bricks.simulation import Action
+    from bricks.simulation import Simulation
+
+    level_pack = load_level_pack("level")
+    simulation = Simulation(level_pack, is_fixed_point=True)
+    simulation.step(Action.SPACE)
+    bot = MctsBot(level_pack, is_fixed_point=True, iteration_limit=10)
+    return lambda: bot.choose_action(simulation)
+
+
+def _setup_vec_env_step(env_count: int):
+    def setup():
+        from bricks.bricks_env import BricksVecEnv
+
+        vec_env = BricksVecEnv(env_count, is_fixed_point=True)
+        vec_env.reset()
+        actions = [frame % 4 for frame in range(env_count)]
+        return lambda: vec_env.step(actions)
+
+    return setup
+
+
+def _setup_level_loading(grid_width: int, grid_height: int):
+    def setup():
+        # The folder is removed when the op referencing it is dropped.
+        folder = tempfile.TemporaryDirectory()
+        parameters = GeneratorParameters(
+            grid_width=grid_width, grid_height=grid_height, density=0.8
+        )
+        write_level_to_json_file(
+            generate_level_data(0, parameters),
+            os.path.join(folder.name, "level.json"),
+        )
+        return lambda: read_level_from_json_file(
+            os.path.join(folder.name, "level.json")
+        )
+
+    return setup
+
+
+BENCHMARKS = [
+    Benchmark("reflect_100_bricks", _setup_reflect(100)),
+    Benchmark("reflect_1000_bricks", _setup_reflect(1000)),
+    Benchmark("reflect_10000_bricks", _setup_reflect(10000)),
+    Benchmark("reflect_32_balls_1000_bricks", _setup_reflect_balls(32, 1000)),
+    Benchmark("ball_move", _setup_ball_move),
+    Benchmark(
+        "ball_move_fixed_point", lambda: _setup_ball_move(FixedPointBall)
+    ),
+    Benchmark("angle_normalisation", _setup_angle_normalisation),
+    Benchmark(
+        "angle_normalisation_quantized",
+        lambda: _setup_angle_normalisation(QuantizedAngle),
+    ),
+    Benchmark("angle_clamp", _setup_angle_clamp),
+    Benchmark(
+        "angle_clamp_quantized", lambda: _setup_angle_clamp(QuantizedAngle)
+    ),
+    Benchmark("renderer_render", _setup_render()),
+    Benchmark("renderer_render_1560x1080", _setup_render(1560, 1080)),
+    Benchmark(
+        "renderer_render_1560x1080_half_scale",
+        _setup_render(1560, 1080, render_scale=0.5),
+    ),
+    Benchmark("render_offscreen_780x540", _setup_render_offscreen(780, 540)),
+    Benchmark("render_offscreen_208x144", _setup_render_offscreen(208, 144)),
+    Benchmark("array_rasterizer_84x84", _setup_array_rasterizer(84, 84)),
+    Benchmark("snapshot_restore", _setup_snapshot_restore),
+    Benchmark("mcts_10_iterations_fixed_point", _setup_mcts_search),
+    Benchmark("vec_env_16_step", _setup_vec_env_step(16)),
+    Benchmark("load_level_26x18", _setup_level_loading(26, 18)),
+    Benchmark("load_level_100x60", _setup_level_loading(100, 60)),
+    Benchmark("load_level_300x200", _setup_level_loading(300, 200)),
+]
+
+
+def run_benchmark(benchmark: Benchmark) -> Result:
+    op = benchmark.setup()
+    op()
+
+    loops = 1
+    while True:
+        elapsed = _time_loops(op, loops)
+        if elapsed >= MIN_TIME_IN_S:
+            break
+        loops *= 2
+
+    best = min(_time_loops(op, loops) for _ in range(REPEATS))
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_size, _ = tracemalloc.get_traced_memory()
+    op()
+    _, peak_size = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return Result(loops / best, peak_size - start_size)
+
+
+def _time_loops(op: Callable[[], None], loops: int) -> float:
+    start = perf_counter()
+    for _ in range(loops):
+        op()
+    return perf_counter() - start
+
+
+def compare(
+    results: Dict[str, Result], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """Returns the names of all benchmarks which got slower than threshold."""
+    regressions: List[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result.ops_per_sec / baseline[name]["ops_per_sec"]
+        if ratio < 1.0 - threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run benchmarks.")
+    parser.add_argument("--save", metavar="FILE", help="Save as baseline")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="Compare against baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="Relative slowdown which counts as regression",
+    )
+    parser.add_argument(
+        "--filter", default="", help="Only run benchmarks containing this"
+    )
+    args = parser.parse_args()
+
+    baseline: Dict[str, Dict] = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    results: Dict[str, Result] = {}
+    for benchmark in BENCHMARKS:
+        if args.filter not in benchmark.name:
+            continue
+        result = run_benchmark(benchmark)
+        results[benchmark.name] = result
+        line = "%-30s %14.1f ops/s %10d B/op" % (
+            benchmark.name,
+            result.ops_per_sec,
+            result.peak_bytes_per_op,
+        )
+        if benchmark.name in baseline:
+            baseline_ops_per_sec = baseline[benchmark.name]["ops_per_sec"]
+            ratio = result.ops_per_sec / baseline_ops_per_sec
+            line += "   %+6.1f%%" % ((ratio - 1.0) * 100.0)
+        print(line)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(
+                {name: result._asdict() for name, result in results.items()},
+                file,
+                indent=4,
+            )
+
+    if args.compare:
+        regressions = compare(results, baseline, args.threshold)
+        for name in regressions:
+            print("REGRESSION: %s" % name)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
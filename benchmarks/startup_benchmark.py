@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the startup time of the game.
+
+Two numbers are measured in fresh interpreters:
+
+* import time: cumulative time of `import bricks.app` reported by
+  `python -X importtime`.
+* time to first frame: wall time from starting the interpreter until the
+  game rendered its first frame. The game is built like app.py builds it
+  and quits after the first frame.
+
+Both are the median of several runs after a warm-up run which caches the
+bytecode. The dummy SDL drivers are used unless SDL_VIDEODRIVER and
+SDL_AUDIODRIVER are set. The run exits with code 1 if the time to first
+frame is above the target.
+
+Usage:
+    python3 benchmarks/startup_benchmark.py
+    python3 benchmarks/startup_benchmark.py --repeats 10 --target-ms 300
+"""
+from time import perf_counter
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+REPEATS = 5
+TARGET_IN_MS = 300.0
+SLOWEST_IMPORT_COUNT = 8
+
+FIRST_FRAME_LINE = "first frame"
+
+
+class ImportTime(NamedTuple):
+    name: str
+    self_in_ms: float
+    cumulative_in_ms: float
+
+
+def measure_import_times(module: str = "bricks.app") -> List[ImportTime]:
+    """Import times of module and everything it imports."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        env=_child_env(),
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    return _parse_import_times(completed.stderr)
+
+
+def measure_time_to_first_frame() -> float:
+    """Wall time in ms from starting the interpreter to the first frame."""
+    start = perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--first-frame"],
+        env=_child_env(),
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    try:
+        for line in process.stdout:
+            if line.strip() == FIRST_FRAME_LINE:
+                return (perf_counter() - start) * 1000.0
+        raise RuntimeError("Game exited before the first frame")
+    finally:
+        process.stdout.close()
+        process.wait()
+
+
+def _parse_import_times(stderr: str) -> List[ImportTime]:
+    import_times: List[ImportTime] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        columns = line[len("import time:") :].split("|")
+        try:
+            self_in_us = int(columns[0])
+            cumulative_in_us = int(columns[1])
+        except ValueError:
+            continue
+        import_times.append(
+            ImportTime(
+                columns[2].strip(),
+                self_in_us / 1000.0,
+                cumulative_in_us / 1000.0,
+            )
+        )
+    return import_times
+
+
+def _child_env():
+    # Players start the game with cached bytecode, so it may be written.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    return env
+
+
+def _run_until_first_frame():
+    from bricks.game import Game
+    from bricks.game import SCREEN_HEIGHT
+    from bricks.game import SCREEN_WIDTH
+    from bricks.input_handler import InputHandler
+
+    class FirstFrameInputHandler(InputHandler):
+        def handle_input(self, level, elapsed_time_in_ms):
+            print(FIRST_FRAME_LINE, flush=True)
+            self._is_quit = True
+
+    game = Game(
+        SCREEN_WIDTH,
+        SCREEN_HEIGHT,
+        input_handler=FirstFrameInputHandler(),
+    )
+    try:
+        game.run()
+    finally:
+        game.close()
+
+
+def _median_import_times(
+    repeats: int,
+) -> Tuple[float, List[ImportTime]]:
+    runs = [measure_import_times() for _ in range(repeats)]
+    totals = [
+        next(t.cumulative_in_ms for t in run if t.name == "bricks.app")
+        for run in runs
+    ]
+    median_run = runs[totals.index(statistics.median_low(totals))]
+    return statistics.median_low(totals), median_run
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure import time and time to first frame."
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=REPEATS, help="Runs per measurement"
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=TARGET_IN_MS,
+        help="Maximum time to first frame",
+    )
+    parser.add_argument(
+        "--first-frame", action="store_true", help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.first_frame:
+        _run_until_first_frame()
+        return
+
+    measure_time_to_first_frame()
+    import_time, import_times = _median_import_times(args.repeats)
+    print("%-40s %8.1f ms" % ("import bricks.app", import_time))
+    slowest = sorted(import_times, key=lambda t: t.self_in_ms)[::-1]
+    for entry in slowest[:SLOWEST_IMPORT_COUNT]:
+        print("    %-36s %8.1f ms self" % (entry.name, entry.self_in_ms))
+
+    first_frame = statistics.median(
+        measure_time_to_first_frame() for _ in range(args.repeats)
+    )
+    print(
+        "%-40s %8.1f ms (target %.0f ms)"
+        % ("time to first frame", first_frame, args.target_ms)
+    )
+    if first_frame > args.target_ms:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Difficulty which adapts to the player while the game runs.
+
+Telemetry keeps rolling metrics of the session. Each time a life starts,
+after a lost ball or on a new level, the controller compares them to
+targets and moves a skill value between -1 and 1. The ball velocity and
+gravity are scaled up and the platform width down with the skill, within
+fixed ranges around the difficulty of the table.
+
+Run as script it plays headless sessions with players of different
+reaction times and prints how the skill settles.
+
+class AdaptiveBounds
+    Ranges and step size of the adjustments.
+
+class TelemetryTargets
+    Metrics of a player for whom the difficulty is right.
+
+class Telemetry
+    Rolling metrics of a session.
+
+class AdaptiveDifficultyController
+    Adjusts the difficulty of a simulation to the player.
+
+class SessionResult
+    Course of the skill in a headless session.
+
+function run_session(level_pack: LevelPack, player: ReactionPlayer,
+    frame_count: int, bounds: AdaptiveBounds = AdaptiveBounds())
+    -> SessionResult:
+    Plays a headless session with adaptive difficulty.
+"""
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.difficulty_sweep import ReactionPlayer
+from bricks.game_events import BallLost
+from bricks.game_events import BrickDestroyed
+from bricks.game_events import LevelStarted
+from bricks.level_pack import LevelPack
+from bricks.level_pack import load_level_pack
+from bricks.simulation import FRAMES_PER_SECOND
+from bricks.simulation import MS_PER_FRAME
+from bricks.simulation import Simulation
+
+from collections import deque
+from typing import Deque
+from typing import List
+from typing import NamedTuple
+
+import argparse
+import random
+
+LEVEL_FOLDER = "level"
+
+WINDOW_IN_MS = 120000.0
+MIN_OBSERVED_TIME_IN_MS = 10000.0
+MISS_DISTANCE_SMOOTHING = 0.5
+PLATFORM_WIDTH_MIN = 1.0
+
+LOSS_WEIGHT = 0.5
+BRICK_WEIGHT = 0.25
+MISS_WEIGHT = 0.25
+
+
+class AdaptiveBounds(NamedTuple):
+    ball_velocity_range: float = 0.25
+    ball_gravity_range: float = 0.5
+    platform_width_range: float = 0.25
+    gain: float = 0.25
+    dead_zone: float = 0.1
+
+
+class TelemetryTargets(NamedTuple):
+    balls_lost_per_minute: float = 1.0
+    seconds_per_brick: float = 8.0
+    miss_distance: float = 1.0
+
+
+class Telemetry:
+    """
+    Rolling metrics of a session.
+
+    Only time in which a ball is in play counts. Lost balls and destroyed
+    bricks are counted in a window of the last WINDOW_IN_MS. Recording a
+    frame is constant time, old entries are dropped when a metric is read.
+
+    Attributes
+    ----------
+    observed_time_in_ms: float
+        Time of the window which was already played.
+    balls_lost_per_minute: float
+        Lost balls per minute in the window.
+    seconds_per_brick: float
+        Seconds per destroyed brick in the window. The observed time if no
+        brick was destroyed.
+    miss_distance: float
+        Smoothed distance of the lost balls to the platform in platform
+        widths.
+
+    Methods
+    -------
+    record_frame(self, elapsed_time_in_ms: float):
+        Adds played time.
+    record_ball_lost(self, miss_distance: float):
+        Counts a lost ball which missed the platform by miss_distance
+        platform widths.
+    record_brick_destroyed(self):
+        Counts a destroyed brick.
+    """
+
+    def __init__(self, window_in_ms: float = WINDOW_IN_MS):
+        self._window_in_ms = window_in_ms
+        self._time_in_ms = 0.0
+        self._ball_lost_times: Deque[float] = deque()
+        self._brick_destroyed_times: Deque[float] = deque()
+        self._miss_distance = 0.0
+
+    @property
+    def observed_time_in_ms(self) -> float:
+        return min(self._time_in_ms, self._window_in_ms)
+
+    @property
+    def balls_lost_per_minute(self) -> float:
+        if self.observed_time_in_ms == 0.0:
+            return 0.0
+        self._drop_old(self._ball_lost_times)
+        return len(self._ball_lost_times) / self.observed_time_in_ms * 60000.0
+
+    @property
+    def seconds_per_brick(self) -> float:
+        self._drop_old(self._brick_destroyed_times)
+        count = max(1, len(self._brick_destroyed_times))
+        return self.observed_time_in_ms / 1000.0 / count
+
+    @property
+    def miss_distance(self) -> float:
+        return self._miss_distance
+
+    def record_frame(self, elapsed_time_in_ms: float):
+        """Adds played time."""
+        self._time_in_ms += elapsed_time_in_ms
+
+    def record_ball_lost(self, miss_distance: float):
+        """
+        Counts a lost ball which missed the platform by miss_distance
+        platform widths.
+        """
+        self._ball_lost_times.append(self._time_in_ms)
+        self._miss_distance += MISS_DISTANCE_SMOOTHING * (
+            miss_distance - self._miss_distance
+        )
+
+    def record_brick_destroyed(self):
+        """Counts a destroyed brick."""
+        self._brick_destroyed_times.append(self._time_in_ms)
+
+    def _drop_old(self, times: Deque[float]):
+        while times and times[0] < self._time_in_ms - self._window_in_ms:
+            times.popleft()
+
+
+class AdaptiveDifficultyController:
+    """
+    Adjusts the difficulty of a simulation to the player.
+
+    The controller listens to the event queue of the simulation. When a
+    life starts the metrics are compared to the targets. Each metric gives
+    a pressure between -1 and 1, positive if the player struggles. The
+    weighted pressure lowers the skill by gain times its value, unless it
+    is within the dead zone. The skill is limited to -1 to 1, so the
+    difficulty stays within the ranges of the bounds. Nothing is adjusted
+    before MIN_OBSERVED_TIME_IN_MS was played.
+
+    Attributes
+    ----------
+    telemetry: Telemetry
+        Metrics of the session.
+    skill: float
+        Estimated skill of the player from -1 to 1.
+    adjustment_count: int
+        Number of times the difficulty was set.
+
+    Methods
+    -------
+    update(self, elapsed_time_in_ms: float):
+        Records a played frame. Cheap enough for every frame.
+    """
+
+    def __init__(
+        self,
+        simulation: Simulation,
+        bounds: AdaptiveBounds = AdaptiveBounds(),
+        targets: TelemetryTargets = TelemetryTargets(),
+    ):
+        self._simulation = simulation
+        self._bounds = bounds
+        self._targets = targets
+        self._telemetry = Telemetry()
+        self._skill = 0.0
+        self._adjustment_count = 0
+        event_queue = simulation.event_queue
+        event_queue.subscribe(BallLost, self._on_ball_lost)
+        event_queue.subscribe(BrickDestroyed, self._on_brick_destroyed)
+        event_queue.subscribe(LevelStarted, lambda _: self._adjust())
+
+    @property
+    def telemetry(self) -> Telemetry:
+        return self._telemetry
+
+    @property
+    def skill(self) -> float:
+        return self._skill
+
+    @property
+    def adjustment_count(self) -> int:
+        return self._adjustment_count
+
+    def update(self, elapsed_time_in_ms: float):
+        """Records a played frame. Cheap enough for every frame."""
+        for ball in self._simulation.level.balls:
+            if ball.is_active:
+                self._telemetry.record_frame(elapsed_time_in_ms)
+                return
+
+    def _on_ball_lost(self, event: BallLost):
+        platform_width = self._simulation.level.platform.width
+        self._telemetry.record_ball_lost(event.miss_distance / platform_width)
+        # After the last life the next game adjusts when its level starts.
+        if event.lifes > 0:
+            self._adjust()
+
+    def _on_brick_destroyed(self, _: BrickDestroyed):
+        self._telemetry.record_brick_destroyed()
+
+    def _adjust(self):
+        telemetry = self._telemetry
+        if telemetry.observed_time_in_ms >= MIN_OBSERVED_TIME_IN_MS:
+            pressure = self._pressure()
+            if abs(pressure) > self._bounds.dead_zone:
+                self._skill = _clamp(
+                    -1.0, self._skill - self._bounds.gain * pressure, 1.0
+                )
+        simulation = self._simulation
+        base = simulation.difficulty_table.parameters(
+            simulation.difficulty_tier, simulation.level_idx
+        )
+        simulation.difficulty_parameters = self._scale(base)
+        self._adjustment_count += 1
+
+    def _pressure(self) -> float:
+        telemetry = self._telemetry
+        targets = self._targets
+        loss = _relative_error(
+            telemetry.balls_lost_per_minute, targets.balls_lost_per_minute
+        )
+        brick = _relative_error(
+            telemetry.seconds_per_brick, targets.seconds_per_brick
+        )
+        miss = _relative_error(telemetry.miss_distance, targets.miss_distance)
+        return LOSS_WEIGHT * loss + BRICK_WEIGHT * brick + MISS_WEIGHT * miss
+
+    def _scale(self, base: DifficultyParameters) -> DifficultyParameters:
+        bounds = self._bounds
+        skill = self._skill
+        return DifficultyParameters(
+            platform_velocity=base.platform_velocity,
+            platform_width=max(
+                PLATFORM_WIDTH_MIN,
+                base.platform_width
+                * (1.0 - bounds.platform_width_range * skill),
+            ),
+            ball_velocity=base.ball_velocity
+            * (1.0 + bounds.ball_velocity_range * skill),
+            ball_gravity=base.ball_gravity
+            * (1.0 + bounds.ball_gravity_range * skill),
+        )
+
+
+class SessionResult(NamedTuple):
+    skill_history: List[float]
+    balls_lost_per_minute: float
+    seconds_per_brick: float
+
+    def final_skill(self) -> float:
+        """Skill at the end of the session, 0 if it was never adjusted."""
+        return self.skill_history[-1] if self.skill_history else 0.0
+
+    def settled_change(self) -> float:
+        """Mean absolute skill change in the second half of the session."""
+        history = self.skill_history[len(self.skill_history) // 2 :]
+        if len(history) < 2:
+            return 0.0
+        changes = [abs(b - a) for a, b in zip(history, history[1:])]
+        return sum(changes) / len(changes)
+
+
+def run_session(
+    level_pack: LevelPack,
+    player: ReactionPlayer,
+    frame_count: int,
+    bounds: AdaptiveBounds = AdaptiveBounds(),
+) -> SessionResult:
+    """
+    Plays a headless session with adaptive difficulty.
+    After game over the session goes on from the first level.
+    """
+    simulation = Simulation(level_pack, is_fixed_point=True)
+    controller = AdaptiveDifficultyController(simulation, bounds)
+    skill_history = []
+    adjustment_count = 0
+    for _ in range(frame_count):
+        simulation.step(player.action(simulation))
+        controller.update(MS_PER_FRAME)
+        if simulation.is_level_cleared or simulation.is_game_over:
+            simulation.start_next_level()
+        simulation.event_queue.drain()
+        if controller.adjustment_count != adjustment_count:
+            adjustment_count = controller.adjustment_count
+            skill_history.append(controller.skill)
+    telemetry = controller.telemetry
+    return SessionResult(
+        skill_history,
+        telemetry.balls_lost_per_minute,
+        telemetry.seconds_per_brick,
+    )
+
+
+def _relative_error(value: float, target: float) -> float:
+    return _clamp(-1.0, (value - target) / target, 1.0)
+
+
+def _clamp(minimum: float, x: float, maximum: float) -> float:
+    return max(minimum, min(x, maximum))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that the adaptive difficulty settles for "
+        "players with different reaction times."
+    )
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        default=20.0,
+        help="Game time of each session in minutes",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    level_pack = load_level_pack(LEVEL_FOLDER)
+    frame_count = int(args.minutes * 60.0 * FRAMES_PER_SECOND)
+    print(
+        "%9s %7s %9s %8s %8s %8s"
+        % ("reaction", "adjusts", "skill", "settled", "lost/min", "s/brick")
+    )
+    for reaction_frames in ((1, 3), (4, 12), (10, 20), (20, 40)):
+        player = ReactionPlayer(random.Random(args.seed), *reaction_frames)
+        result = run_session(level_pack, player, frame_count)
+        print(
+            "%4d-%-4d %7d %9.2f %8.3f %8.2f %8.2f"
+            % (
+                reaction_frames[0],
+                reaction_frames[1],
+                len(result.skill_history),
+                result.final_skill(),
+                result.settled_change(),
+                result.balls_lost_per_minute,
+                result.seconds_per_brick,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
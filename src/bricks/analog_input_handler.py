@@ -0,0 +1,260 @@
+"""
+Module to control the platform by how long keys are held and with analog
+devices.
+
+class AnalogInputHandler
+    InputHandler which moves the platform for the time keys were held and
+    reads mouse and joystick.
+"""
+from bricks.input_handler import InputHandler
+from bricks.input_pump import InputPump
+from bricks.level import Level
+from bricks.platform_control import activate_balls
+from bricks.platform_control import move_platform_left
+from bricks.platform_control import move_platform_right
+
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pygame
+from pygame.constants import (
+    JOYBUTTONDOWN,
+    JOYDEVICEADDED,
+    JOYDEVICEREMOVED,
+    K_ESCAPE,
+    K_LEFT,
+    K_RIGHT,
+    K_SPACE,
+    K_p,
+    KEYDOWN,
+    KEYUP,
+    MOUSEBUTTONDOWN,
+    MOUSEMOTION,
+    QUIT,
+)
+
+DIRECTION_KEYS = (K_LEFT, K_RIGHT)
+JOYSTICK_DEAD_ZONE = 0.15
+
+
+class AnalogInputHandler(InputHandler):
+    """
+    InputHandler which moves the platform for the time keys were held and
+    reads mouse and joystick.
+
+    The full key state is read instead of one event per frame, so
+    releasing one key does not stop the other. Events are read by an
+    InputPump which stamps them with the time they were polled. The
+    platform then moves for the share of the frame a direction key was
+    held. A press late in the frame moves the platform only for the rest
+    of the frame and a short tap only for as long as it was held. poll can
+    be called several times per frame for finer timestamps.
+
+    The time from a press or space until it moves the platform or starts
+    the balls is recorded in the pump. Mouse motions are recorded
+    separately.
+
+    Moving the mouse makes the platform follow the pointer with at most
+    its velocity until a direction key is pressed. The first axis of a
+    joystick moves the platform proportional to its deflection. A mouse
+    button or a joystick button starts the balls like space.
+
+    Attributes
+    ----------
+    pump: InputPump
+        Pump which reads the events.
+
+    Methods
+    -------
+    poll(self):
+        Reads and timestamps all pending events.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], float]] = None,
+        pump: Optional[InputPump] = None,
+    ):
+        """
+        clock returns the time in ms and replaces perf_counter.
+        It is ignored if a pump is passed.
+        """
+        InputHandler.__init__(self)
+        self._pump = pump if pump else InputPump(clock)
+        self._frame_start_time = self._pump.now()
+        self._pressed_since: Dict[int, Optional[float]] = {
+            key: None for key in DIRECTION_KEYS
+        }
+        self._held_time_in_ms: Dict[int, float] = {
+            key: 0.0 for key in DIRECTION_KEYS
+        }
+        self._is_space = False
+        self._is_pause_toggled = False
+        self._mouse_x: Optional[float] = None
+        self._pending_timestamps: List[float] = []
+        self._pending_motion_timestamps: List[float] = []
+        pygame.joystick.init()
+        self._joystick = None
+        if pygame.joystick.get_count() > 0:
+            self._joystick = pygame.joystick.Joystick(0)
+
+    @property
+    def pump(self) -> InputPump:
+        return self._pump
+
+    def poll(self):
+        """
+        Reads and timestamps all pending events.
+        Can be called several times per frame.
+        """
+        self._pump.poll()
+
+    def handle_input(self, level: Level, elapsed_time_in_ms: float):
+        """
+        Polls the input and moves the platform for the share of the frame
+        the direction keys were held, scaled to elapsed_time_in_ms.
+        Handles quit, pause and starting the balls like InputHandler.
+        """
+        self._pump.poll()
+        now = self._pump.now()
+        for timestamp, event in self._pump.drain():
+            self._handle_pygame_event(event, timestamp)
+        self._sync_key_state(pygame.key.get_pressed(), now)
+        frame_time = now - self._frame_start_time
+        held_time_in_ms = self._take_held_time_in_ms(now)
+        self._frame_start_time = now
+
+        self._changed_pause_state = self._is_pause_toggled
+        if self._is_pause_toggled:
+            self._is_paused = not self._is_paused
+            self._is_pause_toggled = False
+            return
+        if self._is_quit or self._is_paused:
+            self._is_space = False
+            self._pending_timestamps.clear()
+            self._pending_motion_timestamps.clear()
+            return
+
+        if self._is_space:
+            activate_balls(level.balls)
+            self._is_space = False
+
+        if frame_time > 0.0:
+            right_share = held_time_in_ms[K_RIGHT] / frame_time
+            left_share = held_time_in_ms[K_LEFT] / frame_time
+            _move(level, (right_share - left_share) * elapsed_time_in_ms)
+        self._move_by_joystick(level, elapsed_time_in_ms)
+        self._move_by_mouse(level, elapsed_time_in_ms)
+
+        for timestamp in self._pending_timestamps:
+            self._pump.record_latency(timestamp)
+        self._pending_timestamps.clear()
+        for timestamp in self._pending_motion_timestamps:
+            self._pump.record_motion_latency(timestamp)
+        self._pending_motion_timestamps.clear()
+
+    def _handle_pygame_event(self, event: pygame.event.Event, timestamp):
+        if event.type == QUIT:
+            self._is_quit = True
+        elif event.type == KEYDOWN:
+            if event.key == K_ESCAPE:
+                self._is_quit = True
+            elif event.key == K_p:
+                self._is_pause_toggled = not self._is_pause_toggled
+            elif event.key == K_SPACE:
+                self._is_space = True
+                self._pending_timestamps.append(timestamp)
+            elif event.key in self._pressed_since:
+                self._press(event.key, timestamp)
+                self._mouse_x = None
+                self._pending_timestamps.append(timestamp)
+        elif event.type == KEYUP:
+            if event.key in self._pressed_since:
+                self._release(event.key, timestamp)
+        elif event.type == MOUSEMOTION:
+            width = _window_width(event)
+            if width > 0:
+                self._mouse_x = event.pos[0] / width
+                self._pending_motion_timestamps.append(timestamp)
+        elif event.type in (MOUSEBUTTONDOWN, JOYBUTTONDOWN):
+            self._is_space = True
+            self._pending_timestamps.append(timestamp)
+        elif event.type == JOYDEVICEADDED and self._joystick is None:
+            self._joystick = pygame.joystick.Joystick(event.device_index)
+        elif event.type == JOYDEVICEREMOVED:
+            self._joystick = None
+
+    def _sync_key_state(self, pressed_keys, timestamp: float):
+        """Catches presses and releases without event e.g. on focus loss."""
+        for key, pressed_since in self._pressed_since.items():
+            is_pressed = bool(pressed_keys[key])
+            if is_pressed and pressed_since is None:
+                self._press(key, timestamp)
+            elif not is_pressed and pressed_since is not None:
+                self._release(key, timestamp)
+
+    def _press(self, key: int, timestamp: float):
+        if self._pressed_since[key] is None:
+            self._pressed_since[key] = max(timestamp, self._frame_start_time)
+
+    def _release(self, key: int, timestamp: float):
+        pressed_since = self._pressed_since[key]
+        if pressed_since is None:
+            return
+        self._held_time_in_ms[key] += max(0.0, timestamp - pressed_since)
+        self._pressed_since[key] = None
+
+    def _take_held_time_in_ms(self, now: float) -> Dict[int, float]:
+        held_time_in_ms = {}
+        for key, pressed_since in self._pressed_since.items():
+            held_time = self._held_time_in_ms[key]
+            if pressed_since is not None:
+                held_time += max(0.0, now - pressed_since)
+                self._pressed_since[key] = now
+            held_time_in_ms[key] = held_time
+            self._held_time_in_ms[key] = 0.0
+        return held_time_in_ms
+
+    def _move_by_joystick(self, level: Level, elapsed_time_in_ms: float):
+        if self._joystick is None or self._joystick.get_numaxes() == 0:
+            return
+        axis = self._joystick.get_axis(0)
+        if abs(axis) < JOYSTICK_DEAD_ZONE:
+            return
+        _move(level, axis * elapsed_time_in_ms)
+
+    def _move_by_mouse(self, level: Level, elapsed_time_in_ms: float):
+        if self._mouse_x is None:
+            return
+        platform = level.platform
+        target_x = self._mouse_x * level.grid_width
+        offset = target_x - (platform.top_left.x + platform.width / 2.0)
+        speed = abs(platform.velocity)
+        if speed == 0.0:
+            return
+        time_to_target_in_ms = abs(offset) / speed * 1000.0
+        time_in_ms = min(elapsed_time_in_ms, time_to_target_in_ms)
+        _move(level, time_in_ms if offset > 0.0 else -time_in_ms)
+
+
+def _move(level: Level, signed_time_in_ms: float):
+    """Moves the platform right for positive and left for negative time."""
+    if signed_time_in_ms > 0.0:
+        move_platform_right(
+            level.platform, level.right_wall, signed_time_in_ms
+        )
+    elif signed_time_in_ms < 0.0:
+        move_platform_left(
+            level.platform, level.left_wall, -signed_time_in_ms
+        )
+
+
+def _window_width(event: pygame.event.Event) -> int:
+    # Windows of pygame._sdl2 have no display surface.
+    surface = pygame.display.get_surface()
+    if surface is not None:
+        return surface.get_width()
+    window = getattr(event, "window", None)
+    return window.size[0] if window is not None else 0
@@ -1,14 +1,225 @@
 #!/usr/bin/env python3
-"""Main function to run the game."""
+"""
+Main function to run the game.
+
+Only the modules needed to play are imported on startup. The modules of
+replays, recordings and the bot are imported when they are selected.
+"""
+from bricks.analog_input_handler import AnalogInputHandler
+from bricks.frame_profiler import FrameProfiler
 from bricks.game import Game
+from bricks.game import LEVEL_FOLDER
+from bricks.game import SCREEN_HEIGHT
+from bricks.game import SCREEN_WIDTH
+from bricks.hud import HudMode
+from bricks.renderer import MIN_RENDER_SCALE
+
+from typing import Optional
+from typing import Tuple
 
-SCREEN_WIDTH = 780
-SCREEN_HEIGHT = 540
+import argparse
 
 
 def main():
-    game = Game(SCREEN_WIDTH, SCREEN_HEIGHT)
-    game.run()
+    parser = argparse.ArgumentParser(description="Play Bricks.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--record", metavar="FILE", help="Record the input of the session"
+    )
+    group.add_argument(
+        "--replay",
+        metavar="FILE",
+        help="Replay a recorded session as fast as possible",
+    )
+    group.add_argument(
+        "--bot",
+        action="store_true",
+        help="Watch the tree search bot play",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="CSV",
+        help="Show frame times of the subsystems and write them to CSV on "
+        "exit",
+    )
+    parser.add_argument(
+        "--hud-in-window",
+        action="store_true",
+        help="Show level, lifes and score in the window instead of the "
+        "title bar",
+    )
+    parser.add_argument(
+        "--fixed-point",
+        action="store_true",
+        help="Move the ball on a fixed-point grid for replays which give "
+        "the same result on every machine. Replays take the mode from "
+        "the recording",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust the difficulty to the player after each life",
+    )
+    parser.add_argument(
+        "--window-size",
+        metavar="WxH",
+        type=_window_size,
+        default=(SCREEN_WIDTH, SCREEN_HEIGHT),
+        help="Size of the window in pixels, defaults to %dx%d"
+        % (SCREEN_WIDTH, SCREEN_HEIGHT),
+    )
+    parser.add_argument(
+        "--resizable",
+        action="store_true",
+        help="Let the window be resized",
+    )
+    parser.add_argument(
+        "--render-scale",
+        type=float,
+        default=1.0,
+        help="Render at this fraction of the window size and scale up, "
+        "e.g. 0.5 on slow machines",
+    )
+    parser.add_argument(
+        "--gpu",
+        action="store_true",
+        help="Render with the hardware accelerated renderer of SDL2",
+    )
+    parser.add_argument(
+        "--bot-workers",
+        type=int,
+        default=1,
+        help="Number of processes the bot searches in",
+    )
+    args = parser.parse_args()
+
+    profiler = FrameProfiler() if args.profile else None
+    hud_mode = HudMode.IN_WINDOW if args.hud_in_window else HudMode.TITLE_BAR
+    screen_width, screen_height = args.window_size
+    if not MIN_RENDER_SCALE <= args.render_scale <= 1.0:
+        parser.error(
+            "--render-scale must be in range %s to 1.0" % MIN_RENDER_SCALE
+        )
+
+    if args.replay:
+        from bricks.input_recording import ReplayInputHandler
+        from bricks.input_recording import read_input_recording_from_file
+
+        recording = read_input_recording_from_file(args.replay)
+        game = Game(
+            screen_width,
+            screen_height,
+            input_handler=ReplayInputHandler(recording),
+            is_frame_limited=False,
+            start_level_idx=recording.start_level_idx,
+            difficulty_parameters=recording.difficulty_parameters,
+            difficulty_curves=recording.difficulty_curves,
+            profiler=profiler,
+            hud_mode=hud_mode,
+            is_fixed_point=recording.is_fixed_point,
+            is_resizable=args.resizable,
+            render_scale=args.render_scale,
+            is_hardware_accelerated=args.gpu,
+        )
+        _run(game, profiler, args.profile)
+    elif args.record:
+        from bricks.difficulty_curve import DIFFICULTY_FILENAME
+        from bricks.difficulty_curve import load_difficulty_curves
+        from bricks.input_recording import InputRecording
+        from bricks.input_recording import RecordingInputHandler
+        from bricks.input_recording import write_input_recording_to_file
+
+        difficulty_curves = load_difficulty_curves(DIFFICULTY_FILENAME)
+        input_handler = RecordingInputHandler(
+            InputRecording(
+                is_fixed_point=args.fixed_point,
+                difficulty_curves=difficulty_curves,
+            )
+        )
+        game = Game(
+            screen_width,
+            screen_height,
+            input_handler=input_handler,
+            difficulty_curves=difficulty_curves,
+            profiler=profiler,
+            hud_mode=hud_mode,
+            is_fixed_point=args.fixed_point,
+            is_resizable=args.resizable,
+            render_scale=args.render_scale,
+            is_hardware_accelerated=args.gpu,
+        )
+        try:
+            _run(game, profiler, args.profile)
+        finally:
+            write_input_recording_to_file(
+                input_handler.recording, args.record
+            )
+    elif args.bot:
+        from bricks.bot_input_handler import BotInputHandler
+        from bricks.level_pack import load_level_pack
+        from bricks.mcts_bot import MctsBot
+
+        bot = MctsBot(
+            load_level_pack(LEVEL_FOLDER),
+            is_fixed_point=args.fixed_point,
+            worker_count=args.bot_workers,
+            use_processes=True,
+        )
+        input_handler = BotInputHandler(bot)
+        game = Game(
+            screen_width,
+            screen_height,
+            input_handler=input_handler,
+            profiler=profiler,
+            hud_mode=hud_mode,
+            is_fixed_point=args.fixed_point,
+            is_resizable=args.resizable,
+            render_scale=args.render_scale,
+            is_hardware_accelerated=args.gpu,
+        )
+        input_handler.simulation = game.simulation
+        try:
+            _run(game, profiler, args.profile)
+        finally:
+            bot.close()
+    else:
+        input_handler = AnalogInputHandler()
+        game = Game(
+            screen_width,
+            screen_height,
+            input_handler=input_handler,
+            profiler=profiler,
+            hud_mode=hud_mode,
+            is_fixed_point=args.fixed_point,
+            is_difficulty_adaptive=args.adaptive,
+            is_resizable=args.resizable,
+            render_scale=args.render_scale,
+            is_hardware_accelerated=args.gpu,
+        )
+        _run(game, profiler, args.profile)
+        if profiler is not None:
+            print(input_handler.pump.latency_summary_line())
+            print(input_handler.pump.motion_latency_summary_line())
+
+
+def _window_size(text: str) -> Tuple[int, int]:
+    try:
+        width, height = (int(value) for value in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("Expected WxH, e.g. 1280x720")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError("Window size must be positive")
+    return width, height
+
+
+def _run(game: Game, profiler: Optional[FrameProfiler], csv_filename: str):
+    try:
+        game.run()
+    finally:
+        game.close()
+        if profiler is not None:
+            profiler.write_csv(csv_filename)
+            print("\n".join(profiler.summary_lines()))
 
 
 if __name__ == "__main__":
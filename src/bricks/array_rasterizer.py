@@ -0,0 +1,128 @@
+"""
+Module to paint a level into a small grayscale NumPy array.
+
+Meant for observation frames of agents where drawing with pygame is too
+slow. No pygame is needed.
+
+class ArrayRasterizer
+    Paints a level into a preallocated uint8 array.
+"""
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.game_object import GameObject
+from bricks.level import Level
+from bricks.pixel_scaling import PixelScaling
+
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy
+
+BACKGROUND_SHADE = 0
+WALL_SHADE = 96
+INDESTRUCTIBLE_BRICK_SHADE = 64
+PLATFORM_SHADE = 192
+BALL_SHADE = 255
+BRICK_SHADES = (0, 112, 122, 132, 142, 152, 162, 172, 182, 192)
+
+_Slices = Tuple[slice, slice]
+
+
+class ArrayRasterizer:
+    """
+    Paints a level into a preallocated uint8 array of shape
+    (height, width).
+
+    Walls and indestructible bricks never change during a level. They are
+    painted once into a background layer which is copied into the frame
+    before the other objects are painted on top. The pixel areas of the
+    bricks are cached as well, only their hitpoints are read each frame.
+
+    Bricks are shaded by their hitpoints. Every object covers at least one
+    pixel.
+
+    Attributes
+    ----------
+    width: int
+        Width of the frame in pixels.
+    height: int
+        Height of the frame in pixels.
+    frame: numpy.ndarray
+        Last painted frame. It is overwritten by the next call of render.
+
+    Methods
+    -------
+    render(self, level: Level) -> numpy.ndarray:
+        Paints the level into the frame.
+    """
+
+    def __init__(
+        self, width: int, height: int, grid_width: int, grid_height: int
+    ):
+        self._width = width
+        self._height = height
+        self._scaling = PixelScaling(width, height, grid_width, grid_height)
+        self._frame = numpy.zeros((height, width), dtype=numpy.uint8)
+        self._background = numpy.zeros((height, width), dtype=numpy.uint8)
+        self._background_level: Optional[Level] = None
+        self._brick_slices: List[Tuple[Brick, _Slices]] = []
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def frame(self) -> numpy.ndarray:
+        return self._frame
+
+    def render(self, level: Level) -> numpy.ndarray:
+        """
+        Paints the level into the frame and returns it.
+        The returned array is reused by the next call.
+        """
+        if level is not self._background_level:
+            self._prepare_level(level)
+
+        frame = self._frame
+        numpy.copyto(frame, self._background)
+        for brick, (rows, columns) in self._brick_slices:
+            hitpoints = brick.hitpoints
+            if hitpoints > 0:
+                frame[rows, columns] = BRICK_SHADES[hitpoints]
+        rows, columns = self._to_slices(level.platform)
+        frame[rows, columns] = PLATFORM_SHADE
+        for ball in level.balls:
+            rows, columns = self._to_slices(ball)
+            frame[rows, columns] = BALL_SHADE
+        return frame
+
+    def _prepare_level(self, level: Level):
+        background = self._background
+        background.fill(BACKGROUND_SHADE)
+        for wall in (level.left_wall, level.right_wall, level.top_wall):
+            rows, columns = self._to_slices(wall)
+            background[rows, columns] = WALL_SHADE
+        for indestructible_brick in level.indestructible_bricks:
+            rows, columns = self._to_slices(indestructible_brick)
+            background[rows, columns] = INDESTRUCTIBLE_BRICK_SHADE
+        self._brick_slices = [
+            (brick, self._to_slices(brick)) for brick in level.bricks
+        ]
+        self._background_level = level
+
+    def _to_slices(self, obj: GameObject) -> _Slices:
+        x, y, width, height = self._scaling.to_pixel_rect(obj)
+        x = _clamp(0, x, self._width - 1)
+        y = _clamp(0, y, self._height - 1)
+        return (
+            slice(y, y + max(height, 1)),
+            slice(x, x + max(width, 1)),
+        )
+
+
+def _clamp(minimum, x, maximum):
+    return max(minimum, min(x, maximum))
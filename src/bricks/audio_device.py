@@ -5,6 +5,9 @@ class AudioDevice
     Audio device needs to be constructed to play sounds.
     Use free standing functions to play sounds.
     Only one audio device should be created.
+    The device is opened on the main thread. Loading the sounds happens on
+    a background thread, so the game can open its window and load its
+    levels meanwhile.
 
 Functions:
     play_destroy_brick(audio_device: AudioDevice)
@@ -16,7 +19,11 @@ Functions:
     play_extra_life(audio_device: AudioDevice)
     play_win_game(audio_device: AudioDevice)
 """
+from typing import Dict
+from typing import Optional
+
 import pygame
+import threading
 
 FILENAME_DESTROY_BRICK = "sounds/destroyBrick.wav"
 FILENAME_HIT_BRICK = "sounds/hitBrick.wav"
@@ -28,15 +35,103 @@ FILENAME_EXTRA_LIFE = "sounds/extraLife.wav"
 FILENAME_WIN_GAME = "sounds/winGame.wav"
 
 
-class AudioDevice:
-    """AudioDevice to play sounds with freestanding functions."""
+SOUND_FILENAMES = (
+    FILENAME_DESTROY_BRICK,
+    FILENAME_HIT_BRICK,
+    FILENAME_HIT_PLATFORM,
+    FILENAME_GAME_OVER,
+    FILENAME_NEXT_LEVEL,
+    FILENAME_LOST_BALL,
+    FILENAME_EXTRA_LIFE,
+    FILENAME_WIN_GAME,
+)
 
-    def __init__(self):
-        pygame.mixer.init()
+
+class AudioDevice:
+    """
+    AudioDevice to play sounds with freestanding functions.
+
+    The mixer is initialised on the calling thread, because SDL expects
+    its subsystems to be initialised on the main thread. All sounds are
+    loaded on a background thread. Sounds which are played before that
+    finished are skipped. If the device cannot be opened or a sound cannot
+    be loaded the game runs without sound.
+
+    A silent device never opens the mixer and plays nothing.
+
+    Attributes
+    ----------
+    is_ready: bool
+        Indicates that the device is open and the sounds are loaded.
+    is_failed: bool
+        Indicates that the device could not be opened or the sounds could
+        not be loaded.
+
+    Methods
+    -------
+    wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        Waits until the device is ready or failed.
+    """
+
+    def __init__(self, is_silent: bool = False):
+        """
+        is_silent set to True plays no sound, e.g. when exporting replays.
+        """
+        self._sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._ready = threading.Event()
+        self._finished = threading.Event()
+        self._is_failed = False
+        if is_silent:
+            self._finished.set()
+            return
+        try:
+            pygame.mixer.init()
+        except pygame.error as error:
+            self._fail(error)
+            return
+        self._loader = threading.Thread(
+            target=self._load_sounds, name="audio-device", daemon=True
+        )
+        self._loader.start()
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    @property
+    def is_failed(self) -> bool:
+        return self._is_failed
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the device is ready, failed or timeout seconds passed.
+        Returns True if it is ready.
+        """
+        self._finished.wait(timeout)
+        return self._ready.is_set()
+
+    def _load_sounds(self):
+        try:
+            sounds = {
+                filename: pygame.mixer.Sound(filename)
+                for filename in SOUND_FILENAMES
+            }
+        except (pygame.error, IOError) as error:
+            self._fail(error)
+            return
+        self._sounds = sounds
+        self._ready.set()
+        self._finished.set()
+
+    def _fail(self, error: Exception):
+        print("Playing without sound: %s" % error)
+        self._is_failed = True
+        self._finished.set()
 
     def _play_sound(self, filename: str):
-        effect = pygame.mixer.Sound(filename)
-        effect.play()
+        if not self._ready.is_set():
+            return
+        self._sounds[filename].play()
 
 
 def play_destroy_brick(audio_device: AudioDevice):
@@ -0,0 +1,60 @@
+"""
+Module to let a bot play the game instead of the user.
+
+class BotInputHandler
+    InputHandler which takes the actions from a bot.
+"""
+from bricks.input_handler import InputHandler
+from bricks.mcts_bot import MctsBot
+from bricks.simulation import Action
+from bricks.simulation import Simulation
+
+from typing import Optional
+
+
+class BotInputHandler(InputHandler):
+    """
+    InputHandler which takes the actions from a bot.
+
+    Quit, escape and pause from pygame still work, so a watching user can
+    stop the bot.
+
+    Attributes
+    ----------
+    simulation: Simulation
+        Simulation the bot plays. Must be set before the first input is
+        handled.
+    """
+
+    _EVENT_BY_ACTION = {
+        Action.NONE: InputHandler._Event.none,
+        Action.LEFT: InputHandler._Event.left,
+        Action.RIGHT: InputHandler._Event.right,
+        Action.SPACE: InputHandler._Event.space,
+    }
+
+    def __init__(self, bot: MctsBot):
+        InputHandler.__init__(self)
+        self._bot = bot
+        self._simulation: Optional[Simulation] = None
+
+    @property
+    def simulation(self) -> Optional[Simulation]:
+        return self._simulation
+
+    @simulation.setter
+    def simulation(self, simulation: Simulation):
+        self._simulation = simulation
+
+    def _update_input_event(self):
+        InputHandler._update_input_event(self)
+        if self._input_event in (
+            self._Event.quit,
+            self._Event.escape,
+            self._Event.p,
+        ):
+            return
+        if self._is_paused:
+            return
+        action = self._bot.choose_action(self._simulation)
+        self._input_event = self._EVENT_BY_ACTION[action]
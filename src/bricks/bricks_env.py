@@ -0,0 +1,362 @@
+"""
+Reinforcement learning environments in the style of Gym.
+
+The environments step a Simulation directly. No window is opened and
+pygame is not imported.
+
+An observation is a dict with two NumPy arrays:
+    "state": float32 array of shape (STATE_SIZE,) with the ball position,
+        the ball velocity split in x and y, the platform position and 1.0
+        if the ball is active. Positions are top left corners in grid units.
+        The velocity is in grid units per second and includes the gravity
+        which pulls the ball down, so it is the velocity the ball moves
+        with.
+    "bricks": uint8 array of shape (grid_height, grid_width) with the
+        hitpoints of the brick covering each grid cell.
+
+The reward of a step is the score it made divided by
+POINTS_PER_BRICK_HITPOINTS, so a hitpoint is worth 1.0 on level 1.
+
+class BricksEnv
+    Environment of a single game session.
+
+class BricksVecEnv
+    Steps many environments with one call.
+"""
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.level import Level
+from bricks.level_pack import LevelPack
+from bricks.level_pack import load_level_pack
+from bricks.simulation import Action
+from bricks.simulation import POINTS_PER_BRICK_HITPOINTS
+from bricks.simulation import Simulation
+
+from math import cos
+from math import floor
+from math import sin
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy
+
+LEVEL_FOLDER = "level"
+
+STATE_SIZE = 6
+BALL_X = 0
+BALL_Y = 1
+BALL_VELOCITY_X = 2
+BALL_VELOCITY_Y = 3
+PLATFORM_X = 4
+IS_BALL_ACTIVE = 5
+
+ACTION_COUNT = len(Action)
+
+Observation = Dict[str, numpy.ndarray]
+
+
+class BricksEnv:
+    """
+    Environment of a single game session.
+
+    Actions are the values of Action: 0 none, 1 left, 2 right, 3 space.
+    A step advances the game by one frame. A cleared level continues with
+    the next level. The episode terminates on game over and is truncated
+    after max_frames frames.
+
+    Attributes
+    ----------
+    simulation: Simulation
+        Simulation which is stepped.
+    grid_shape: Tuple[int, int]
+        Shape of the brick grid of the observations. The largest grid of
+        all levels, smaller levels are padded with zeros.
+
+    Methods
+    -------
+    reset(self, seed: Optional[int] = None) -> Tuple[Observation, Dict]:
+        Starts a new episode.
+    step(self, action: int) -> Tuple[Observation, float, bool, bool, Dict]:
+        Plays one frame with action.
+    """
+
+    def __init__(
+        self,
+        level_pack: Optional[LevelPack] = None,
+        start_level_idx: int = 1,
+        difficulty_parameters: Optional[DifficultyParameters] = None,
+        is_fixed_point: bool = False,
+        max_frames: Optional[int] = None,
+    ):
+        """
+        level_pack defaults to the levels in the folder level.
+        max_frames set truncates episodes after that many frames.
+        """
+        if level_pack is None:
+            level_pack = load_level_pack(LEVEL_FOLDER)
+        self._simulation = Simulation(
+            level_pack,
+            start_level_idx=start_level_idx,
+            difficulty_parameters=difficulty_parameters,
+            is_fixed_point=is_fixed_point,
+        )
+        self._start_snapshot = self._simulation.snapshot()
+        self._grid_shape = _max_grid_shape(level_pack)
+        self._max_frames = max_frames
+        self._frame_count = 0
+        self._brick_cells_level: Optional[Level] = None
+        self._brick_cells = numpy.empty(0, dtype=numpy.intp)
+        self._brick_of_cells = numpy.empty(0, dtype=numpy.intp)
+
+    @property
+    def simulation(self) -> Simulation:
+        return self._simulation
+
+    @property
+    def grid_shape(self) -> Tuple[int, int]:
+        return self._grid_shape
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[Observation, Dict]:
+        """
+        Starts a new episode.
+        The game is deterministic, seed is only accepted for compatibility.
+        """
+        state = numpy.empty(STATE_SIZE, dtype=numpy.float32)
+        bricks = numpy.empty(self._grid_shape, dtype=numpy.uint8)
+        info = self._reset_into(state, bricks)
+        return {"state": state, "bricks": bricks}, info
+
+    def step(
+        self, action: int
+    ) -> Tuple[Observation, float, bool, bool, Dict]:
+        """
+        Plays one frame with action.
+        Returns observation, reward, terminated, truncated and info.
+        """
+        state = numpy.empty(STATE_SIZE, dtype=numpy.float32)
+        bricks = numpy.empty(self._grid_shape, dtype=numpy.uint8)
+        reward, is_terminated, is_truncated, info = self._step_into(
+            action, state, bricks
+        )
+        observation = {"state": state, "bricks": bricks}
+        return observation, reward, is_terminated, is_truncated, info
+
+    def _reset_into(self, state: numpy.ndarray, bricks: numpy.ndarray) -> Dict:
+        self._simulation.restore(self._start_snapshot)
+        self._simulation.event_queue.drain()
+        self._frame_count = 0
+        self._write_observation(state, bricks)
+        return self._info()
+
+    def _step_into(
+        self, action: int, state: numpy.ndarray, bricks: numpy.ndarray
+    ) -> Tuple[float, bool, bool, Dict]:
+        simulation = self._simulation
+        score = simulation.score
+        simulation.step(Action(action))
+        if simulation.is_level_cleared:
+            simulation.start_next_level()
+        simulation.event_queue.drain()
+        self._frame_count += 1
+
+        reward = (simulation.score - score) / POINTS_PER_BRICK_HITPOINTS
+        is_terminated = simulation.is_game_over
+        is_truncated = (
+            self._max_frames is not None
+            and self._frame_count >= self._max_frames
+        )
+        self._write_observation(state, bricks)
+        return reward, is_terminated, is_truncated, self._info()
+
+    def _info(self) -> Dict:
+        simulation = self._simulation
+        return {
+            "score": simulation.score,
+            "lifes": simulation.lifes,
+            "level_idx": simulation.level_idx,
+        }
+
+    def _write_observation(self, state: numpy.ndarray, bricks: numpy.ndarray):
+        level = self._simulation.level
+        platform = level.platform
+        state[PLATFORM_X] = platform.top_left.x
+        if level.balls:
+            ball = level.balls[0]
+            angle = ball.angle.value
+            state[BALL_X] = ball.top_left.x
+            state[BALL_Y] = ball.top_left.y
+            state[BALL_VELOCITY_X] = ball.velocity * cos(angle)
+            state[BALL_VELOCITY_Y] = (
+                ball.velocity * sin(angle) + ball.gravity
+            )
+            state[IS_BALL_ACTIVE] = 1.0 if ball.is_active else 0.0
+        else:
+            state[BALL_X : PLATFORM_X] = 0.0
+            state[IS_BALL_ACTIVE] = 0.0
+
+        if level is not self._brick_cells_level:
+            self._update_brick_cells(level)
+        hitpoints = numpy.fromiter(
+            (brick.hitpoints for brick in level.bricks),
+            dtype=numpy.uint8,
+            count=len(level.bricks),
+        )
+        bricks.fill(0)
+        bricks.ravel()[self._brick_cells] = hitpoints[self._brick_of_cells]
+
+    def _update_brick_cells(self, level: Level):
+        """Flat indices of the grid cells covered by each brick."""
+        height, width = self._grid_shape
+        cells: List[int] = []
+        brick_of_cells: List[int] = []
+        for idx, brick in enumerate(level.bricks):
+            for y in _covered_cells(brick.top_left.y, brick.height, height):
+                for x in _covered_cells(brick.top_left.x, brick.width, width):
+                    cells.append(y * width + x)
+                    brick_of_cells.append(idx)
+        self._brick_cells = numpy.array(cells, dtype=numpy.intp)
+        self._brick_of_cells = numpy.array(brick_of_cells, dtype=numpy.intp)
+        self._brick_cells_level = level
+
+
+class BricksVecEnv:
+    """
+    Steps many environments with one call.
+
+    Observations, rewards and flags of all environments are written into
+    batched arrays with the environment index as first axis. The arrays are
+    reused by the next call, copy them to keep them.
+
+    An environment which terminated or got truncated is reset right away.
+    Its observation is the first one of the new episode, the info of the
+    finished episode is returned. Like in Gymnasium the last observation
+    of the finished episode is a copy in info["final_observation"], e.g.
+    to bootstrap on truncation.
+
+    Attributes
+    ----------
+    env_count: int
+        Number of environments.
+    envs: List[BricksEnv]
+        The environments.
+
+    Methods
+    -------
+    reset(self) -> Tuple[Observation, List[Dict]]:
+        Starts a new episode in all environments.
+    step(self, actions: Sequence[int]) -> Tuple[Observation, numpy.ndarray,
+        numpy.ndarray, numpy.ndarray, List[Dict]]:
+        Plays one frame in every environment.
+    """
+
+    def __init__(
+        self,
+        env_count: int,
+        level_pack: Optional[LevelPack] = None,
+        start_level_idx: int = 1,
+        difficulty_parameters: Optional[DifficultyParameters] = None,
+        is_fixed_point: bool = False,
+        max_frames: Optional[int] = None,
+    ):
+        """
+        The level pack is loaded once and shared by all environments.
+        Raises ValueError if env_count is not positive.
+        """
+        if env_count < 1:
+            raise ValueError("env_count must be at least 1")
+        if level_pack is None:
+            level_pack = load_level_pack(LEVEL_FOLDER)
+        self._envs = [
+            BricksEnv(
+                level_pack,
+                start_level_idx=start_level_idx,
+                difficulty_parameters=difficulty_parameters,
+                is_fixed_point=is_fixed_point,
+                max_frames=max_frames,
+            )
+            for _ in range(env_count)
+        ]
+        grid_shape = self._envs[0].grid_shape
+        self._states = numpy.zeros((env_count, STATE_SIZE), numpy.float32)
+        self._bricks = numpy.zeros((env_count,) + grid_shape, numpy.uint8)
+        self._rewards = numpy.zeros(env_count, dtype=numpy.float32)
+        self._terminated = numpy.zeros(env_count, dtype=bool)
+        self._truncated = numpy.zeros(env_count, dtype=bool)
+
+    @property
+    def env_count(self) -> int:
+        return len(self._envs)
+
+    @property
+    def envs(self) -> List[BricksEnv]:
+        return self._envs
+
+    def reset(self) -> Tuple[Observation, List[Dict]]:
+        """Starts a new episode in all environments."""
+        infos = [
+            env._reset_into(self._states[idx], self._bricks[idx])
+            for idx, env in enumerate(self._envs)
+        ]
+        return self._observation(), infos
+
+    def step(
+        self, actions: Sequence[int]
+    ) -> Tuple[
+        Observation, numpy.ndarray, numpy.ndarray, numpy.ndarray, List[Dict]
+    ]:
+        """
+        Plays one frame in every environment.
+        Returns observations, rewards, terminated, truncated and infos.
+
+        Raises ValueError if there is not one action per environment.
+        """
+        if len(actions) != len(self._envs):
+            raise ValueError(
+                "Expected %d actions, got %d" % (len(self._envs), len(actions))
+            )
+        infos = []
+        for idx, env in enumerate(self._envs):
+            state = self._states[idx]
+            bricks = self._bricks[idx]
+            reward, is_terminated, is_truncated, info = env._step_into(
+                int(actions[idx]), state, bricks
+            )
+            if is_terminated or is_truncated:
+                info["final_observation"] = {
+                    "state": state.copy(),
+                    "bricks": bricks.copy(),
+                }
+                env._reset_into(state, bricks)
+            self._rewards[idx] = reward
+            self._terminated[idx] = is_terminated
+            self._truncated[idx] = is_truncated
+            infos.append(info)
+        return (
+            self._observation(),
+            self._rewards,
+            self._terminated,
+            self._truncated,
+            infos,
+        )
+
+    def _observation(self) -> Observation:
+        return {"state": self._states, "bricks": self._bricks}
+
+
+def _covered_cells(start: float, size: float, limit: int) -> range:
+    first = max(0, int(floor(start)))
+    last = min(limit, int(floor(start + size - 1e-9)) + 1)
+    return range(first, max(first, last))
+
+
+def _max_grid_shape(level_pack: LevelPack) -> Tuple[int, int]:
+    levels = [
+        level_pack.make_level(level_idx)
+        for level_idx in range(1, len(level_pack) + 1)
+    ]
+    return (
+        max(level.grid_height for level in levels),
+        max(level.grid_width for level in levels),
+    )
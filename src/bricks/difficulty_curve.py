@@ -0,0 +1,229 @@
+"""
+Difficulty of every level and tier described by curves.
+
+Each difficulty parameter follows a linear curve which starts at a value
+on level 1 of tier 0 and changes per level and per loop through all
+levels. The curves are read from a JSON file like:
+
+    {
+        "tier_count": 8,
+        "platform_velocity": {"start": 16.0, "per_loop": 2.0, "max": 28.0},
+        "platform_width": {"start": 4.0, "per_loop": -0.5, "min": 2.0},
+        "ball_velocity": {"start": 16.0, "per_loop": 2.0, "max": 30.0},
+        "ball_gravity": {"start": 1.5, "per_loop": 0.5, "max": 5.0}
+    }
+
+Missing parameters and entries keep the values of DEFAULT_CURVES. Tiers
+after the last one repeat it.
+
+class Curve
+    Linear curve of one difficulty parameter.
+
+class DifficultyCurves
+    Curves of all difficulty parameters.
+
+class DifficultyTable
+    Precomputed difficulty of every level in every tier.
+
+function load_difficulty_curves(filename: str = DIFFICULTY_FILENAME)
+    -> DifficultyCurves:
+    Loads the difficulty curves the game plays with.
+
+function read_difficulty_curves_from_json_file(filename: str)
+    -> DifficultyCurves:
+    Loads difficulty curves from a JSON file.
+
+function read_difficulty_curves_from_json_data(data: Dict)
+    -> DifficultyCurves:
+    Makes difficulty curves from already parsed JSON data.
+"""
+from bricks.difficulty_parameters import DifficultyParameters
+
+from typing import Dict
+from typing import NamedTuple
+from typing import Tuple
+
+import json
+import os
+
+DIFFICULTY_FILENAME = "difficulty.json"
+
+PARAMETER_NAMES = (
+    "platform_velocity",
+    "platform_width",
+    "ball_velocity",
+    "ball_gravity",
+)
+CURVE_KEYS = ("start", "per_level", "per_loop", "min", "max")
+
+
+class Curve(NamedTuple):
+    start: float
+    per_level: float = 0.0
+    per_loop: float = 0.0
+    minimum: float = float("-inf")
+    maximum: float = float("inf")
+
+    def value(self, tier: int, level_idx: int) -> float:
+        """Value on level level_idx, counted from 1, of tier."""
+        value = (
+            self.start
+            + self.per_level * (level_idx - 1)
+            + self.per_loop * tier
+        )
+        return max(self.minimum, min(value, self.maximum))
+
+
+class DifficultyCurves(NamedTuple):
+    tier_count: int
+    platform_velocity: Curve
+    platform_width: Curve
+    ball_velocity: Curve
+    ball_gravity: Curve
+
+
+DEFAULT_CURVES = DifficultyCurves(
+    tier_count=8,
+    platform_velocity=Curve(start=16.0, per_loop=2.0, maximum=28.0),
+    platform_width=Curve(start=4.0, per_loop=-0.5, minimum=2.0),
+    ball_velocity=Curve(start=16.0, per_loop=2.0, maximum=30.0),
+    ball_gravity=Curve(start=1.5, per_loop=0.5, maximum=5.0),
+)
+
+
+class DifficultyTable:
+    """
+    Precomputed difficulty of every level in every tier.
+
+    The values are stored in nested tuples and cannot be changed. Every
+    lookup returns new DifficultyParameters, so changing them does not
+    change the table.
+
+    Attributes
+    ----------
+    tier_count: int
+        Number of tiers with own values.
+    level_count: int
+        Number of levels per tier.
+
+    Methods
+    -------
+    parameters(self, tier: int, level_idx: int) -> DifficultyParameters:
+        Difficulty of level level_idx in tier.
+    """
+
+    def __init__(self, curves: DifficultyCurves, level_count: int):
+        """Raises ValueError if level_count is not positive."""
+        if level_count < 1:
+            raise ValueError("level_count must be at least 1")
+        self._level_count = level_count
+        self._values: Tuple[Tuple[Tuple[float, ...], ...], ...] = tuple(
+            tuple(
+                tuple(
+                    getattr(curves, name).value(tier, level_idx)
+                    for name in PARAMETER_NAMES
+                )
+                for level_idx in range(1, level_count + 1)
+            )
+            for tier in range(curves.tier_count)
+        )
+
+    @property
+    def tier_count(self) -> int:
+        return len(self._values)
+
+    @property
+    def level_count(self) -> int:
+        return self._level_count
+
+    def parameters(self, tier: int, level_idx: int) -> DifficultyParameters:
+        """
+        Difficulty of level level_idx, counted from 1, in tier.
+        Tiers after the last one and levels after the last one repeat the
+        last one.
+        """
+        tier = max(0, min(tier, len(self._values) - 1))
+        level_idx = max(1, min(level_idx, self._level_count))
+        values = self._values[tier][level_idx - 1]
+        return DifficultyParameters(**dict(zip(PARAMETER_NAMES, values)))
+
+
+def load_difficulty_curves(
+    filename: str = DIFFICULTY_FILENAME,
+) -> DifficultyCurves:
+    """
+    Loads the difficulty curves the game plays with.
+    Returns DEFAULT_CURVES if the file does not exist.
+
+    Raises ValueError if the file has invalid values.
+    Raises IOError if file exists but cannot be opened.
+    """
+    if not os.path.exists(filename):
+        return DEFAULT_CURVES
+    try:
+        return read_difficulty_curves_from_json_file(filename)
+    except ValueError as error:
+        raise ValueError(
+            "Invalid difficulty file %s: %s" % (filename, error)
+        ) from error
+
+
+def read_difficulty_curves_from_json_file(filename: str) -> DifficultyCurves:
+    """
+    Loads difficulty curves from a JSON file.
+
+    Raises ValueError if the file is no valid JSON or has invalid values.
+    Raises IOError if file cannot be opened.
+    """
+    with open(filename) as file:
+        data = json.load(file)
+    return read_difficulty_curves_from_json_data(data)
+
+
+def read_difficulty_curves_from_json_data(data: Dict) -> DifficultyCurves:
+    """
+    Makes difficulty curves from already parsed JSON data.
+
+    Raises ValueError if entries are unknown or have invalid values.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Difficulty curves must be a JSON object")
+    unknown_keys = set(data) - set(PARAMETER_NAMES) - {"tier_count"}
+    if unknown_keys:
+        raise ValueError(
+            "Unknown difficulty entries: %s" % ", ".join(sorted(unknown_keys))
+        )
+    tier_count = data.get("tier_count", DEFAULT_CURVES.tier_count)
+    if not isinstance(tier_count, int) or tier_count < 1:
+        raise ValueError("tier_count must be an integer of at least 1")
+    curves = {
+        name: _read_curve(
+            name, data.get(name, {}), getattr(DEFAULT_CURVES, name)
+        )
+        for name in PARAMETER_NAMES
+    }
+    return DifficultyCurves(tier_count=tier_count, **curves)
+
+
+def _read_curve(name: str, data: Dict, default: Curve) -> Curve:
+    if not isinstance(data, dict):
+        raise ValueError("%s must be a JSON object" % name)
+    unknown_keys = set(data) - set(CURVE_KEYS)
+    if unknown_keys:
+        raise ValueError(
+            "Unknown entries in %s: %s"
+            % (name, ", ".join(sorted(unknown_keys)))
+        )
+    for key, value in data.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("%s.%s must be a number" % (name, key))
+    curve = Curve(
+        start=float(data.get("start", default.start)),
+        per_level=float(data.get("per_level", default.per_level)),
+        per_loop=float(data.get("per_loop", default.per_loop)),
+        minimum=float(data.get("min", default.minimum)),
+        maximum=float(data.get("max", default.maximum)),
+    )
+    if curve.minimum > curve.maximum:
+        raise ValueError("%s.min must not be greater than max" % name)
+    return curve
@@ -47,7 +47,7 @@ class DifficultyParameters:
 
     @property
     def ball_velocity(self) -> float:
-        return self._platform_velocity
+        return self._ball_velocity
 
     @ball_velocity.setter
     def ball_velocity(self, ball_velocity: float):
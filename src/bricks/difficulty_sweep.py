@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Tool to measure how long games last in each difficulty tier.
+
+Games are played headless by a player which follows the lowest ball, but
+only decides every few frames like a human with a reaction time. Each
+game starts on level 1 of a tier and ends with game over or after a
+maximum time.
+
+class TierResult
+    Averages of the games played in one tier.
+
+class ReactionPlayer
+    Follows the lowest ball, but only decides every few frames.
+
+function sweep_tiers(level_pack: LevelPack, curves: DifficultyCurves,
+    game_count: int, max_frames: int, seed: int = 0,
+    is_fixed_point: bool = True) -> List[TierResult]:
+    Plays game_count games in every tier of the curves.
+
+function play_game(simulation: Simulation, max_frames: int,
+    player: ReactionPlayer) -> Tuple[int, int]:
+    Plays a game until game over or max_frames.
+"""
+from bricks.difficulty_curve import DIFFICULTY_FILENAME
+from bricks.difficulty_curve import DifficultyCurves
+from bricks.difficulty_curve import load_difficulty_curves
+from bricks.difficulty_curve import read_difficulty_curves_from_json_file
+from bricks.level_pack import LevelPack
+from bricks.level_pack import load_level_pack
+from bricks.mcts_bot import tracking_action
+from bricks.simulation import Action
+from bricks.simulation import FRAMES_PER_SECOND
+from bricks.simulation import Simulation
+
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+import argparse
+import random
+
+LEVEL_FOLDER = "level"
+
+REACTION_FRAMES_MIN = 4
+REACTION_FRAMES_MAX = 12
+
+
+class TierResult(NamedTuple):
+    tier: int
+    game_count: int
+    average_seconds: float
+    average_score: float
+    average_levels_cleared: float
+    capped_count: int
+
+
+class ReactionPlayer:
+    """
+    Follows the lowest ball, but only decides every few frames.
+
+    The frames until the next decision are drawn between
+    reaction_frames_min and reaction_frames_max, so a higher reaction time
+    makes a weaker player. The balls are started right away.
+
+    Methods
+    -------
+    action(self, simulation: Simulation) -> Action:
+        Action of the next frame.
+    """
+
+    def __init__(
+        self,
+        rng: random.Random,
+        reaction_frames_min: int = REACTION_FRAMES_MIN,
+        reaction_frames_max: int = REACTION_FRAMES_MAX,
+    ):
+        """Raises ValueError if the reaction frames are no valid range."""
+        if not 1 <= reaction_frames_min <= reaction_frames_max:
+            raise ValueError("Reaction frames must be a range from 1 up")
+        self._rng = rng
+        self._reaction_frames_min = reaction_frames_min
+        self._reaction_frames_max = reaction_frames_max
+        self._action = Action.NONE
+        self._frames_until_decision = 0
+
+    def action(self, simulation: Simulation) -> Action:
+        """Action of the next frame."""
+        if self._frames_until_decision <= 0:
+            self._action = _decide(simulation)
+            self._frames_until_decision = self._rng.randint(
+                self._reaction_frames_min, self._reaction_frames_max
+            )
+        self._frames_until_decision -= 1
+        return self._action
+
+
+def sweep_tiers(
+    level_pack: LevelPack,
+    curves: DifficultyCurves,
+    game_count: int,
+    max_frames: int,
+    seed: int = 0,
+    is_fixed_point: bool = True,
+) -> List[TierResult]:
+    """
+    Plays game_count games in every tier of the curves.
+    The same seeds are used in every tier.
+
+    Raises ValueError if game_count or max_frames is not positive.
+    """
+    if game_count < 1 or max_frames < 1:
+        raise ValueError("game_count and max_frames must be at least 1")
+    results = []
+    for tier in range(curves.tier_count):
+        frames = []
+        scores = []
+        levels_cleared = []
+        for game_idx in range(game_count):
+            simulation = Simulation(
+                level_pack,
+                is_fixed_point=is_fixed_point,
+                difficulty_curves=curves,
+                start_difficulty_tier=tier,
+            )
+            rng = random.Random(seed * game_count + game_idx)
+            player = ReactionPlayer(rng)
+            frame_count, level_count = play_game(
+                simulation, max_frames, player
+            )
+            frames.append(frame_count)
+            scores.append(simulation.score)
+            levels_cleared.append(level_count)
+        results.append(
+            TierResult(
+                tier=tier,
+                game_count=game_count,
+                average_seconds=sum(frames)
+                / game_count
+                / FRAMES_PER_SECOND,
+                average_score=sum(scores) / game_count,
+                average_levels_cleared=sum(levels_cleared) / game_count,
+                capped_count=sum(1 for count in frames if count >= max_frames),
+            )
+        )
+    return results
+
+
+def play_game(
+    simulation: Simulation, max_frames: int, player: ReactionPlayer
+) -> Tuple[int, int]:
+    """
+    Plays a game until game over or max_frames.
+    Returns the number of played frames and cleared levels.
+    """
+    level_count = 0
+    for frame_idx in range(max_frames):
+        simulation.step(player.action(simulation))
+        simulation.event_queue.drain()
+        if simulation.is_game_over:
+            return frame_idx + 1, level_count
+        if simulation.is_level_cleared:
+            level_count += 1
+            simulation.start_next_level()
+            simulation.event_queue.drain()
+    return max_frames, level_count
+
+
+def _decide(simulation: Simulation) -> Action:
+    if not any(ball.is_active for ball in simulation.level.balls):
+        return Action.SPACE
+    return tracking_action(simulation)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the average game length in each difficulty "
+        "tier with headless games."
+    )
+    parser.add_argument(
+        "--curves",
+        metavar="FILE",
+        help="JSON file with difficulty curves, defaults to %s like in "
+        "the game or the built in curves if it does not exist"
+        % DIFFICULTY_FILENAME,
+    )
+    parser.add_argument(
+        "--games", type=int, default=8, help="Games per tier"
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=300.0,
+        help="Game time after which a game is stopped",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    if args.curves:
+        curves = read_difficulty_curves_from_json_file(args.curves)
+    else:
+        curves = load_difficulty_curves(DIFFICULTY_FILENAME)
+    results = sweep_tiers(
+        load_level_pack(LEVEL_FOLDER),
+        curves,
+        game_count=args.games,
+        max_frames=int(args.max_seconds * FRAMES_PER_SECOND),
+        seed=args.seed,
+    )
+    print(
+        "%4s %10s %10s %8s %7s"
+        % ("tier", "seconds", "score", "levels", "capped")
+    )
+    for result in results:
+        print(
+            "%4d %10.1f %10.0f %8.2f %7d"
+            % (
+                result.tier,
+                result.average_seconds,
+                result.average_score,
+                result.average_levels_cleared,
+                result.capped_count,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
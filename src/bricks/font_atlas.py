@@ -0,0 +1,53 @@
+"""Pre-rendered glyphs of a font to draw text without rendering the font."""
+from typing import Dict
+from typing import Tuple
+
+import pygame
+
+DEFAULT_CHARACTERS = (
+    " 0123456789:.-/%"
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+
+class FontAtlas:
+    """
+    Pre-rendered glyphs of a font to draw text without rendering the font.
+
+    All glyphs get rendered once on construction. Composing a text only
+    blits the cached glyphs. Characters which are not in the atlas are
+    skipped.
+
+    Methods
+    -------
+    render(self, text: str) -> pygame.Surface:
+        Composes the text from the cached glyphs.
+    """
+
+    def __init__(
+        self,
+        font_size: int,
+        color: Tuple[int, int, int],
+        characters: str = DEFAULT_CHARACTERS,
+    ):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(None, font_size)
+        self._height = font.get_height()
+        self._glyphs: Dict[str, pygame.Surface] = {
+            character: font.render(character, True, color)
+            for character in characters
+        }
+
+    def render(self, text: str) -> pygame.Surface:
+        """Composes the text from the cached glyphs."""
+        glyphs = [self._glyphs[c] for c in text if c in self._glyphs]
+        width = sum(glyph.get_width() for glyph in glyphs)
+        surface = pygame.Surface(
+            (max(width, 1), self._height), pygame.SRCALPHA
+        )
+        x = 0
+        for glyph in glyphs:
+            surface.blit(glyph, (x, 0))
+            x += glyph.get_width()
+        return surface
@@ -0,0 +1,161 @@
+"""
+Module to measure how long the subsystems of the game take per frame.
+
+class FrameProfiler
+    Times sections of each frame and keeps the last frames in a ring buffer.
+
+class NullFrameProfiler
+    Profiler with the same interface which does nothing.
+"""
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from time import perf_counter
+
+import numpy
+
+SECTIONS = ("render", "input", "ball", "collision", "events")
+TOTAL = "total"
+PERCENTILES = (50, 95, 99)
+
+
+class FrameProfiler:
+    """
+    Times sections of each frame and keeps the last frames in a ring buffer.
+
+    Time spent in a section is summed up if the section is started several
+    times in one frame. The total time of the frame is recorded as well.
+
+    Attributes
+    ----------
+    sections: Tuple[str, ...]
+        Names of the measured sections.
+    frame_count: int
+        Number of frames currently held in the ring buffer.
+    total_frame_count: int
+        Number of frames measured since construction. Keeps growing after
+        the ring buffer is full.
+
+    Methods
+    -------
+    begin_frame(self):
+        Starts measuring a new frame.
+    start(self, section: str):
+        Starts measuring a section.
+    stop(self, section: str):
+        Stops measuring a section.
+    end_frame(self):
+        Stores the measurements of the frame in the ring buffer.
+    percentiles(self) -> Dict[str, Tuple[float, float, float]]:
+        p50, p95 and p99 in ms of each section and the total frame.
+    summary_lines(self) -> List[str]:
+        Percentiles formatted for display.
+    write_csv(self, filename: str):
+        Writes all frames in the ring buffer to a CSV file.
+    """
+
+    def __init__(
+        self, sections: Sequence[str] = SECTIONS, capacity: int = 3600
+    ):
+        self._sections = tuple(sections)
+        self._columns = {
+            name: idx for idx, name in enumerate(self._sections)
+        }
+        self._samples = numpy.zeros((capacity, len(self._sections) + 1))
+        self._current = numpy.zeros(len(self._sections) + 1)
+        self._started: Dict[str, float] = {}
+        self._frame_start = 0.0
+        self._next_idx = 0
+        self._frame_count = 0
+        self._total_frame_count = 0
+
+    @property
+    def sections(self) -> Tuple[str, ...]:
+        return self._sections
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def total_frame_count(self) -> int:
+        return self._total_frame_count
+
+    def begin_frame(self):
+        """Starts measuring a new frame."""
+        self._current.fill(0.0)
+        self._frame_start = perf_counter()
+
+    def start(self, section: str):
+        """Starts measuring a section."""
+        self._started[section] = perf_counter()
+
+    def stop(self, section: str):
+        """Stops measuring a section."""
+        elapsed = perf_counter() - self._started[section]
+        self._current[self._columns[section]] += elapsed
+
+    def end_frame(self):
+        """Stores the measurements of the frame in the ring buffer."""
+        self._current[-1] = perf_counter() - self._frame_start
+        self._samples[self._next_idx] = self._current
+        self._next_idx = (self._next_idx + 1) % len(self._samples)
+        self._frame_count = min(self._frame_count + 1, len(self._samples))
+        self._total_frame_count += 1
+
+    def percentiles(self) -> Dict[str, Tuple[float, float, float]]:
+        """p50, p95 and p99 in ms of each section and the total frame."""
+        if self._frame_count == 0:
+            return {}
+        values = numpy.percentile(
+            self._samples[: self._frame_count] * 1000.0, PERCENTILES, axis=0
+        )
+        return {
+            name: tuple(values[:, idx])
+            for idx, name in enumerate(self._sections + (TOTAL,))
+        }
+
+    def summary_lines(self) -> List[str]:
+        """Percentiles formatted for display."""
+        lines = ["%-10s %6s %6s %6s" % ("ms", "p50", "p95", "p99")]
+        for name, (p50, p95, p99) in self.percentiles().items():
+            lines.append("%-10s %6.2f %6.2f %6.2f" % (name, p50, p95, p99))
+        return lines
+
+    def write_csv(self, filename: str):
+        """
+        Writes all frames in the ring buffer to a CSV file.
+        Oldest frame first. Times are in ms.
+
+        Raises IOError if file cannot be opened.
+        """
+        if self._frame_count < len(self._samples):
+            samples = self._samples[: self._frame_count]
+        else:
+            samples = numpy.roll(self._samples, -self._next_idx, axis=0)
+        numpy.savetxt(
+            filename,
+            samples * 1000.0,
+            fmt="%.4f",
+            delimiter=",",
+            header=",".join(self._sections + (TOTAL,)),
+            comments="",
+        )
+
+
+class NullFrameProfiler:
+    """Profiler with the interface of FrameProfiler which does nothing."""
+
+    def begin_frame(self):
+        pass
+
+    def start(self, section: str):
+        pass
+
+    def stop(self, section: str):
+        pass
+
+    def end_frame(self):
+        pass
@@ -1,25 +1,18 @@
 """Module to represent the main game logic."""
 
-from bricks.game_objects.ball import Ball
-from bricks.game_objects.brick import Brick
-from bricks.game_objects.game_object import GameObject
-from bricks.game_objects.indestructible_brick import IndestructibleBrick
-from bricks.game_objects.physics import reflect_from_game_objects
-from bricks.game_objects.physics import reflect_from_platform
-from bricks.game_objects.platform import Platform
-from bricks.game_objects.wall import Wall
-
-from bricks.audio_device import AudioDevice
-from bricks.audio_device import play_destroy_brick
-from bricks.audio_device import play_hit_brick
-from bricks.audio_device import play_hit_platform
-from bricks.audio_device import play_game_over
-from bricks.audio_device import play_next_level
-from bricks.audio_device import play_lost_ball
-from bricks.audio_device import play_extra_life
-from bricks.audio_device import play_win_game
-
-from bricks.level import Level, read_level_from_json_file
+from bricks.game_events import (
+    AllLevelsCleared,
+    BallLost,
+    BrickDestroyed,
+    BrickHit,
+    ExtraLife,
+    GameOver,
+    LevelCleared,
+    LevelStarted,
+    PlatformHit,
+)
+
+from bricks.level_pack import LevelPack, load_level_pack
 from bricks.audio_device import (
     AudioDevice,
     play_destroy_brick,
@@ -33,73 +26,214 @@ from bricks.audio_device import (
 )
 from bricks.renderer import Renderer
 from bricks.input_handler import InputHandler
+from bricks.difficulty_curve import DIFFICULTY_FILENAME
+from bricks.difficulty_curve import DifficultyCurves
+from bricks.difficulty_curve import load_difficulty_curves
 from bricks.difficulty_parameters import DifficultyParameters
-
-from typing import List
+from bricks.frame_profiler import FrameProfiler, NullFrameProfiler
+from bricks.hud import Hud, HudMode
+from bricks.highscore_table import HighscoreTable
+from bricks.highscore_table import HIGHSCORE_FILENAME
+from bricks.highscore_table import default_data_dir
+from bricks.highscore_table import highscore_key
+from bricks.simulation import FRAMES_PER_SECOND
+from bricks.simulation import MS_PER_FRAME
+from bricks.simulation import Simulation
+
+from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
 from time import sleep
 
-import json
-import pathlib
+import os
 from time import time
 
-FRAMES_PER_SECOND = 60
-MS_PER_FRAME = 1000 / FRAMES_PER_SECOND
-
-POINTS_PER_BRICK_HITPOINTS = 100
-POINTS_FOR_EXTRA_LIVE = 10000
+if TYPE_CHECKING:
+    from bricks.adaptive_difficulty import AdaptiveDifficultyController
 
-HIGHSCORE_FILENAME = "highscore.dat"
+LEVEL_FOLDER = "level"
 
-BALL_VELOCITY_INCREASE = 2.0
-BALL_GRAVITY_INCREASE = 0.5
-PLATFORM_VELOCITY_INCREASE = 2.0
-PLATFORM_WIDTH_DECREASE = 0.5
+SCREEN_WIDTH = 780
+SCREEN_HEIGHT = 540
 
-BALL_VELOCITY_MAX = 30.0
-BALL_GRAVITY_MAX = 5.0
-PLATFORM_VELOCITY_MAX = 28.0
-PLATFORM_WIDTH_MIN = 2.0
+PROFILER_OVERLAY_INTERVAL = 30
+INPUT_POLL_INTERVAL_IN_MS = 1.0
 
-START_LIFES = 5
+SOUNDS_BY_EVENT_TYPE = (
+    (BrickHit, play_hit_brick),
+    (BrickDestroyed, play_destroy_brick),
+    (PlatformHit, play_hit_platform),
+    (BallLost, play_lost_ball),
+    (ExtraLife, play_extra_life),
+    (LevelCleared, play_next_level),
+    (AllLevelsCleared, play_win_game),
+    (GameOver, play_game_over),
+)
 
 
 class Game:
     """
     Class to represent the main game logic.
 
-    On construction current highscore is loaded from file.
-    On construction the first level is loaded from file.
+    On construction the audio device is opened unless one is given.
+    On construction the highscores are loaded from file.
+    On construction the levels are loaded from file unless a level pack
+    is given.
+    On construction the difficulty curves are loaded from file if it
+    exists and none are given.
+
+    Attributes
+    ----------
+    simulation: Simulation
+        Level, score, lifes and difficulty of the session.
 
     Methods
     -------
     run(self):
         Method starts the game with the first level.
         Runs until the user quits the game.
+    close(self):
+        Waits until pending highscores are written.
     """
 
-    def __init__(self, screen_width: int, screen_height: int):
-        self._audio_device = AudioDevice()
-        self._input_handler = InputHandler()
-        self._level_filenames = _get_level_filenames_from_folder("level")
-        self._level = _load_level(self._level_filenames, 1)
-        self._difficulty_parameters = DifficultyParameters()
-        self._renderer = Renderer(
-            screen_width=screen_width,
-            screen_height=screen_height,
-            grid_width=self._level.grid_width,
-            grid_height=self._level.grid_height,
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        input_handler: Optional[InputHandler] = None,
+        is_frame_limited: bool = True,
+        start_level_idx: int = 1,
+        difficulty_parameters: Optional[DifficultyParameters] = None,
+        difficulty_curves: Optional[DifficultyCurves] = None,
+        profiler: Optional[FrameProfiler] = None,
+        hud_mode: HudMode = HudMode.TITLE_BAR,
+        hud_flush_interval_in_ms: float = 0.0,
+        data_dir: Optional[str] = None,
+        renderer: Optional[Renderer] = None,
+        is_fixed_point: bool = False,
+        is_difficulty_adaptive: bool = False,
+        is_resizable: bool = False,
+        render_scale: float = 1.0,
+        is_hardware_accelerated: bool = False,
+        level_pack: Optional[LevelPack] = None,
+        audio_device: Optional[AudioDevice] = None,
+    ):
+        """
+        input_handler replaces the default InputHandler e.g. for replays.
+        is_frame_limited set to False runs the game as fast as possible.
+        start_level_idx and difficulty_parameters define the start
+        conditions of the session.
+        difficulty_curves define the difficulty of the following levels,
+        e.g. the ones of a recording. They default to the curves of
+        DIFFICULTY_FILENAME.
+        profiler measures the subsystems each frame and shows the results in
+        an overlay.
+        hud_mode defines if level, lifes and score are shown in the title bar
+        or in the window. They are updated at most once per frame or once
+        per hud_flush_interval_in_ms.
+        data_dir is the folder of the highscore file and the level pack
+        cache. Defaults to default_data_dir().
+        renderer replaces the default Renderer e.g. to render offscreen.
+        is_fixed_point set to True moves the balls on a fixed-point grid so
+        replays give the same result on every machine.
+        is_difficulty_adaptive set to True adjusts the difficulty to the
+        player each life.
+        is_resizable and render_scale are passed to the default Renderer.
+        is_resizable set to True lets the user resize the window.
+        render_scale below 1.0 renders at a lower resolution which is
+        scaled up to the window.
+        is_hardware_accelerated set to True renders with the renderer of
+        SDL2 instead of pygame surfaces. If it cannot be created the game
+        falls back to pygame surfaces.
+        level_pack replaces the levels of LEVEL_FOLDER, e.g. if the caller
+        already loaded them.
+        audio_device replaces the default AudioDevice, e.g. a silent one.
+        """
+        if input_handler is None:
+            input_handler = InputHandler()
+        if data_dir is None:
+            data_dir = default_data_dir()
+        if level_pack is None:
+            level_pack = _load_level_pack(LEVEL_FOLDER, data_dir)
+        if audio_device is None:
+            audio_device = AudioDevice()
+        self._audio_device = audio_device
+        self._input_handler = input_handler
+        self._is_frame_limited = is_frame_limited
+        self._profiler = profiler if profiler else NullFrameProfiler()
+        self._hud = Hud(hud_mode, hud_flush_interval_in_ms)
+        if difficulty_curves is None:
+            difficulty_curves = load_difficulty_curves(DIFFICULTY_FILENAME)
+        self._simulation = Simulation(
+            level_pack,
+            start_level_idx=start_level_idx,
+            difficulty_parameters=difficulty_parameters,
+            is_fixed_point=is_fixed_point,
+            profiler=self._profiler,
+            difficulty_curves=difficulty_curves,
+        )
+        self._event_queue = self._simulation.event_queue
+        self._difficulty_controller: Optional[
+            "AdaptiveDifficultyController"
+        ] = None
+        if is_difficulty_adaptive:
+            from bricks.adaptive_difficulty import (
+                AdaptiveDifficultyController,
+            )
+
+            self._difficulty_controller = AdaptiveDifficultyController(
+                self._simulation
+            )
+        level = self._simulation.level
+        if renderer is None:
+            renderer = _make_renderer(
+                screen_width,
+                screen_height,
+                level.grid_width,
+                level.grid_height,
+                is_resizable=is_resizable,
+                render_scale=render_scale,
+                is_hardware_accelerated=is_hardware_accelerated,
+            )
+        self._renderer = renderer
+        self._highscore_table = HighscoreTable(
+            os.path.join(data_dir, HIGHSCORE_FILENAME)
+        )
+        self._subscribe_to_events()
+        self._update_hud()
+        self._hud.flush(self._renderer)
+
+    @property
+    def simulation(self) -> Simulation:
+        return self._simulation
+
+    def _subscribe_to_events(self):
+        for event_type, play_sound in SOUNDS_BY_EVENT_TYPE:
+            self._event_queue.subscribe(
+                event_type, self._make_sound_callback(play_sound)
+            )
+        for event_type in (BrickDestroyed, BallLost, ExtraLife, LevelStarted):
+            self._event_queue.subscribe(
+                event_type, lambda _: self._update_hud()
+            )
+
+    def _make_sound_callback(
+        self, play_sound: Callable[[AudioDevice], None]
+    ) -> Callable[[object], None]:
+        return lambda _: play_sound(self._audio_device)
+
+    def _update_hud(self):
+        simulation = self._simulation
+        self._hud.level = simulation.level_idx
+        self._hud.lifes = simulation.lifes
+        self._hud.score = simulation.score
+        self._hud.highscore = self._highscore_table.best(
+            self._highscore_key()
         )
-        self._highscore = _load_highscore()
-        self._score = 0
-        self._last_extra_life_divisor = 0
-        self._current_level_idx = 1
-        self._lifes = START_LIFES
-        self._is_game_over = False
-        self._update_values_in_title_bar()
-
-    def _update_values_in_title_bar(self):
-        self._renderer.window_title = _make_title(
-            self._current_level_idx, self._lifes, self._score, self._highscore,
+
+    def _highscore_key(self) -> str:
+        return highscore_key(
+            os.path.basename(LEVEL_FOLDER), self._simulation.difficulty_tier
         )
 
     def run(self):
@@ -120,38 +254,33 @@ class Game:
             self._run_level()
             if self._input_handler.is_quit:
                 return
-            if self._is_game_over:
-                play_game_over(self._audio_device)
-                if self._score > self._highscore:
-                    self._highscore = self._score
-                    _save_highscore(self._highscore)
-                self._current_level_idx = 1
-                self._lifes = START_LIFES
-                self._is_game_over = False
-                self._score = 0
-                self._difficulty_parameters = DifficultyParameters()
-            elif self._all_levels_finished():
-                play_win_game(self._audio_device)
-                self._current_level_idx = 1
-                self._difficulty_parameters = _increase_difficulty(
-                    self._difficulty_parameters
+            if self._simulation.is_game_over:
+                self._highscore_table.add(
+                    self._highscore_key(), self._simulation.score
                 )
-            else:
-                play_next_level(self._audio_device)
-                self._current_level_idx += 1
-            self._level = _load_level(
-                self._level_filenames, self._current_level_idx
-            )
-            self._level.difficulty_parameters = self._difficulty_parameters
-            self._update_values_in_title_bar()
+            self._simulation.start_next_level()
+            self._event_queue.drain()
+            self._update_hud()
+            self._hud.flush(self._renderer, force=True)
+
+    def close(self):
+        """Waits until pending highscores are written."""
+        self._highscore_table.close()
 
     def _run_level(self):
+        profiler = self._profiler
+        simulation = self._simulation
         while True:
             timepoint1 = time()
+            profiler.begin_frame()
 
-            self._renderer.render(self._level)
+            profiler.start("render")
+            self._renderer.render(simulation.level)
+            profiler.stop("render")
 
-            self._input_handler.handle_input(self._level, MS_PER_FRAME)
+            profiler.start("input")
+            self._input_handler.handle_input(simulation.level, MS_PER_FRAME)
+            profiler.stop("input")
             if self._input_handler.changed_pause_state:
                 self._renderer.is_paused = self._input_handler.is_paused
             if self._input_handler.is_quit:
@@ -159,154 +288,88 @@ class Game:
             if self._input_handler.is_paused:
                 continue
 
-            if self._level.ball.is_active:
-                self._level.ball.move(MS_PER_FRAME)
-
-                if self._ball_is_lost():
-                    self._lifes -= 1
-                    if self._lifes <= 0:
-                        self._is_game_over = True
-                        return
-                    play_lost_ball(self._audio_device)
-
-                    self._update_values_in_title_bar()
-                    self._level.reset_ball()
-                    self._level.reset_platform()
-
-                self._handle_ball_collisions()
-                if _all_bricks_are_destroyed(self._level.bricks):
-                    break
-
-            timepoint2 = time()
-            diff_in_ms = (timepoint2 - timepoint1) * 1000
-
-            _delay_to_framerate(diff_in_ms)
-
-    def _all_levels_finished(self) -> bool:
-        return self._current_level_idx >= len(self._level_filenames)
+            simulation.update(MS_PER_FRAME)
+            if self._difficulty_controller is not None:
+                self._difficulty_controller.update(MS_PER_FRAME)
+            if simulation.is_game_over:
+                return
 
-    def _ball_is_lost(self) -> bool:
-        return self._level.ball.bottom_right.y >= self._level.grid_height
+            profiler.start("events")
+            self._event_queue.drain()
+            self._hud.flush(self._renderer)
+            profiler.stop("events")
+            if simulation.is_level_cleared:
+                break
 
-    def _handle_ball_collisions(self):
-        hit_objects = reflect_from_game_objects(
-            ball=self._level.ball,
-            game_objects=[self._level.left_wall]
-            + [self._level.right_wall]
-            + [self._level.top_wall]
-            + self._level.bricks
-            + self._level.indestructible_bricks,
-        )
+            profiler.end_frame()
+            self._update_profiler_overlay()
 
-        for hit_object in hit_objects:
-            if not isinstance(hit_object, Brick):
+            if not self._is_frame_limited:
                 continue
-            if hit_object.is_destroyed():
-                play_destroy_brick(self._audio_device)
-                self._score += self._get_brick_score(hit_object)
-                self._award_extra_life_it_threshold_reached()
-                self._update_values_in_title_bar()
-            else:
-                play_hit_brick(self._audio_device)
-
-        if reflect_from_platform(self._level.ball, self._level.platform):
-            play_hit_platform(self._audio_device)
-
-    def _get_brick_score(self, brick: Brick) -> int:
-        return (
-            POINTS_PER_BRICK_HITPOINTS
-            * brick.start_hitpoints
-            * self._current_level_idx
-        )
-
-    def _award_extra_life_it_threshold_reached(self):
-        extra_life_divisor = int(self._score / POINTS_FOR_EXTRA_LIVE)
-        if extra_life_divisor != self._last_extra_life_divisor:
-            play_extra_life(self._audio_device)
-            self._lifes += 1
-            self._last_extra_life_divisor = extra_life_divisor
 
+            self._delay_to_framerate(timepoint1)
 
-def _increase_difficulty(
-    difficulty_paramters: DifficultyParameters,
-) -> DifficultyParameters:
+    def _update_profiler_overlay(self):
+        if not isinstance(self._profiler, FrameProfiler):
+            return
+        total_frame_count = self._profiler.total_frame_count
+        if total_frame_count % PROFILER_OVERLAY_INTERVAL == 0:
+            self._renderer.overlay_lines = self._profiler.summary_lines()
 
-    dp = difficulty_paramters
-
-    dp.platform_velocity = _clamp(
-        dp.platform_velocity,
-        dp.platform_velocity + PLATFORM_VELOCITY_INCREASE,
-        PLATFORM_VELOCITY_MAX,
-    )
-    dp.platform_width = _clamp(
-        PLATFORM_WIDTH_MIN,
-        dp.platform_width - PLATFORM_WIDTH_DECREASE,
-        dp.platform_width,
-    )
-    dp.ball_velocity = _clamp(
-        dp.ball_velocity,
-        dp.ball_velocity + BALL_VELOCITY_INCREASE,
-        BALL_VELOCITY_MAX,
-    )
-    dp.ball_gravity = _clamp(
-        dp.ball_gravity,
-        dp.ball_gravity + BALL_GRAVITY_INCREASE,
-        BALL_GRAVITY_MAX,
-    )
-    return dp
-
-
-def _load_highscore() -> int:
-    try:
-        with open(HIGHSCORE_FILENAME) as file:
-            try:
-                data = json.load(file)
-                return data["highscore"]
-            except ValueError as error:
-                print("File has no highscore JSON entry (%s)" % error)
-                return 0
-    except IOError as error:
-        return 0
-
-
-def _save_highscore(highscore: int):
-    try:
-        with open(HIGHSCORE_FILENAME, "w") as file:
-            json.dump({"highscore": highscore}, file)
-    except IOError as error:
-        print("Couldn't open highscore file (%s)" % error)
-
-
-def _make_title(level: int, lifes: int, score: int, highscore: int) -> str:
-    return "Level: %s     Lifes: %s     Score: %s     Highscore: %s" % (
-        level,
-        lifes,
-        score,
-        highscore,
+    def _delay_to_framerate(self, frame_start: float):
+        """
+        Waits until the frame started at frame_start is over and polls the
+        input in between, so events get read soon after they arrive.
+        """
+        while True:
+            remaining_in_ms = MS_PER_FRAME - (time() - frame_start) * 1000
+            if remaining_in_ms <= 0.0:
+                return
+            sleep(min(remaining_in_ms, INPUT_POLL_INTERVAL_IN_MS) / 1000)
+            self._input_handler.poll()
+
+
+def _load_level_pack(folder_name: str, data_dir: str) -> LevelPack:
+    level_pack = load_level_pack(folder_name, cache_dir=data_dir)
+    for filename, errors in level_pack.errors.items():
+        print("Skipping invalid level file %s:" % filename)
+        for error in errors:
+            print("    %s" % error)
+    if len(level_pack) == 0:
+        raise ValueError("No valid level found in folder %s" % folder_name)
+    return level_pack
+
+
+def _make_renderer(
+    screen_width: int,
+    screen_height: int,
+    grid_width: int,
+    grid_height: int,
+    is_resizable: bool,
+    render_scale: float,
+    is_hardware_accelerated: bool,
+) -> Renderer:
+    if is_hardware_accelerated:
+        import pygame
+
+        try:
+            from bricks.gpu_renderer import GpuRenderer
+
+            return GpuRenderer(
+                screen_width=screen_width,
+                screen_height=screen_height,
+                grid_width=grid_width,
+                grid_height=grid_height,
+                is_resizable=is_resizable,
+                render_scale=render_scale,
+            )
+        except (ImportError, pygame.error) as error:
+            print("Rendering without hardware acceleration: %s" % error)
+    return Renderer(
+        screen_width=screen_width,
+        screen_height=screen_height,
+        grid_width=grid_width,
+        grid_height=grid_height,
+        is_resizable=is_resizable,
+        render_scale=render_scale,
     )
-
-
-def _all_bricks_are_destroyed(bricks: List[Brick]) -> bool:
-    return all(brick.is_destroyed() for brick in bricks)
-
-
-def _delay_to_framerate(elapsed_time_in_ms: float):
-    if elapsed_time_in_ms < MS_PER_FRAME:
-        sleep((MS_PER_FRAME - elapsed_time_in_ms) / 1000)
-
-
-def _load_level(level_filenames: List[str], level_idx: int) -> Level:
-    assert len(level_filenames) > 0
-
-    return read_level_from_json_file(level_filenames[level_idx - 1])
-
-
-def _get_level_filenames_from_folder(folder_name: str) -> List[str]:
-    filenames: List[str] = []
-    for filepath in pathlib.Path(folder_name).glob("**/*.json"):
-        filenames.append(str(filepath.absolute()))
-    return sorted(filenames)
-
-
-def _clamp(minimum, x, maximum):
-    return max(minimum, min(x, maximum))
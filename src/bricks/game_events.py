@@ -0,0 +1,101 @@
+"""
+Events which happen in the game and a queue to distribute them.
+
+The game logic only pushes events to the queue. Side effects like sounds or
+updating the displayed values are done by subscribers when the queue gets
+drained once per frame.
+
+class EventQueue
+    Queue of game events with subscribers per event type.
+"""
+from bricks.game_objects.brick import Brick
+
+from collections import defaultdict
+from typing import Callable
+from typing import DefaultDict
+from typing import List
+from typing import NamedTuple
+from typing import Type
+
+
+class BrickHit(NamedTuple):
+    brick: Brick
+
+
+class BrickDestroyed(NamedTuple):
+    brick: Brick
+    score: int
+
+
+class PlatformHit(NamedTuple):
+    pass
+
+
+class BallLost(NamedTuple):
+    lifes: int
+    miss_distance: float = 0.0
+
+
+class ExtraLife(NamedTuple):
+    lifes: int
+
+
+class LevelStarted(NamedTuple):
+    level_idx: int
+
+
+class LevelCleared(NamedTuple):
+    level_idx: int
+
+
+class AllLevelsCleared(NamedTuple):
+    pass
+
+
+class GameOver(NamedTuple):
+    score: int
+
+
+class EventQueue:
+    """
+    Queue of game events with subscribers per event type.
+
+    Methods
+    -------
+    subscribe(self, event_type: Type, callback: Callable):
+        Calls callback with every drained event of event_type.
+    push(self, event):
+        Adds an event to the queue.
+    drain(self):
+        Passes all queued events in order to their subscribers.
+    """
+
+    def __init__(self):
+        self._events: List[NamedTuple] = []
+        self._subscribers: DefaultDict[Type, List[Callable]] = defaultdict(
+            list
+        )
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def subscribe(self, event_type: Type, callback: Callable):
+        """Calls callback with every drained event of event_type."""
+        self._subscribers[event_type].append(callback)
+
+    def push(self, event):
+        """Adds an event to the queue."""
+        self._events.append(event)
+
+    def drain(self):
+        """
+        Passes all queued events in order to their subscribers.
+        Events pushed by subscribers are drained in the same call.
+        """
+        idx = 0
+        while idx < len(self._events):
+            event = self._events[idx]
+            for callback in self._subscribers.get(type(event), ()):
+                callback(event)
+            idx += 1
+        self._events.clear()
@@ -55,6 +55,21 @@ class Brick(GameObject):
     def hitpoints(self) -> int:
         return self._hitpoints
 
+    @hitpoints.setter
+    def hitpoints(self, hitpoints: int):
+        """
+        Sets the hitpoints e.g. to restore a snapshot.
+        Raises ValueError if hitpoints not in range between 0 and
+        start_hitpoints.
+        """
+        if hitpoints < 0 or hitpoints > self._start_hitpoints:
+            raise ValueError(
+                "brick.hitpoints:\n"
+                "hitpoints must be >= 0 and <= start_hitpoints\n"
+                "hitpoints: %s\n" % (hitpoints)
+            )
+        self._hitpoints = hitpoints
+
     def decrease_hitpoints(self):
         if self._hitpoints > 0:
             self._hitpoints -= 1
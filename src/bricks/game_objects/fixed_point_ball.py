@@ -0,0 +1,98 @@
+"""Ball which moves on a fixed-point grid for bit-exact replays."""
+from bricks.game_objects.ball import Ball
+from bricks.types.angle import Angle
+from bricks.types.angle import Quadrant
+from bricks.types.angle import QuantizedAngle
+from bricks.types import fixed_point
+from bricks.types.fixed_point import QUADRANT_STEPS
+from bricks.types.fixed_point import multiply
+from bricks.types.fixed_point import to_fixed
+from bricks.types.fixed_point import to_float
+from bricks.types.point import Point
+
+
+class FixedPointBall(Ball):
+    """
+    Ball which moves on a fixed-point grid of 2^-16 grid units.
+
+    The movement is calculated with integers and an integer sine table
+    instead of the platform libm. The angle is a QuantizedAngle with
+    QUADRANT_STEPS steps per quadrant, so the sine table is indexed with
+    its step directly. Angles which are set are converted to it. Positions
+    are always exact multiples of 2^-16, so the comparisons and additions
+    in the reflection logic give the same results on every machine as
+    well.
+
+    Attributes and methods are the same as of Ball.
+    """
+
+    def __init__(
+        self,
+        top_left: Point = Point(0.0, 0.0),
+        width: float = 0.0,
+        height: float = 0.0,
+        velocity: float = 0.0,
+        angle: Angle = Angle(0.0),
+        gravity: float = 0.0,
+    ):
+        Ball.__init__(
+            self,
+            top_left=Point(
+                to_float(to_fixed(top_left.x)), to_float(to_fixed(top_left.y))
+            ),
+            width=width,
+            height=height,
+            velocity=velocity,
+            angle=_quantized(angle),
+            gravity=gravity,
+        )
+
+    @property
+    def angle(self) -> QuantizedAngle:
+        return self._angle
+
+    @angle.setter
+    def angle(self, angle: Angle):
+        self._angle = _quantized(angle)
+
+    def move(self, elapsed_time_in_ms: float):
+        """
+        Calculates were the ball moves in a timeframe.
+        Considers velocity and gravity for calculation.
+        """
+        if not self._is_active:
+            return
+
+        x = to_fixed(self._top_left.x)
+        y = to_fixed(self._top_left.y)
+
+        traveld_way = to_fixed(elapsed_time_in_ms / 1000.0 * self.velocity)
+        if traveld_way != 0:
+            delta_x, delta_y = _calc_delta(self.angle, traveld_way)
+            x += delta_x
+            y += delta_y
+
+        y += to_fixed(elapsed_time_in_ms / 1000.0 * self.gravity)
+
+        self._top_left = Point(to_float(x), to_float(y))
+
+
+def _quantized(angle: Angle) -> QuantizedAngle:
+    if isinstance(angle, QuantizedAngle):
+        return angle
+    return QuantizedAngle.from_angle(angle)
+
+
+def _calc_delta(angle: QuantizedAngle, side_c: int):
+    sin_table = fixed_point.SIN_TABLE
+    step = angle.quadrant_step
+    side_a = multiply(sin_table[step], side_c)
+    side_b = multiply(sin_table[QUADRANT_STEPS - step], side_c)
+
+    if angle.quadrant == Quadrant.I:
+        return side_b, side_a
+    if angle.quadrant == Quadrant.II:
+        return -side_a, side_b
+    if angle.quadrant == Quadrant.III:
+        return -side_b, -side_a
+    return side_a, -side_b
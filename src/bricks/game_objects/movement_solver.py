@@ -0,0 +1,107 @@
+"""
+Module to move the moveable game objects and resolve their constraints.
+
+All movement of a tick goes through this module. The platform is moved
+when the input arrives, because input can be read several times per
+tick. Its moves are clamped between the walls with a swept test and summed
+up on the platform. solve_tick then moves the balls, reflects them from
+the game objects and the platform and feeds the velocity the platform
+moved with in the tick into the reflection.
+
+class TickResult
+    Balls left in the game and what they hit in one tick.
+
+function move_platform(platform: Platform, left_wall: Optional[Wall],
+    right_wall: Optional[Wall], elapsed_time_in_ms: float) -> float:
+    Moves the platform with its velocity, but not into a wall.
+
+function solve_tick(balls: List[Ball], platform: Platform, grid: SpatialGrid,
+    floor_y: float, elapsed_time_in_ms: float) -> TickResult:
+    Moves the balls for one tick and reflects them.
+"""
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.game_object import GameObject
+from bricks.game_objects.physics import reflect_balls_from_game_objects
+from bricks.game_objects.physics import reflect_from_platform
+from bricks.game_objects.platform import Platform
+from bricks.game_objects.spatial_grid import SpatialGrid
+from bricks.game_objects.wall import Wall
+
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+
+class TickResult(NamedTuple):
+    balls: List[Ball]
+    lost_balls: List[Ball]
+    hit_objects_per_ball: List[List[GameObject]]
+    platform_hit_count: int
+
+
+def move_platform(
+    platform: Platform,
+    left_wall: Optional[Wall],
+    right_wall: Optional[Wall],
+    elapsed_time_in_ms: float,
+) -> float:
+    """
+    Moves the platform with its velocity, but not into a wall.
+    Positive velocity moves right, negative left.
+
+    The whole way is tested, so a fast platform or a long time stops at
+    the wall instead of entering it. A wall which is None does not limit
+    the movement. The moved distance is added to moved_distance of the
+    platform and returned.
+    """
+    start_x = platform.top_left.x
+    x = start_x + elapsed_time_in_ms / 1000.0 * platform.velocity
+    if right_wall is not None:
+        x = min(x, right_wall.top_left.x - platform.width)
+    if left_wall is not None:
+        x = max(x, left_wall.bottom_right.x)
+    platform.top_left.x = x
+    distance = platform.top_left.x - start_x
+    platform.moved_distance += distance
+    return distance
+
+
+def solve_tick(
+    balls: List[Ball],
+    platform: Platform,
+    grid: SpatialGrid,
+    floor_y: float,
+    elapsed_time_in_ms: float,
+) -> TickResult:
+    """
+    Moves the balls for one tick and reflects them.
+
+    Balls which fell below floor_y are lost and not reflected. The others
+    are reflected from the objects in grid and then from the platform.
+    A platform which moved in this tick rotates the reflection of a ball
+    in its direction. Resets moved_distance of the platform.
+    """
+    for ball in balls:
+        ball.move(elapsed_time_in_ms)
+
+    remaining_balls = [ball for ball in balls if ball.bottom_right.y < floor_y]
+    lost_balls = [ball for ball in balls if ball.bottom_right.y >= floor_y]
+
+    hit_objects_per_ball = reflect_balls_from_game_objects(
+        remaining_balls, grid
+    )
+
+    platform_velocity = 0.0
+    if elapsed_time_in_ms > 0.0:
+        platform_velocity = (
+            platform.moved_distance / elapsed_time_in_ms * 1000.0
+        )
+    platform.moved_distance = 0.0
+    platform_hit_count = 0
+    for ball in remaining_balls:
+        if reflect_from_platform(ball, platform, platform_velocity):
+            platform_hit_count += 1
+
+    return TickResult(
+        remaining_balls, lost_balls, hit_objects_per_ball, platform_hit_count
+    )
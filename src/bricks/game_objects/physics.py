@@ -3,8 +3,11 @@ Module to handle the reflections between game objects.
 
 Methods
 -------
-reflect_from_platform(ball: Ball, platform: Platform) -> bool:
+reflect_from_platform(
+    ball: Ball, platform: Platform, platform_velocity: float = 0.0
+) -> bool:
     Checks if ball collides with platform and reflects from if True.
+    A moving platform rotates the reflection in its direction.
     Returns True on reflect
 
 reflect_from_game_objects(
@@ -14,21 +17,35 @@ reflect_from_game_objects(
     them.
     Returns a list of all the objects hit by the ball.
     Decreases hitpoints if brick is hit.
+
+reflect_balls_from_game_objects(
+    balls: List[Ball], grid: SpatialGrid
+) -> List[List[GameObject]]:
+    Reflects all balls from the game objects in grid in one pass.
+    Returns for each ball a list of all the objects hit by it.
 """
 from bricks.game_objects.ball import Ball
 from bricks.game_objects.platform import Platform
 from bricks.game_objects.brick import Brick
 from bricks.game_objects.indestructible_brick import IndestructibleBrick
 from bricks.game_objects.game_object import GameObject
+from bricks.game_objects.spatial_grid import SpatialGrid
 from bricks.types.point import Point
 from bricks.types.angle import Angle, Quadrant
+from bricks.types.angle import ANGLE_STEPS
+from bricks.types.angle import QuantizedAngle
+from bricks.types.angle import STEP_ANGLE
+from bricks.types.angle import angle_to_step
 
 from typing import List
+from typing import Set
 from typing import Tuple
 from enum import Enum
 
 from numpy import deg2rad
 
+import numpy
+
 
 class _Intersection(Enum):
     NONE = (0,)
@@ -42,18 +59,28 @@ class _Intersection(Enum):
     BOTTOM_LEFT = 8
 
 
-def reflect_from_platform(ball: Ball, platform: Platform) -> bool:
+MAX_SPIN_ANGLE = deg2rad(15.0)
+
+
+def reflect_from_platform(
+    ball: Ball, platform: Platform, platform_velocity: float = 0.0
+) -> bool:
     """
     Reflect from platform if ball has hit it.
     
     Get intersections with platform.
     If intersections exists reflect from the platform.
+    If the ball goes up afterwards rotate it in the direction of
+    platform_velocity. A platform as fast as the ball rotates it by
+    MAX_SPIN_ANGLE.
     Return True to indicate reflection.
     """
     intersection = _get_intersection(ball, platform)
     if intersection == _Intersection.NONE:
         return False
     _reflect_from_single_object(ball, platform, intersection)
+    if platform_velocity != 0.0 and ball.velocity != 0.0:
+        _apply_spin(ball, platform_velocity)
     ball.angle = _clamp_angle(ball.angle)
     return True
 
@@ -69,8 +96,37 @@ def reflect_from_game_objects(
     Return game objects which were hit.
     If brick was hit decrease hitpoints.
     """
+    return _reflect_from_game_objects(ball, game_objects, set())
+
+
+def reflect_balls_from_game_objects(
+    balls: List[Ball], grid: SpatialGrid
+) -> List[List[GameObject]]:
+    """
+    Reflect all balls from the game objects in grid in one pass.
+
+    Each ball is only tested against the objects in the grid cells it
+    touches.
+    Balls are resolved in list order. If several balls hit the same brick
+    in one pass each ball decreases the hitpoints once. A brick destroyed by
+    an earlier ball in the same pass still reflects the later balls, because
+    it was present at the start of the pass, but is not reported again.
+    Return for each ball the game objects which were hit.
+    """
+    destroyed_in_pass: Set[GameObject] = set()
+    return [
+        _reflect_from_game_objects(ball, grid.query(ball), destroyed_in_pass)
+        for ball in balls
+    ]
+
+
+def _reflect_from_game_objects(
+    ball: Ball,
+    game_objects: List[GameObject],
+    destroyed_in_pass: Set[GameObject],
+) -> List[GameObject]:
     object_intersection_pairs = _get_object_intersection_pairs(
-        ball, game_objects
+        ball, game_objects, destroyed_in_pass
     )
     if len(object_intersection_pairs) == 1:
         _reflect_from_single_object(
@@ -79,23 +135,27 @@ def reflect_from_game_objects(
             intersection=object_intersection_pairs[0][1],
         )
         ball.angle = _clamp_angle(ball.angle)
-
-        return [object_intersection_pairs[0][0]]
-    if len(object_intersection_pairs) > 1:
+    elif len(object_intersection_pairs) > 1:
         _reflect_from_multiple_objects(
             ball=ball, object_intersection_pairs=object_intersection_pairs
         )
         ball.angle = _clamp_angle(ball.angle)
 
-        hit_objects: List[GameObject] = []
-        for object_intersection_pair in object_intersection_pairs:
-            hit_objects.append(object_intersection_pair[0])
-        return hit_objects
-    return []
+    hit_objects: List[GameObject] = []
+    for object_intersection_pair in object_intersection_pairs:
+        hit_object = object_intersection_pair[0]
+        if _is_destroyed_brick(hit_object):
+            if hit_object in destroyed_in_pass:
+                continue
+            destroyed_in_pass.add(hit_object)
+        hit_objects.append(hit_object)
+    return hit_objects
 
 
 def _get_object_intersection_pairs(
-    ball: Ball, game_objects: List[GameObject]
+    ball: Ball,
+    game_objects: List[GameObject],
+    destroyed_in_pass: Set[GameObject],
 ) -> List[Tuple[GameObject, _Intersection]]:
     object_intersection_pairs = []
     for game_object in game_objects:
@@ -105,12 +165,18 @@ def _get_object_intersection_pairs(
 
         if isinstance(game_object, Brick):
             if game_object.is_destroyed():
-                continue
-            game_object.decrease_hitpoints()
+                if game_object not in destroyed_in_pass:
+                    continue
+            else:
+                game_object.decrease_hitpoints()
         object_intersection_pairs.append((game_object, intersection))
     return object_intersection_pairs
 
 
+def _is_destroyed_brick(game_object: GameObject) -> bool:
+    return isinstance(game_object, Brick) and game_object.is_destroyed()
+
+
 def _get_intersection(ball: Ball, obj: GameObject) -> _Intersection:
     intersections: List[_Intersection] = []
 
@@ -819,43 +885,79 @@ def _put_before_intersects_with_top_y(ball: Ball, obj: GameObject):
     ball.top_left.y = obj.bottom_right.y
 
 
+def _apply_spin(ball: Ball, platform_velocity: float):
+    if ball.angle.quadrant not in (Quadrant.III, Quadrant.IV):
+        return
+    ratio = _clamp(-1.0, platform_velocity / abs(ball.velocity), 1.0)
+    value = ball.angle.value + MAX_SPIN_ANGLE * ratio
+    ball.angle.value = _clamp(deg2rad(210.0), value, deg2rad(330.0))
+
+
 def _clamp_angle(angle: Angle) -> Angle:
     """
     Certain angles in the game should be prohibited because they are not funny 
     to play. The Function checks if angle is in the forbidden area and adjusts 
-    the angle.
+    the angle. A QuantizedAngle is clamped with a lookup in a table.
     """
-    delta_x = deg2rad(30.0)
-    delta_y = deg2rad(15.0)
+    if isinstance(angle, QuantizedAngle):
+        angle.step = _CLAMPED_STEPS[angle.step]
+        return angle
 
-    new_angle = angle
+    value = angle.value
+    for lower, upper, clamped_value in _CLAMP_ZONES:
+        if lower <= value < upper:
+            angle.value = clamped_value
+            break
+    return angle
 
-    if _is_bigger(angle.value, deg2rad(0.0), delta_x):
-        new_angle.value = deg2rad(0.0) + delta_x
-    elif _is_smaller(angle.value, deg2rad(90.0), delta_y):
-        new_angle.value = deg2rad(90.0) - delta_y
-    elif _is_bigger(angle.value, deg2rad(90.0), delta_y):
-        new_angle.value = deg2rad(90.0) + delta_y
-    elif _is_smaller(angle.value, deg2rad(180.0), delta_x):
-        new_angle.value = deg2rad(180.0) - delta_x
-    elif _is_bigger(angle.value, deg2rad(180.0), delta_x):
-        new_angle.value = deg2rad(180.0) + delta_x
-    elif _is_smaller(angle.value, deg2rad(270.0), delta_y):
-        new_angle.value = deg2rad(270.0) - delta_y
-    elif _is_bigger(angle.value, deg2rad(270.0), delta_y):
-        new_angle.value = deg2rad(270.0) + delta_y
-    elif _is_smaller(angle.value, deg2rad(360.0), delta_x):
-        new_angle.value = deg2rad(360.0) - delta_x
 
-    return new_angle
+def _make_clamp_zones() -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Forbidden areas as lower bound, upper bound and the angle they are
+    clamped to.
+    """
+    delta_x = deg2rad(30.0)
+    delta_y = deg2rad(15.0)
+    zones = []
+    for target_angle, delta in (
+        (deg2rad(0.0), delta_x),
+        (deg2rad(90.0), delta_y),
+        (deg2rad(180.0), delta_x),
+        (deg2rad(270.0), delta_y),
+        (deg2rad(360.0), delta_x),
+    ):
+        if target_angle > deg2rad(0.0):
+            zones.append(
+                (target_angle - delta, target_angle, target_angle - delta)
+            )
+        if target_angle < deg2rad(360.0):
+            zones.append(
+                (target_angle, target_angle + delta, target_angle + delta)
+            )
+    return tuple(
+        (float(lower), float(upper), float(clamped_value))
+        for lower, upper, clamped_value in zones
+    )
 
 
-def _is_smaller(angle: float, target_angle: float, delta: float) -> bool:
-    return angle >= target_angle - delta and angle < target_angle
+def _make_clamped_steps(
+    zones: Tuple[Tuple[float, float, float], ...]
+) -> Tuple[int, ...]:
+    """
+    Step of every quantized angle after clamping.
+    The zones are applied to the angle of each step like to a float angle.
+    """
+    steps = numpy.arange(ANGLE_STEPS + 1)
+    values = steps * STEP_ANGLE
+    for lower, upper, clamped_value in zones:
+        steps[(values >= lower) & (values < upper)] = angle_to_step(
+            clamped_value
+        )
+    return tuple(steps.tolist())
 
 
-def _is_bigger(angle: float, target_angle: float, delta: float) -> bool:
-    return angle >= target_angle and angle < target_angle + delta
+_CLAMP_ZONES = _make_clamp_zones()
+_CLAMPED_STEPS = _make_clamped_steps(_CLAMP_ZONES)
 
 
 def _clamp(minimum: float, x: float, maximum: float) -> float:
@@ -23,6 +23,9 @@ class Platform(MoveableGameObject):
         Height of the platform.
     velocity: float
         Velocity of the platform.
+    moved_distance: float
+        Distance the platform moved in the current tick. Negative to the
+        left.
 
     Methods
     -------
@@ -38,6 +41,15 @@ class Platform(MoveableGameObject):
         velocity: float = 0.0,
     ):
         MoveableGameObject.__init__(self, top_left, width, height, velocity)
+        self._moved_distance = 0.0
+
+    @property
+    def moved_distance(self) -> float:
+        return self._moved_distance
+
+    @moved_distance.setter
+    def moved_distance(self, moved_distance: float):
+        self._moved_distance = moved_distance
 
     def move(self, elapsed_time_in_ms: float):
         """
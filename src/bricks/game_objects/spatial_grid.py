@@ -0,0 +1,66 @@
+"""Uniform grid to find game objects near a position quickly."""
+from bricks.game_objects.game_object import GameObject
+
+from math import floor
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+
+class SpatialGrid:
+    """
+    Uniform grid to find game objects near a position quickly.
+
+    Every object is registered in all cells its rectangle touches.
+    Only suitable for objects which do not move after construction like
+    walls and bricks. Destroyed bricks stay registered.
+
+    Attributes
+    ----------
+    game_objects: Sequence[GameObject]
+        All registered game objects in the order of construction.
+
+    Methods
+    -------
+    query(self, obj: GameObject) -> List[GameObject]:
+        Returns all registered objects in the cells touched by obj.
+    """
+
+    def __init__(
+        self, game_objects: Sequence[GameObject], cell_size: float = 1.0
+    ):
+        assert cell_size > 0.0
+        self._game_objects = list(game_objects)
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+        for idx, obj in enumerate(self._game_objects):
+            for cell in self._touched_cells(obj):
+                self._cells.setdefault(cell, []).append(idx)
+
+    @property
+    def game_objects(self) -> Sequence[GameObject]:
+        return self._game_objects
+
+    def query(self, obj: GameObject) -> List[GameObject]:
+        """
+        Returns all registered objects in the cells touched by obj.
+        The objects are returned in the order of construction. So the result
+        is the same as a full scan filtered by distance.
+        """
+        indices = set()
+        for cell in self._touched_cells(obj):
+            indices.update(self._cells.get(cell, ()))
+        return [self._game_objects[idx] for idx in sorted(indices)]
+
+    def _touched_cells(self, obj: GameObject):
+        size = self._cell_size
+        bottom_right = obj.bottom_right
+        x_first = floor(obj.top_left.x / size)
+        x_last = floor(bottom_right.x / size)
+        y_first = floor(obj.top_left.y / size)
+        y_last = floor(bottom_right.y / size)
+        for x in range(x_first, x_last + 1):
+            for y in range(y_first, y_last + 1):
+                yield x, y
@@ -0,0 +1,194 @@
+"""
+Module to render level with the renderer of SDL2.
+
+The level is read like Renderer reads it, but every object is drawn as a
+texture by pygame._sdl2.video, which uses the graphics card if a driver
+for it exists and falls back to a software renderer otherwise.
+
+class GpuRenderer
+    Renders the level with SDL2 textures.
+"""
+from bricks.renderer import BLACK
+from bricks.renderer import Renderer
+from bricks.renderer import draw_tile
+from bricks.renderer import surface_as_array
+from bricks.types.rgb_color import RGBColor
+
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pygame._sdl2 import sdl2
+from pygame._sdl2 import video
+
+import numpy
+import pygame
+
+MAX_TILE_COUNT = 256
+
+
+class GpuRenderer(Renderer):
+    """
+    Class to render level with SDL2 textures.
+
+    Every combination of size and color of the objects in the level is
+    drawn once into a tile texture like Renderer draws it. Rendering a
+    frame then only copies tiles, so it looks the same as with Renderer.
+    The tiles are dropped when the size changes or more than
+    MAX_TILE_COUNT were made.
+
+    Offscreen and with a render_scale below 1.0 the frame is rendered into
+    a target texture first. The window is hidden if rendering offscreen.
+
+    Attributes and methods are the ones of Renderer.
+    """
+
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        grid_width: int,
+        grid_height: int,
+        is_offscreen: bool = False,
+        is_resizable: bool = False,
+        render_scale: float = 1.0,
+    ):
+        """
+        Takes the same arguments as Renderer.
+
+        Raises ValueError if render_scale is not in range MIN_RENDER_SCALE
+        to 1.0.
+        Raises pygame.error if SDL2 cannot create a renderer.
+        """
+        pygame.display.init()
+        self._sdl_window: Optional[video.Window] = None
+        self._sdl_renderer: Optional[video.Renderer] = None
+        self._target: Optional[video.Texture] = None
+        self._tiles: Dict[
+            Tuple[int, int, Tuple[int, int, int, int]], video.Texture
+        ] = {}
+        self._hud_texture: Optional[video.Texture] = None
+        self._hud_texture_source: Optional[pygame.Surface] = None
+        self._overlay_textures: List[video.Texture] = []
+        self._overlay_texture_source: List[pygame.Surface] = []
+        super().__init__(
+            screen_width=screen_width,
+            screen_height=screen_height,
+            grid_width=grid_width,
+            grid_height=grid_height,
+            is_offscreen=is_offscreen,
+            is_resizable=is_resizable,
+            render_scale=render_scale,
+        )
+
+    def frame_as_array(
+        self, out: Optional[numpy.ndarray] = None
+    ) -> numpy.ndarray:
+        """
+        Copies the last rendered frame into a RGB array of shape
+        (screen_height, screen_width, 3).
+        If out is given the frame is copied into it instead of allocating a
+        new array.
+        Without target texture the frame is read back from the window.
+        """
+        self._sdl_renderer.target = self._target
+        surface = self._sdl_renderer.to_surface()
+        if surface.get_size() != self.screen_size:
+            surface = pygame.transform.scale(surface, self.screen_size)
+        return surface_as_array(surface, out)
+
+    def _open_window(self, screen_width: int, screen_height: int):
+        size = (screen_width, screen_height)
+        if self._sdl_window is not None:
+            self._sdl_window.size = size
+            return
+        self._sdl_window = video.Window(
+            size=size,
+            resizable=self._is_resizable,
+            hidden=self._is_offscreen,
+        )
+        try:
+            self._sdl_renderer = video.Renderer(self._sdl_window)
+        except sdl2.error as error:
+            self._sdl_window.destroy()
+            raise pygame.error(str(error)) from error
+
+    def _open_render_target(self, render_width: int, render_height: int):
+        self._tiles.clear()
+        self._target = None
+        if self._is_offscreen or self._render_scale != 1.0:
+            self._target = video.Texture(
+                self._sdl_renderer, (render_width, render_height), target=True
+            )
+
+    def _window_size(self) -> Tuple[int, int]:
+        return self._sdl_window.size
+
+    def _show_window_title(self, window_title: str):
+        self._sdl_window.title = window_title
+
+    def _clear_screen(self):
+        white = RGBColor(0x1E, 0x1E, 0x1E)
+        if self._is_paused:
+            white = white.grayscale()
+        renderer = self._sdl_renderer
+        renderer.target = self._target
+        renderer.draw_color = white.as_tuple()
+        renderer.clear()
+
+    def _render_rect(self, rect: pygame.Rect, color: RGBColor):
+        if self.is_paused:
+            color = color.grayscale()
+        key = (rect.width, rect.height, color.as_tuple())
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._make_tile(rect.width, rect.height, color)
+            self._tiles[key] = tile
+        tile.draw(
+            dstrect=(rect.x, rect.y, rect.width + 1, rect.height + 1)
+        )
+
+    def _make_tile(
+        self, width: int, height: int, color: RGBColor
+    ) -> video.Texture:
+        if len(self._tiles) >= MAX_TILE_COUNT:
+            self._tiles.clear()
+        surface = pygame.Surface((width + 1, height + 1))
+        draw_tile(surface, pygame.Rect(0, 0, width, height), color)
+        return video.Texture.from_surface(self._sdl_renderer, surface)
+
+    def _render_hud(self):
+        if self._hud_surface is None:
+            return
+        if self._hud_surface is not self._hud_texture_source:
+            self._hud_texture_source = self._hud_surface
+            self._hud_texture = video.Texture.from_surface(
+                self._sdl_renderer, self._hud_surface
+            )
+        x, y = self._hud_position()
+        width, height = self._hud_surface.get_size()
+        self._hud_texture.draw(dstrect=(int(x), int(y), width, height))
+
+    def _render_overlay(self):
+        if self._overlay_surfaces is not self._overlay_texture_source:
+            self._overlay_texture_source = self._overlay_surfaces
+            self._overlay_textures = [
+                video.Texture.from_surface(self._sdl_renderer, surface)
+                for surface in self._overlay_surfaces
+            ]
+        y = 0
+        for texture in self._overlay_textures:
+            texture.draw(dstrect=(0, y, texture.width, texture.height))
+            y += texture.height
+
+    def _update_screen(self):
+        if self._is_offscreen:
+            return
+        renderer = self._sdl_renderer
+        if self._target is not None:
+            renderer.target = None
+            renderer.draw_color = BLACK + (0xFF,)
+            renderer.clear()
+            self._target.draw()
+        renderer.present()
@@ -0,0 +1,209 @@
+"""
+Module to keep the best scores per level pack and difficulty tier.
+
+Highscores are written on a background thread so the game never waits for
+the disk. The file is replaced atomically and entries written by other
+instances of the game in the meantime are merged in before writing.
+
+class HighscoreTable
+    Top scores per level pack and difficulty tier stored in a JSON file.
+
+function default_data_dir() -> str
+    Directory in which the game stores its data.
+
+function highscore_key(level_pack_name: str, difficulty_tier: int) -> str
+    Key of the scores for a level pack and difficulty tier.
+"""
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import json
+import os
+import queue
+import tempfile
+import threading
+
+DATA_DIR_ENVIRONMENT_VARIABLE = "BRICKS_DATA_DIR"
+HIGHSCORE_FILENAME = "highscores.json"
+TABLE_SIZE = 10
+
+_Scores = Dict[str, List[int]]
+
+
+class HighscoreTable:
+    """
+    Top scores per level pack and difficulty tier stored in a JSON file.
+
+    On construction the table is read from file. Adding a score only
+    updates the table in memory and hands a copy to a writer thread.
+
+    Attributes
+    ----------
+    filename: str
+        JSON file the table is stored in.
+    table_size: int
+        Number of scores kept per key.
+
+    Methods
+    -------
+    scores(self, key: str) -> List[int]:
+        Scores of key, best first.
+    best(self, key: str) -> int:
+        Best score of key or 0 if there is none.
+    add(self, key: str, score: int) -> bool:
+        Adds a score and writes the table in the background.
+    close(self):
+        Waits until all pending writes are done.
+    """
+
+    def __init__(self, filename: str, table_size: int = TABLE_SIZE):
+        self._filename = filename
+        self._table_size = table_size
+        self._scores = _read_scores(filename)
+        self._pending: "queue.Queue[Optional[_Scores]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def table_size(self) -> int:
+        return self._table_size
+
+    def scores(self, key: str) -> List[int]:
+        """Scores of key, best first."""
+        return list(self._scores.get(key, []))
+
+    def best(self, key: str) -> int:
+        """Best score of key or 0 if there is none."""
+        scores = self._scores.get(key)
+        return scores[0] if scores else 0
+
+    def add(self, key: str, score: int) -> bool:
+        """
+        Adds a score and writes the table in the background.
+        Returns False if the score is too low to get into the table.
+        """
+        scores = self._scores.get(key, [])
+        if len(scores) >= self._table_size and score <= scores[-1]:
+            return False
+        scores = sorted(scores + [score], reverse=True)[: self._table_size]
+        self._scores[key] = scores
+        self._start_writer()
+        self._pending.put({key: list(scores)})
+        return True
+
+    def close(self):
+        """Waits until all pending writes are done."""
+        if self._writer is None:
+            return
+        self._pending.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def _start_writer(self):
+        if self._writer is not None:
+            return
+        self._writer = threading.Thread(
+            target=self._write_pending, name="highscore-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _write_pending(self):
+        while True:
+            scores = self._pending.get()
+            if scores is None:
+                return
+            try:
+                _write_scores(self._filename, scores, self._table_size)
+            except (IOError, OSError) as error:
+                print("Couldn't write highscore file (%s)" % error)
+
+
+def default_data_dir() -> str:
+    """
+    Directory in which the game stores its data.
+    Can be set with the environment variable BRICKS_DATA_DIR.
+    Defaults to $XDG_DATA_HOME/bricks or ~/.local/share/bricks.
+    """
+    data_dir = os.environ.get(DATA_DIR_ENVIRONMENT_VARIABLE)
+    if data_dir:
+        return data_dir
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(
+        os.path.expanduser("~"), ".local", "share"
+    )
+    return os.path.join(data_home, "bricks")
+
+
+def highscore_key(level_pack_name: str, difficulty_tier: int) -> str:
+    """Key of the scores for a level pack and difficulty tier."""
+    return "%s/%d" % (level_pack_name, difficulty_tier)
+
+
+def _read_scores(filename: str) -> _Scores:
+    try:
+        with open(filename) as file:
+            data = json.load(file)
+    except (IOError, OSError):
+        return {}
+    except ValueError as error:
+        print("Highscore file is no valid JSON (%s)" % error)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        key: sorted(
+            (score for score in scores if isinstance(score, int)),
+            reverse=True,
+        )
+        for key, scores in data.items()
+        if isinstance(scores, list)
+    }
+
+
+def _write_scores(filename: str, scores: _Scores, table_size: int):
+    """
+    Merges scores with the scores currently in the file and replaces the
+    file atomically.
+    """
+    folder = os.path.dirname(os.path.abspath(filename))
+    os.makedirs(folder, exist_ok=True)
+
+    merged = _read_scores(filename)
+    for key, key_scores in scores.items():
+        merged[key] = _merge_scores([merged.get(key, []), key_scores])
+        merged[key] = merged[key][:table_size]
+
+    file_descriptor, temp_filename = tempfile.mkstemp(
+        dir=folder, prefix=".highscores-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(merged, file, indent=4, sort_keys=True)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
+    except BaseException:
+        os.remove(temp_filename)
+        raise
+
+
+def _merge_scores(score_lists: List[List[int]]) -> List[int]:
+    """
+    Merges score lists which may contain the same entries.
+    Every score is kept as often as it appears in the list which contains it
+    most often.
+    """
+    counts: Dict[int, int] = {}
+    for scores in score_lists:
+        list_counts: Dict[int, int] = {}
+        for score in scores:
+            list_counts[score] = list_counts.get(score, 0) + 1
+        for score, count in list_counts.items():
+            counts[score] = max(counts.get(score, 0), count)
+    merged: List[int] = []
+    for score in sorted(counts, reverse=True):
+        merged.extend([score] * counts[score])
+    return merged
@@ -0,0 +1,133 @@
+"""
+Values shown to the player next to the level.
+
+class HudMode
+    Where the values are shown.
+
+class Hud
+    Tracks the values and updates the display only if they changed.
+"""
+from bricks.renderer import Renderer
+
+from enum import Enum
+from time import perf_counter
+
+
+class HudMode(Enum):
+    TITLE_BAR = 0
+    IN_WINDOW = 1
+
+
+class Hud:
+    """
+    Tracks the values shown to the player and updates the display only if
+    they changed.
+
+    Setting a value only marks the hud as dirty. The display gets updated
+    with flush which should be called once per frame. With a flush interval
+    the display is updated at most once per interval.
+
+    Attributes
+    ----------
+    level: int
+        Index of the current level.
+    lifes: int
+        Lifes left.
+    score: int
+        Current score.
+    highscore: int
+        Best score so far.
+    is_dirty: bool
+        Indicates that a value changed since the last update of the display.
+
+    Methods
+    -------
+    text(self) -> str:
+        Values formatted for display.
+    flush(self, renderer: Renderer, force: bool = False) -> bool:
+        Updates the display if values changed.
+    """
+
+    def __init__(
+        self,
+        mode: HudMode = HudMode.TITLE_BAR,
+        flush_interval_in_ms: float = 0.0,
+    ):
+        self._mode = mode
+        self._flush_interval_in_s = flush_interval_in_ms / 1000.0
+        self._last_flush = -self._flush_interval_in_s
+        self._level = 0
+        self._lifes = 0
+        self._score = 0
+        self._highscore = 0
+        self._is_dirty = True
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @level.setter
+    def level(self, level: int):
+        self._set("_level", level)
+
+    @property
+    def lifes(self) -> int:
+        return self._lifes
+
+    @lifes.setter
+    def lifes(self, lifes: int):
+        self._set("_lifes", lifes)
+
+    @property
+    def score(self) -> int:
+        return self._score
+
+    @score.setter
+    def score(self, score: int):
+        self._set("_score", score)
+
+    @property
+    def highscore(self) -> int:
+        return self._highscore
+
+    @highscore.setter
+    def highscore(self, highscore: int):
+        self._set("_highscore", highscore)
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._is_dirty
+
+    def text(self) -> str:
+        """Values formatted for display."""
+        return "Level: %s     Lifes: %s     Score: %s     Highscore: %s" % (
+            self._level,
+            self._lifes,
+            self._score,
+            self._highscore,
+        )
+
+    def flush(self, renderer: Renderer, force: bool = False) -> bool:
+        """
+        Updates the display if values changed and the flush interval passed.
+        force ignores the flush interval.
+        Returns True if the display was updated.
+        """
+        if not self._is_dirty:
+            return False
+        now = perf_counter()
+        if not force and now - self._last_flush < self._flush_interval_in_s:
+            return False
+
+        if self._mode == HudMode.TITLE_BAR:
+            renderer.window_title = self.text()
+        else:
+            renderer.hud_text = self.text()
+        self._last_flush = now
+        self._is_dirty = False
+        return True
+
+    def _set(self, attribute: str, value: int):
+        if getattr(self, attribute) != value:
+            setattr(self, attribute, value)
+            self._is_dirty = True
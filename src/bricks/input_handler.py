@@ -3,8 +3,12 @@ from bricks.level import Level
 from bricks.game_objects.ball import Ball
 from bricks.game_objects.platform import Platform
 from bricks.game_objects.wall import Wall
+from bricks.platform_control import activate_balls
+from bricks.platform_control import move_platform_left
+from bricks.platform_control import move_platform_right
 
 from enum import Enum
+from typing import List
 
 import pygame
 from pygame.constants import (
@@ -38,6 +42,8 @@ class InputHandler:
     handle_input(self, level: Level, elapsed_time_in_ms: float)
         Checks for events / pressed keys.
         Handle pressed keys.
+    poll(self)
+        Reads pending input between frames.
 
 
     """
@@ -83,13 +89,20 @@ class InputHandler:
             quit - Set state quit.
             left - Move platform to the left, except it reached left wall.
             right - Move platform to the right, except it reached right wall.
-            space - Set ball active.
+            space - Set balls active.
             escape - Set state quit.
             p - Set/reset state pause.
         """
         self._update_input_event()
         self._handle_event(self._input_event, elapsed_time_in_ms, level)
 
+    def poll(self):
+        """
+        Reads pending input between frames.
+        Does nothing here, the input is read once per frame in handle_input.
+        """
+        pass
+
     def _update_input_event(self):
         if self._input_event == self._Event.p:
             self._input_event = self._Event.none
@@ -119,7 +132,7 @@ class InputHandler:
             elapsed_time_in_ms,
             level.left_wall,
             level.right_wall,
-            level.ball,
+            level.balls,
             level.platform,
         )
 
@@ -129,7 +142,7 @@ class InputHandler:
         elapsed_time_in_ms: float,
         left_wall: Wall,
         right_wall: Wall,
-        ball: Ball,
+        balls: List[Ball],
         platform: Platform,
     ):
         if event == self._Event.p:
@@ -149,49 +162,8 @@ class InputHandler:
             return
 
         if event == self._Event.space:
-            if not ball.is_active:
-                ball.is_active = True
+            activate_balls(balls)
         elif event == self._Event.left:
-            if _intersects_with_left_x(platform, left_wall):
-                _put_before_intersects_with_left_x(platform, left_wall)
-            else:
-                _move_left(platform, elapsed_time_in_ms)
+            move_platform_left(platform, left_wall, elapsed_time_in_ms)
         elif event == self._Event.right:
-            if _intersects_with_right_x(platform, right_wall):
-                _put_before_intersects_with_right_x(platform, right_wall)
-            else:
-                _move_right(platform, elapsed_time_in_ms)
-
-
-def _move_left(platform: Platform, elapsed_time_in_ms: float):
-    if platform.velocity > 0:
-        platform.velocity *= -1
-    platform.move(elapsed_time_in_ms)
-
-
-def _move_right(platform: Platform, elapsed_time_in_ms: float):
-    if platform.velocity < 0:
-        platform.velocity *= -1
-    platform.move(elapsed_time_in_ms)
-
-
-def _intersects_with_right_x(platform: Platform, wall: Wall) -> bool:
-    return (
-        platform.bottom_right.x >= wall.top_left.x
-        and platform.top_left.x < wall.top_left.x
-    )
-
-
-def _intersects_with_left_x(platform: Platform, wall: Wall) -> bool:
-    return (
-        platform.top_left.x <= wall.bottom_right.x
-        and platform.bottom_right.x > wall.bottom_right.x
-    )
-
-
-def _put_before_intersects_with_right_x(platform: Platform, wall: Wall):
-    platform.top_left.x = wall.top_left.x - platform.width
-
-
-def _put_before_intersects_with_left_x(platform: Platform, wall: Wall):
-    platform.top_left.x = wall.bottom_right.x
+            move_platform_right(platform, right_wall, elapsed_time_in_ms)
@@ -0,0 +1,203 @@
+"""
+Module to read input events as soon as they arrive.
+
+pygame events carry no timestamp and SDL only delivers them to the thread
+which opened the window. So the pump is polled on the main thread as often
+as possible, e.g. while the game waits for the next frame. Every poll
+stamps the new events and appends them to a ring buffer which the input
+handler drains once per frame.
+
+class TimestampedEvent
+    pygame event with the time in ms it was read.
+
+class InputPump
+    Reads pygame events into a timestamped ring buffer and measures how
+    long they take to take effect.
+"""
+from collections import deque
+from time import perf_counter
+from typing import Callable
+from typing import Deque
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import numpy
+import pygame
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+class TimestampedEvent(NamedTuple):
+    timestamp: float
+    event: pygame.event.Event
+
+
+class InputPump:
+    """
+    Reads pygame events into a timestamped ring buffer and measures how
+    long they take to take effect.
+
+    The events of one poll are assumed to be spread evenly since the
+    previous poll, so the error of a timestamp is at most the time
+    between two polls. If the buffer is full the oldest event is dropped.
+
+    The pump is only used from the main thread, so it needs no lock.
+
+    Latencies of mouse motions are kept apart from the ones of presses.
+    A moving mouse sends far more events than keys and buttons, which
+    would otherwise decide the percentiles.
+
+    Attributes
+    ----------
+    dropped_count: int
+        Number of events dropped because the buffer was full.
+    latency_count: int
+        Number of press latencies currently held in the ring buffer.
+    motion_latency_count: int
+        Number of mouse motion latencies currently held in the ring buffer.
+
+    Methods
+    -------
+    now(self) -> float:
+        Current time of the clock of the pump in ms.
+    poll(self):
+        Reads and timestamps all pending events.
+    drain(self) -> List[TimestampedEvent]:
+        Removes and returns all buffered events, oldest first.
+    record_latency(self, timestamp: float):
+        Stores the time from timestamp of a press until now.
+    record_motion_latency(self, timestamp: float):
+        Stores the time from timestamp of a mouse motion until now.
+    latency_percentiles(self) -> Tuple[float, float, float]:
+        p50, p95 and p99 of the recorded press latencies in ms.
+    motion_latency_percentiles(self) -> Tuple[float, float, float]:
+        p50, p95 and p99 of the recorded mouse motion latencies in ms.
+    latency_summary_line(self) -> str:
+        Press latency percentiles formatted for display.
+    motion_latency_summary_line(self) -> str:
+        Mouse motion latency percentiles formatted for display.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Callable[[], float]] = None,
+        capacity: int = 256,
+        latency_capacity: int = 3600,
+    ):
+        """
+        clock returns the time in ms and replaces perf_counter.
+        Raises ValueError if a capacity is not positive.
+        """
+        if capacity < 1 or latency_capacity < 1:
+            raise ValueError("Capacities must be at least 1")
+        self._clock = clock if clock else _now_in_ms
+        self._events: Deque[TimestampedEvent] = deque(maxlen=capacity)
+        self._last_poll_time = self._clock()
+        self._dropped_count = 0
+        self._latencies = _LatencyRing(latency_capacity)
+        self._motion_latencies = _LatencyRing(latency_capacity)
+
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
+    @property
+    def latency_count(self) -> int:
+        return self._latencies.count
+
+    @property
+    def motion_latency_count(self) -> int:
+        return self._motion_latencies.count
+
+    def now(self) -> float:
+        """Current time of the clock of the pump in ms."""
+        return self._clock()
+
+    def poll(self):
+        """Reads and timestamps all pending events."""
+        now = self._clock()
+        events = pygame.event.get()
+        interval = now - self._last_poll_time
+        overflow = len(self._events) + len(events) - self._events.maxlen
+        if overflow > 0:
+            self._dropped_count += overflow
+        for idx, event in enumerate(events):
+            timestamp = self._last_poll_time + interval * (idx + 1) / (
+                len(events) + 1
+            )
+            self._events.append(TimestampedEvent(timestamp, event))
+        self._last_poll_time = now
+
+    def drain(self) -> List[TimestampedEvent]:
+        """Removes and returns all buffered events, oldest first."""
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        return events
+
+    def record_latency(self, timestamp: float):
+        """Stores the time from timestamp of a press until now."""
+        self._latencies.append(self._clock() - timestamp)
+
+    def record_motion_latency(self, timestamp: float):
+        """Stores the time from timestamp of a mouse motion until now."""
+        self._motion_latencies.append(self._clock() - timestamp)
+
+    def latency_percentiles(self) -> Tuple[float, float, float]:
+        """
+        p50, p95 and p99 of the recorded press latencies in ms.
+        All zero if nothing was recorded.
+        """
+        return self._latencies.percentiles()
+
+    def motion_latency_percentiles(self) -> Tuple[float, float, float]:
+        """
+        p50, p95 and p99 of the recorded mouse motion latencies in ms.
+        All zero if nothing was recorded.
+        """
+        return self._motion_latencies.percentiles()
+
+    def latency_summary_line(self) -> str:
+        """Press latency percentiles formatted for display."""
+        return _summary_line("input lat", self.latency_percentiles())
+
+    def motion_latency_summary_line(self) -> str:
+        """Mouse motion latency percentiles formatted for display."""
+        return _summary_line("mouse lat", self.motion_latency_percentiles())
+
+
+class _LatencyRing:
+    """Ring buffer of the last capacity latencies in ms."""
+
+    def __init__(self, capacity: int):
+        self._values = numpy.zeros(capacity)
+        self._next_idx = 0
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def append(self, latency: float):
+        self._values[self._next_idx] = latency
+        self._next_idx = (self._next_idx + 1) % len(self._values)
+        self._count = min(self._count + 1, len(self._values))
+
+    def percentiles(self) -> Tuple[float, float, float]:
+        if self._count == 0:
+            return (0.0, 0.0, 0.0)
+        values = numpy.percentile(
+            self._values[: self._count], LATENCY_PERCENTILES
+        )
+        return tuple(float(value) for value in values)
+
+
+def _summary_line(name: str, percentiles: Tuple[float, float, float]) -> str:
+    p50, p95, p99 = percentiles
+    return "%-10s %6.2f %6.2f %6.2f" % (name, p50, p95, p99)
+
+
+def _now_in_ms() -> float:
+    return perf_counter() * 1000.0
@@ -0,0 +1,253 @@
+"""
+Module to record the input of a game session and to replay it.
+
+class InputRecording
+    Run-length encoded input events of a session plus start conditions.
+
+class RecordingInputHandler
+    InputHandler which records every handled input event.
+
+class ReplayInputHandler
+    InputHandler which takes the input events from a recording.
+
+write_input_recording_to_file(recording: InputRecording, filename: str):
+    Write a recording to a compact binary file.
+
+read_input_recording_from_file(filename: str) -> InputRecording:
+    Read a recording from a binary file.
+"""
+from bricks.difficulty_curve import Curve
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.difficulty_curve import DifficultyCurves
+from bricks.difficulty_curve import DifficultyTable
+from bricks.difficulty_curve import PARAMETER_NAMES
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.input_handler import InputHandler
+
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import struct
+
+MAGIC = b"BRKR"
+VERSION = 4
+
+_HEADER = struct.Struct("<4sBHBddddI")
+_CURVES = struct.Struct("<I%dd" % (len(PARAMETER_NAMES) * len(Curve._fields)))
+_RUN = struct.Struct("<BI")
+
+
+class InputRecording:
+    """
+    Run-length encoded input events of a session plus start conditions.
+
+    Keys are usually held down for many frames so consecutive frames with
+    the same event are stored as one run.
+
+    Attributes
+    ----------
+    start_level_idx: int
+        Level on which the recorded session started.
+    difficulty_parameters: DifficultyParameters
+        Difficulty at the start of the recorded session. Defaults to the
+        difficulty of the start level in the difficulty_curves, like the
+        Simulation starts without difficulty_parameters.
+    is_fixed_point: bool
+        Indicates that the balls moved on the fixed-point grid. Replays
+        must use the same mode to give the same result.
+    difficulty_curves: DifficultyCurves
+        Difficulty of the levels after the start level. Stored so editing
+        the difficulty file does not change existing recordings.
+    frame_count: int
+        Number of recorded frames.
+
+    Methods
+    -------
+    append(self, event: int):
+        Appends the event of the next frame.
+    events(self) -> Iterator[int]:
+        Yields the event of each recorded frame.
+    """
+
+    def __init__(
+        self,
+        start_level_idx: int = 1,
+        difficulty_parameters: Optional[DifficultyParameters] = None,
+        is_fixed_point: bool = False,
+        difficulty_curves: DifficultyCurves = DEFAULT_CURVES,
+    ):
+        if difficulty_parameters is None:
+            difficulty_parameters = DifficultyTable(
+                difficulty_curves, start_level_idx
+            ).parameters(0, start_level_idx)
+        self._start_level_idx = start_level_idx
+        self._difficulty_parameters = difficulty_parameters
+        self._is_fixed_point = is_fixed_point
+        self._difficulty_curves = difficulty_curves
+        self._runs: List[List[int]] = []
+
+    @property
+    def start_level_idx(self) -> int:
+        return self._start_level_idx
+
+    @property
+    def difficulty_parameters(self) -> DifficultyParameters:
+        return self._difficulty_parameters
+
+    @property
+    def is_fixed_point(self) -> bool:
+        return self._is_fixed_point
+
+    @property
+    def difficulty_curves(self) -> DifficultyCurves:
+        return self._difficulty_curves
+
+    @property
+    def frame_count(self) -> int:
+        return sum(count for _, count in self._runs)
+
+    def append(self, event: int):
+        """Appends the event of the next frame."""
+        if self._runs and self._runs[-1][0] == event:
+            self._runs[-1][1] += 1
+        else:
+            self._runs.append([event, 1])
+
+    def events(self) -> Iterator[int]:
+        """Yields the event of each recorded frame."""
+        for event, count in self._runs:
+            for _ in range(count):
+                yield event
+
+
+class RecordingInputHandler(InputHandler):
+    """
+    InputHandler which records every handled input event.
+
+    Attributes
+    ----------
+    recording: InputRecording
+        Recording the events are appended to.
+    """
+
+    def __init__(self, recording: InputRecording):
+        InputHandler.__init__(self)
+        self._recording = recording
+
+    @property
+    def recording(self) -> InputRecording:
+        return self._recording
+
+    def _update_input_event(self):
+        InputHandler._update_input_event(self)
+        self._recording.append(self._input_event.value)
+
+
+class ReplayInputHandler(InputHandler):
+    """
+    InputHandler which takes the input events from a recording instead of
+    pygame.
+    Requests quit after the last recorded frame.
+    """
+
+    def __init__(self, recording: InputRecording):
+        InputHandler.__init__(self)
+        self._events = recording.events()
+
+    def _update_input_event(self):
+        event = next(self._events, None)
+        if event is None:
+            self._input_event = self._Event.quit
+        else:
+            self._input_event = self._Event(event)
+
+
+def write_input_recording_to_file(recording: InputRecording, filename: str):
+    """
+    Write a recording to a compact binary file.
+
+    Raises IOError if file cannot be opened.
+    """
+    dp = recording.difficulty_parameters
+    with open(filename, "wb") as file:
+        file.write(
+            _HEADER.pack(
+                MAGIC,
+                VERSION,
+                recording.start_level_idx,
+                recording.is_fixed_point,
+                dp.platform_velocity,
+                dp.platform_width,
+                dp.ball_velocity,
+                dp.ball_gravity,
+                len(recording._runs),
+            )
+        )
+        file.write(_pack_curves(recording.difficulty_curves))
+        for event, count in recording._runs:
+            file.write(_RUN.pack(event, count))
+
+
+def read_input_recording_from_file(filename: str) -> InputRecording:
+    """
+    Read a recording from a binary file.
+
+    Raises ValueError if file is no valid recording.
+    Raises IOError if file cannot be opened.
+    """
+    with open(filename, "rb") as file:
+        data = file.read()
+    if len(data) < _HEADER.size + _CURVES.size:
+        raise ValueError("File is too short for a recording: %s" % filename)
+
+    (
+        magic,
+        version,
+        start_level_idx,
+        is_fixed_point,
+        platform_velocity,
+        platform_width,
+        ball_velocity,
+        ball_gravity,
+        run_count,
+    ) = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("File is no recording of version %s" % VERSION)
+    runs_offset = _HEADER.size + _CURVES.size
+    if len(data) != runs_offset + run_count * _RUN.size:
+        raise ValueError("Recording is truncated: %s" % filename)
+
+    recording = InputRecording(
+        start_level_idx=start_level_idx,
+        difficulty_parameters=DifficultyParameters(
+            platform_velocity=platform_velocity,
+            platform_width=platform_width,
+            ball_velocity=ball_velocity,
+            ball_gravity=ball_gravity,
+        ),
+        is_fixed_point=bool(is_fixed_point),
+        difficulty_curves=_unpack_curves(data, _HEADER.size),
+    )
+    for event, count in _RUN.iter_unpack(data[runs_offset:]):
+        recording._runs.append([event, count])
+    return recording
+
+
+def _pack_curves(curves: DifficultyCurves) -> bytes:
+    values = []
+    for name in PARAMETER_NAMES:
+        values.extend(getattr(curves, name))
+    return _CURVES.pack(curves.tier_count, *values)
+
+
+def _unpack_curves(data: bytes, offset: int) -> DifficultyCurves:
+    tier_count, *values = _CURVES.unpack_from(data, offset)
+    field_count = len(Curve._fields)
+    return DifficultyCurves(
+        tier_count=tier_count,
+        **{
+            name: Curve(*values[idx * field_count : (idx + 1) * field_count])
+            for idx, name in enumerate(PARAMETER_NAMES)
+        },
+    )
@@ -6,13 +6,18 @@ class Level
 
 read_level_from_json_file(filename: str) -> Union[Level, None]:
     Read a level from a JSON File.
+
+read_level_from_json_data(data: Dict) -> Level:
+    Make a level from already parsed JSON data.
 """
 from bricks.game_objects.game_object import GameObject
 from bricks.game_objects.ball import Ball
+from bricks.game_objects.fixed_point_ball import FixedPointBall
 from bricks.game_objects.platform import Platform
 from bricks.game_objects.wall import Wall
 from bricks.game_objects.brick import Brick
 from bricks.game_objects.indestructible_brick import IndestructibleBrick
+from bricks.game_objects.spatial_grid import SpatialGrid
 from bricks.difficulty_parameters import DifficultyParameters
 from bricks.types.point import Point
 from bricks.types.angle import Angle
@@ -51,17 +56,24 @@ class Level:
         Top wall on the game board.
     platform: Platform
         Platform on the game board
-    ball: Ball
-        Ball on the game board
+    balls: List[Ball]
+        Balls on the game board
     bricks: List[Brick]
         Bricks on the game board
     indestructible_bricks: List[IndestructibleBrick]
         Indestructible bricks on the game board
-    
+    collision_grid: SpatialGrid
+        Walls and bricks in a grid for fast collision tests.
+    is_fixed_point: bool
+        Indicates that balls move on a fixed-point grid for bit-exact
+        results on all machines.
+
     Methods
     -------
-    reset_ball(self):
-        Resets ball to initial position.
+    reset_balls(self):
+        Resets to a single ball in initial position.
+    add_ball(self, ball: Ball):
+        Adds another ball e.g. from a multi-ball power-up.
     reset_platform(self):
         Resets platform to initial position.
     """
@@ -78,6 +90,7 @@ class Level:
         assert grid_height > 0
 
         self._difficulty_parameters = difficulty_parameters
+        self._is_fixed_point = False
         self._grid_width = grid_width
         self._grid_height = grid_height
         self._left_wall = _make_left_wall(grid_width, grid_height)
@@ -89,12 +102,14 @@ class Level:
             grid_width,
             grid_height,
         )
-        self.ball = _make_ball(
-            difficulty_parameters.ball_velocity,
-            difficulty_parameters.ball_gravity,
-            grid_width,
-            grid_height,
-        )
+        self.balls = [
+            _make_ball(
+                difficulty_parameters.ball_velocity,
+                difficulty_parameters.ball_gravity,
+                grid_width,
+                grid_height,
+            )
+        ]
         self.bricks = bricks
         self.indestructible_bricks = indestructible_bricks
 
@@ -102,12 +117,18 @@ class Level:
         self._grid_height += int(WALL_THICKNESS)
 
         _transpose_coordinates_with_walls(self.platform)
-        _transpose_coordinates_with_walls(self.ball)
+        _transpose_coordinates_with_walls(self.balls[0])
         for brick in self.bricks:
             _transpose_coordinates_with_walls(brick)
         for indestructible_brick in self.indestructible_bricks:
             _transpose_coordinates_with_walls(indestructible_brick)
 
+        self._collision_grid = SpatialGrid(
+            [self._left_wall, self._right_wall, self._top_wall]
+            + self.bricks
+            + self.indestructible_bricks
+        )
+
     @property
     def grid_width(self) -> int:
         return self._grid_width
@@ -128,6 +149,10 @@ class Level:
     def top_wall(self) -> Wall:
         return self._top_wall
 
+    @property
+    def collision_grid(self) -> SpatialGrid:
+        return self._collision_grid
+
     @property
     def difficulty_parameters(self) -> DifficultyParameters:
         return self._difficulty_parameters
@@ -137,17 +162,33 @@ class Level:
         self, difficulty_parameters: DifficultyParameters
     ):
         self._difficulty_parameters = difficulty_parameters
-        self.reset_ball()
+        self.reset_balls()
         self.reset_platform()
 
-    def reset_ball(self):
-        """Resets ball to initial position."""
-        self.ball = _make_ball(
-            self._difficulty_parameters.ball_velocity,
-            self._difficulty_parameters.ball_gravity,
-            self._grid_width,
-            self._grid_height,
-        )
+    @property
+    def is_fixed_point(self) -> bool:
+        return self._is_fixed_point
+
+    @is_fixed_point.setter
+    def is_fixed_point(self, is_fixed_point: bool):
+        self._is_fixed_point = is_fixed_point
+        self.reset_balls()
+
+    def reset_balls(self):
+        """Resets to a single ball in initial position."""
+        self.balls = [
+            _make_ball(
+                self._difficulty_parameters.ball_velocity,
+                self._difficulty_parameters.ball_gravity,
+                self._grid_width,
+                self._grid_height,
+                self._is_fixed_point,
+            )
+        ]
+
+    def add_ball(self, ball: Ball):
+        """Adds another ball e.g. from a multi-ball power-up."""
+        self.balls.append(ball)
 
     def reset_platform(self):
         """Resets platform to initial position."""
@@ -170,23 +211,7 @@ def read_level_from_json_file(filename: str) -> Union[Level, None]:
         with open(filename) as file:
             try:
                 data = json.load(file)
-
-                grid_width: int = data["width"]
-                grid_height: int = data["height"]
-
-                bricks: List[Brick] = _read_bricks_from_json_data(data)
-
-                ind_bricks: List[
-                    IndestructibleBrick
-                ] = _read_indestructible_bricks_from_json_data(data)
-
-                return Level(
-                    difficulty_parameters=DifficultyParameters(),
-                    grid_width=grid_width,
-                    grid_height=grid_height,
-                    bricks=bricks,
-                    indestructible_bricks=ind_bricks,
-                )
+                return read_level_from_json_data(data)
 
             except ValueError as error:
                 print("File is not valid JSON (%s)" % error)
@@ -196,6 +221,31 @@ def read_level_from_json_file(filename: str) -> Union[Level, None]:
         return None
 
 
+def read_level_from_json_data(data: Dict) -> Level:
+    """
+    Make a level from already parsed json data.
+
+    Raises KeyError if mandatory entries are missing.
+    Raises ValueError if brick hitpoints are out of range.
+    """
+    grid_width: int = data["width"]
+    grid_height: int = data["height"]
+
+    bricks: List[Brick] = _read_bricks_from_json_data(data)
+
+    ind_bricks: List[
+        IndestructibleBrick
+    ] = _read_indestructible_bricks_from_json_data(data)
+
+    return Level(
+        difficulty_parameters=DifficultyParameters(),
+        grid_width=grid_width,
+        grid_height=grid_height,
+        bricks=bricks,
+        indestructible_bricks=ind_bricks,
+    )
+
+
 def _read_bricks_from_json_data(data: Dict) -> List[Brick]:
     bricks: List[Brick] = []
     if "bricks" in data:
@@ -266,11 +316,16 @@ def _make_platform(
 
 
 def _make_ball(
-    velocity: float, gravity: float, grid_width: int, grid_height: int
+    velocity: float,
+    gravity: float,
+    grid_width: int,
+    grid_height: int,
+    is_fixed_point: bool = False,
 ) -> Ball:
     point = _ball_init_position(grid_width=grid_width, grid_height=grid_height)
 
-    return Ball(
+    ball_type = FixedPointBall if is_fixed_point else Ball
+    return ball_type(
         top_left=point,
         width=BALL_WIDTH,
         height=BALL_HEIGHT,
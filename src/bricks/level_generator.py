@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Procedural generation of levels from a seed.
+
+class GeneratorParameters
+    Parameters which control the layout of generated levels.
+
+class IndestructiblePattern
+    Patterns for placing indestructible bricks.
+
+generate_level_data(seed: int, parameters: GeneratorParameters) -> Dict:
+    Generates the data of a level in the format of the level files.
+
+generate_level(seed: int, parameters: GeneratorParameters) -> Level:
+    Generates a level ready to be played.
+
+write_level_to_json_file(data: Dict, filename: str):
+    Writes the data of a level to a level file.
+"""
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.indestructible_brick import IndestructibleBrick
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.level import Level
+from bricks.types.point import Point
+
+from bisect import bisect
+from enum import IntEnum
+from itertools import accumulate
+from random import Random
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import argparse
+import json
+import os
+
+
+class IndestructiblePattern(IntEnum):
+    NONE = 0
+    RANDOM = 1
+    PILLARS = 2
+    ROW = 3
+
+
+class GeneratorParameters:
+    """
+    Parameters which control the layout of generated levels.
+
+    Attributes
+    ----------
+    grid_width: int
+        Width of the game board.
+    grid_height: int
+        Height of the game board.
+    brick_width: float
+        Width of a single brick.
+    brick_height: float
+        Height of a single brick.
+    brick_area_height: float
+        Fraction of the board height from the top which can contain bricks.
+        The area below is kept free for the platform and the ball.
+    density: float
+        Probability that a cell in the brick area contains a brick.
+    hitpoint_weights: Sequence[float]
+        Relative weights for hitpoints 1 to 9.
+    indestructible_pattern: IndestructiblePattern
+        How indestructible bricks are placed.
+    indestructible_density: float
+        Probability that a brick is indestructible with pattern RANDOM.
+    """
+
+    def __init__(
+        self,
+        grid_width: int = 26,
+        grid_height: int = 18,
+        brick_width: float = 1.0,
+        brick_height: float = 1.0,
+        brick_area_height: float = 0.5,
+        density: float = 0.6,
+        hitpoint_weights: Sequence[float] = (8, 4, 2, 1, 1, 0, 0, 0, 0),
+        indestructible_pattern: IndestructiblePattern = (
+            IndestructiblePattern.NONE
+        ),
+        indestructible_density: float = 0.05,
+    ):
+        """
+        Raises ValueError if the parameters cannot produce a valid level.
+        """
+        if grid_width < brick_width or grid_height < brick_height:
+            raise ValueError(
+                "level_generator.GeneratorParameters:\n"
+                "Board must be at least the size of one brick\n"
+            )
+        if len(hitpoint_weights) != 9 or sum(hitpoint_weights) <= 0:
+            raise ValueError(
+                "level_generator.GeneratorParameters:\n"
+                "hitpoint_weights must contain 9 weights with sum > 0\n"
+                "hitpoint_weights: %s\n" % (hitpoint_weights,)
+            )
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.brick_width = brick_width
+        self.brick_height = brick_height
+        self.brick_area_height = brick_area_height
+        self.density = density
+        self.hitpoint_weights = tuple(hitpoint_weights)
+        self.indestructible_pattern = indestructible_pattern
+        self.indestructible_density = indestructible_density
+
+
+def generate_level_data(
+    seed: int, parameters: GeneratorParameters = GeneratorParameters()
+) -> Dict:
+    """
+    Generates the data of a level in the format of the level files.
+    The same seed and parameters always generate the same level.
+    """
+    bricks, ind_bricks = _generate_cells(seed, parameters)
+    w = parameters.brick_width
+    h = parameters.brick_height
+    return {
+        "width": parameters.grid_width,
+        "height": parameters.grid_height,
+        "bricks": [
+            {
+                "top_left_x": x,
+                "top_left_y": y,
+                "width": w,
+                "height": h,
+                "hitpoints": hp,
+            }
+            for x, y, hp in bricks
+        ],
+        "indestructible bricks": [
+            {"top_left_x": x, "top_left_y": y, "width": w, "height": h}
+            for x, y in ind_bricks
+        ],
+    }
+
+
+def generate_level(
+    seed: int,
+    parameters: GeneratorParameters = GeneratorParameters(),
+    difficulty_parameters: Optional[DifficultyParameters] = None,
+) -> Level:
+    """
+    Generates a level ready to be played.
+    Skips the detour over the level file format.
+    """
+    bricks, ind_bricks = _generate_cells(seed, parameters)
+    w = parameters.brick_width
+    h = parameters.brick_height
+    if difficulty_parameters is None:
+        difficulty_parameters = DifficultyParameters()
+    return Level(
+        difficulty_parameters=difficulty_parameters,
+        grid_width=parameters.grid_width,
+        grid_height=parameters.grid_height,
+        bricks=[
+            Brick(top_left=Point(x, y), width=w, height=h, hitpoints=hp)
+            for x, y, hp in bricks
+        ],
+        indestructible_bricks=[
+            IndestructibleBrick(top_left=Point(x, y), width=w, height=h)
+            for x, y in ind_bricks
+        ],
+    )
+
+
+def write_level_to_json_file(data: Dict, filename: str):
+    """
+    Writes the data of a level to a level file.
+
+    Raises IOError if file cannot be opened.
+    """
+    with open(filename, "w") as file:
+        json.dump(data, file, indent=4)
+
+
+def _generate_cells(
+    seed: int, parameters: GeneratorParameters
+) -> Tuple[List[Tuple[float, float, int]], List[Tuple[float, float]]]:
+    p = parameters
+    random = Random(seed)
+    columns = int(p.grid_width / p.brick_width)
+    rows = max(1, int(p.grid_height * p.brick_area_height / p.brick_height))
+    cum_weights = list(accumulate(p.hitpoint_weights))
+    total_weight = cum_weights[-1]
+    indestructible_cells = _indestructible_cells(random, columns, rows, p)
+
+    bricks: List[Tuple[float, float, int]] = []
+    ind_bricks: List[Tuple[float, float]] = []
+    for row in range(rows):
+        y = row * p.brick_height
+        for column in range(columns):
+            x = column * p.brick_width
+            if (column, row) in indestructible_cells:
+                ind_bricks.append((x, y))
+            elif random.random() < p.density:
+                hitpoints = 1 + bisect(
+                    cum_weights, random.random() * total_weight
+                )
+                bricks.append((x, y, min(hitpoints, 9)))
+
+    if not bricks:
+        column = random.randrange(columns)
+        row = random.randrange(rows)
+        ind_bricks = [
+            cell
+            for cell in ind_bricks
+            if cell != (column * p.brick_width, row * p.brick_height)
+        ]
+        bricks.append((column * p.brick_width, row * p.brick_height, 1))
+    return bricks, ind_bricks
+
+
+def _indestructible_cells(
+    random: Random, columns: int, rows: int, p: GeneratorParameters
+) -> set:
+    if p.indestructible_pattern == IndestructiblePattern.RANDOM:
+        return {
+            (column, row)
+            for row in range(rows)
+            for column in range(columns)
+            if random.random() < p.indestructible_density
+        }
+    if p.indestructible_pattern == IndestructiblePattern.PILLARS:
+        spacing = random.randint(3, 6)
+        offset = random.randrange(spacing)
+        return {
+            (column, row)
+            for row in range(1, rows)
+            for column in range(offset, columns, spacing)
+        }
+    if p.indestructible_pattern == IndestructiblePattern.ROW:
+        gap = random.randint(3, 5)
+        return {
+            (column, rows - 1)
+            for column in range(columns)
+            if column % gap != 0
+        }
+    return set()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate levels for stress runs and benchmarks."
+    )
+    parser.add_argument("folder", help="Output folder for the level files")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=26)
+    parser.add_argument("--height", type=int, default=18)
+    parser.add_argument("--density", type=float, default=0.6)
+    parser.add_argument(
+        "--pattern",
+        choices=[pattern.name.lower() for pattern in IndestructiblePattern],
+        default="none",
+    )
+    args = parser.parse_args()
+
+    parameters = GeneratorParameters(
+        grid_width=args.width,
+        grid_height=args.height,
+        density=args.density,
+        indestructible_pattern=IndestructiblePattern[args.pattern.upper()],
+    )
+    os.makedirs(args.folder, exist_ok=True)
+    digits = len(str(args.count))
+    for idx in range(args.count):
+        filename = os.path.join(
+            args.folder, "%s.json" % str(idx + 1).zfill(digits)
+        )
+        write_level_to_json_file(
+            generate_level_data(args.seed + idx, parameters), filename
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+"""
+Loading and validation of all levels stored in a folder.
+
+class LevelPack
+    Validated data of all levels in a folder.
+
+load_level_pack(folder_name: str, max_workers: int = None,
+                cache_dir: str = None) -> LevelPack:
+    Validates and parses all levels of a folder, in parallel if there is
+    enough to parse.
+
+validate_level_data(data: Dict) -> List[str]:
+    Returns all schema errors found in the data of a level.
+"""
+from bricks.highscore_table import default_data_dir
+from bricks.level import Level, read_level_from_json_data
+
+from hashlib import sha256
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import json
+import os
+import pathlib
+import tempfile
+
+BRICK_KEYS = ("top_left_x", "top_left_y", "width", "height", "hitpoints")
+INDESTRUCTIBLE_BRICK_KEYS = ("top_left_x", "top_left_y", "width", "height")
+
+HITPOINTS_MIN = 1
+HITPOINTS_MAX = 9
+
+PARALLEL_PARSE_MIN_BYTES = 1 << 20
+
+CACHE_FILENAME = "level_pack_cache.json"
+_CACHE_VERSION = 1
+
+
+class _CacheEntry(NamedTuple):
+    mtime_ns: int
+    size: int
+    digest: str
+    data: Optional[Dict]
+    errors: List[str]
+
+
+_cache: Dict[str, _CacheEntry] = {}
+
+
+class LevelPack:
+    """
+    Validated data of all levels in a folder.
+
+    The data of the levels is kept instead of Level objects because a level
+    gets modified while it is played. Every call of make_level returns a
+    fresh level.
+
+    Attributes
+    ----------
+    filenames: List[str]
+        Sorted filenames of all valid levels.
+    errors: Dict[str, List[str]]
+        Schema errors of all invalid levels by filename.
+
+    Methods
+    -------
+    make_level(self, level_idx: int) -> Level:
+        Makes a new level from the data of the level with index level_idx.
+    """
+
+    def __init__(self, level_datas: List[Tuple[str, Dict]], errors):
+        self._filenames = [filename for filename, _ in level_datas]
+        self._datas = [data for _, data in level_datas]
+        self._errors: Dict[str, List[str]] = errors
+
+    def __len__(self) -> int:
+        return len(self._datas)
+
+    @property
+    def filenames(self) -> List[str]:
+        return self._filenames
+
+    @property
+    def errors(self) -> Dict[str, List[str]]:
+        return self._errors
+
+    def make_level(self, level_idx: int) -> Level:
+        """
+        Makes a new level from the data of the level with index level_idx.
+        Indices start at 1.
+        """
+        assert 1 <= level_idx <= len(self._datas)
+        return read_level_from_json_data(self._datas[level_idx - 1])
+
+
+def load_level_pack(
+    folder_name: str,
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> LevelPack:
+    """
+    Validates and parses all levels with the ending .json in a folder.
+
+    Files which are unchanged since the last call are taken from a cache
+    which is keyed by path, modification time, size and content hash. The
+    cache is kept in memory and stored as JSON in the file CACHE_FILENAME
+    in cache_dir, so later processes find it too. cache_dir defaults to
+    default_data_dir(). Nothing is read from the level folder except the
+    levels, because level packs are copied from others. If the cache file
+    cannot be written the cache only lasts as long as the process.
+    All remaining files get parsed and validated in parallel on a process
+    pool if they have at least PARALLEL_PARSE_MIN_BYTES together. Smaller
+    files are parsed faster than a pool starts, so they are parsed in this
+    process.
+    All errors of all files are collected in LevelPack.errors instead of
+    stopping on the first invalid file.
+    """
+    filenames = _get_level_filenames_from_folder(folder_name)
+    folder_key = str(pathlib.Path(folder_name).absolute())
+    if cache_dir is None:
+        cache_dir = default_data_dir()
+    cache_filename = os.path.join(cache_dir, CACHE_FILENAME)
+    if any(filename not in _cache for filename in filenames):
+        folders = _read_cache_file(cache_filename)
+        for filename, entry in folders.get(folder_key, {}).items():
+            _cache.setdefault(filename, entry)
+
+    entries: Dict[str, _CacheEntry] = {}
+    misses: List[Tuple[str, int, str, bytes]] = []
+    is_cache_changed = False
+
+    for filename in filenames:
+        try:
+            stat = os.stat(filename)
+            cached = _cache.get(filename)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                entries[filename] = cached
+                continue
+            with open(filename, "rb") as file:
+                content = file.read()
+        except IOError as error:
+            entries[filename] = _CacheEntry(
+                0, 0, "", None, ["Couldn't open level file (%s)" % error]
+            )
+            continue
+
+        digest = sha256(content).hexdigest()
+        if cached is not None and cached.digest == digest:
+            entries[filename] = cached._replace(
+                mtime_ns=stat.st_mtime_ns, size=len(content)
+            )
+            is_cache_changed = True
+        else:
+            misses.append((filename, stat.st_mtime_ns, digest, content))
+
+    for filename, mtime_ns, digest, content, (data, errors) in _parse_all(
+        misses, max_workers
+    ):
+        entries[filename] = _CacheEntry(
+            mtime_ns, len(content), digest, data, errors
+        )
+        is_cache_changed = True
+
+    _cache.update(entries)
+    if is_cache_changed:
+        _write_cache_file(cache_filename, folder_key, entries)
+
+    level_datas: List[Tuple[str, Dict]] = []
+    level_errors: Dict[str, List[str]] = {}
+    for filename in filenames:
+        entry = entries[filename]
+        if entry.errors:
+            level_errors[filename] = entry.errors
+        else:
+            level_datas.append((filename, entry.data))
+    return LevelPack(level_datas, level_errors)
+
+
+def validate_level_data(data: Dict) -> List[str]:
+    """
+    Returns all schema errors found in the data of a level.
+
+    Checks for missing keys, hitpoints out of range 1 to 9, bricks outside
+    the board and bricks which overlap each other.
+    An empty list means the data is valid.
+    """
+    if not isinstance(data, dict):
+        return ["Level must be a JSON object"]
+
+    errors: List[str] = []
+    for key in ("width", "height"):
+        if key not in data:
+            errors.append("Missing key '%s'" % key)
+        elif not _is_number(data[key]) or data[key] <= 0:
+            errors.append("'%s' must be > 0: %s" % (key, data[key]))
+    if errors:
+        return errors
+
+    rects: List[Tuple[float, float, float, float, str]] = []
+    for section, keys in (
+        ("bricks", BRICK_KEYS),
+        ("indestructible bricks", INDESTRUCTIBLE_BRICK_KEYS),
+    ):
+        for idx, brick_data in enumerate(data.get(section, [])):
+            name = "%s[%s]" % (section, idx)
+            brick_errors = _validate_brick_data(
+                brick_data, keys, data["width"], data["height"]
+            )
+            if brick_errors:
+                errors.extend("%s: %s" % (name, e) for e in brick_errors)
+                continue
+            x = brick_data["top_left_x"]
+            y = brick_data["top_left_y"]
+            rects.append(
+                (x, y, x + brick_data["width"], y + brick_data["height"], name)
+            )
+
+    for name_a, name_b in _find_overlapping_rects(rects):
+        errors.append("%s overlaps with %s" % (name_a, name_b))
+    return errors
+
+
+def _validate_brick_data(
+    brick_data: Dict, keys: Tuple[str, ...], grid_width, grid_height
+) -> List[str]:
+    if not isinstance(brick_data, dict):
+        return ["Brick must be a JSON object"]
+
+    errors: List[str] = []
+    for key in keys:
+        if key not in brick_data:
+            errors.append("Missing key '%s'" % key)
+        elif not _is_number(brick_data[key]):
+            errors.append("'%s' must be a number" % key)
+    if errors:
+        return errors
+
+    if "hitpoints" in keys:
+        hitpoints = brick_data["hitpoints"]
+        if (
+            not isinstance(hitpoints, int)
+            or not HITPOINTS_MIN <= hitpoints <= HITPOINTS_MAX
+        ):
+            errors.append(
+                "hitpoints must be in range %s to %s: %s"
+                % (HITPOINTS_MIN, HITPOINTS_MAX, hitpoints)
+            )
+
+    x = brick_data["top_left_x"]
+    y = brick_data["top_left_y"]
+    w = brick_data["width"]
+    h = brick_data["height"]
+    if w <= 0 or h <= 0:
+        errors.append("width and height must be > 0")
+    elif x < 0 or y < 0 or x + w > grid_width or y + h > grid_height:
+        errors.append(
+            "Outside of board %sx%s: x=%s y=%s width=%s height=%s"
+            % (grid_width, grid_height, x, y, w, h)
+        )
+    return errors
+
+
+def _find_overlapping_rects(
+    rects: List[Tuple[float, float, float, float, str]]
+) -> List[Tuple[str, str]]:
+    """
+    Sweep over the rects sorted by left x. Only rects which are still open
+    on the x axis need to be compared. Touching edges are not an overlap.
+    """
+    overlaps: List[Tuple[str, str]] = []
+    open_rects: List[Tuple[float, float, float, float, str]] = []
+    for rect in sorted(rects, key=lambda r: r[0]):
+        left, top, right, bottom, name = rect
+        open_rects = [r for r in open_rects if r[2] > left]
+        for other in open_rects:
+            if other[1] < bottom and top < other[3]:
+                overlaps.append((other[4], name))
+        open_rects.append(rect)
+    return overlaps
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_all(
+    misses: List[Tuple[str, int, str, bytes]], max_workers: Optional[int]
+):
+    contents = [content for _, _, _, content in misses]
+    size = sum(len(content) for content in contents)
+    if len(misses) > 1 and size >= PARALLEL_PARSE_MIN_BYTES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_parse_and_validate, contents))
+    else:
+        results = [_parse_and_validate(content) for content in contents]
+
+    for (filename, mtime_ns, digest, content), result in zip(
+        misses, results
+    ):
+        yield filename, mtime_ns, digest, content, result
+
+
+def _parse_and_validate(content: bytes) -> Tuple[Optional[Dict], List[str]]:
+    try:
+        data = json.loads(content)
+    except ValueError as error:
+        return None, ["File is not valid JSON (%s)" % error]
+    errors = validate_level_data(data)
+    if errors:
+        return None, errors
+    return data, []
+
+
+def _read_cache_file(
+    cache_filename: str,
+) -> Dict[str, Dict[str, _CacheEntry]]:
+    """
+    Cache entries by filename by level folder.
+    An unreadable or outdated cache file is treated like an empty one.
+    """
+    try:
+        with open(cache_filename) as file:
+            data = json.load(file)
+        if data.get("version") != _CACHE_VERSION:
+            return {}
+        return {
+            folder_key: {
+                filename: _CacheEntry(*entry)
+                for filename, entry in entries.items()
+            }
+            for folder_key, entries in data["folders"].items()
+        }
+    except (IOError, OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
+
+
+def _write_cache_file(
+    cache_filename: str, folder_key: str, entries: Dict[str, _CacheEntry]
+):
+    """
+    Replaces the entries of the folder and keeps the ones of other
+    folders. Writes to a temporary file first, so a process loading levels
+    at the same time never reads a half written cache file.
+    """
+    folders = _read_cache_file(cache_filename)
+    folders[folder_key] = entries
+    data = {
+        "version": _CACHE_VERSION,
+        "folders": {
+            key: {
+                filename: list(entry)
+                for filename, entry in folder_entries.items()
+            }
+            for key, folder_entries in folders.items()
+        },
+    }
+    try:
+        folder = os.path.dirname(os.path.abspath(cache_filename))
+        os.makedirs(folder, exist_ok=True)
+        file_descriptor, temp_filename = tempfile.mkstemp(
+            dir=folder, prefix=".level_pack_cache-", suffix=".tmp"
+        )
+    except (IOError, OSError):
+        return
+    try:
+        with os.fdopen(file_descriptor, "w") as file:
+            json.dump(data, file)
+        os.replace(temp_filename, cache_filename)
+    except (IOError, OSError):
+        os.remove(temp_filename)
+
+
+def _get_level_filenames_from_folder(folder_name: str) -> List[str]:
+    filenames: List[str] = []
+    for filepath in pathlib.Path(folder_name).glob("**/*.json"):
+        filenames.append(str(filepath.absolute()))
+    return sorted(filenames)
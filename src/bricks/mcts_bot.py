@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+Bot which plays by Monte Carlo tree search on snapshots of the simulation.
+
+For every frame the state of the simulation is taken as snapshot. Action
+sequences are tried out on private headless simulations restored from that
+snapshot. The first action of the sequences which lost the least lifes and
+scored the most is played.
+
+class SearchParameters
+    Parameters which control the tree search.
+
+class MctsBot
+    Chooses the action for each frame of a simulation.
+
+function play(simulation: Simulation, bot: MctsBot, frame_count: int):
+    Lets the bot play a simulation for frame_count frames or until the game
+    is over.
+
+function tracking_action(simulation: Simulation) -> Action:
+    Moves the platform center below the lowest ball.
+"""
+from bricks.level_pack import LevelPack
+from bricks.level_pack import load_level_pack
+from bricks.simulation import Action
+from bricks.simulation import FRAMES_PER_SECOND
+from bricks.simulation import POINTS_PER_BRICK_HITPOINTS
+from bricks.simulation import Simulation
+
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from math import log
+from math import sqrt
+from time import perf_counter
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import argparse
+import random
+
+SEARCH_ACTIONS = (Action.NONE, Action.LEFT, Action.RIGHT)
+
+TIME_BUDGET_IN_MS = 8.0
+TRACKING_TOLERANCE = 0.5
+MIN_VISIT_COUNT = 4
+
+# (visit count, value sum) of every action in SEARCH_ACTIONS
+RootStatistics = List[Tuple[int, float]]
+
+
+class SearchParameters:
+    """
+    Parameters which control the tree search.
+
+    Attributes
+    ----------
+    frames_per_action: int
+        Number of frames an action of the tree is held.
+    rollout_frames: int
+        Number of frames played after a new node. The rollouts move the
+        platform below the ball.
+    random_rollout_share: float
+        Probability that a rollout action is random instead.
+    exploration: float
+        Weight of exploration in the UCT formula.
+    life_penalty: float
+        Value of a lost life. One hitpoint of a brick is worth 1.0.
+    distance_penalty: float
+        Value of the distance between ball and platform at the end of a
+        rollout relative to the grid width. Guides the platform below the
+        ball while no brick or life is within reach of the rollouts.
+    """
+
+    def __init__(
+        self,
+        frames_per_action: int = 4,
+        rollout_frames: int = 60,
+        random_rollout_share: float = 0.0,
+        exploration: float = 1.0,
+        life_penalty: float = 10.0,
+        distance_penalty: float = 1.0,
+    ):
+        """
+        Raises ValueError if frames_per_action or rollout_frames is not
+        positive.
+        """
+        if frames_per_action < 1 or rollout_frames < 1:
+            raise ValueError(
+                "mcts_bot.SearchParameters:\n"
+                "frames_per_action and rollout_frames must be >= 1\n"
+            )
+        self.frames_per_action = frames_per_action
+        self.rollout_frames = rollout_frames
+        self.random_rollout_share = random_rollout_share
+        self.exploration = exploration
+        self.life_penalty = life_penalty
+        self.distance_penalty = distance_penalty
+
+
+class MctsBot:
+    """
+    Chooses the action for each frame of a simulation.
+
+    While no ball is active the balls are started with SPACE. Otherwise a
+    searched action is held for frames_per_action frames. While it is held
+    the bot already searches the next action, starting from the state in
+    which the held action ends. The simulation is deterministic, so this
+    state is predicted exactly from a snapshot. Every frame adds
+    time_budget_in_ms of search, so each decision gets frames_per_action
+    times the budget while no frame takes much longer than the budget.
+
+    Each worker searches its own trees and the statistics of the root
+    actions are summed up (root parallelization). The action with the best
+    mean value is played. With worker_count 1 the search runs in the
+    calling thread. Otherwise it runs in a thread pool or, with
+    use_processes, in a process pool. Only snapshot bytes are sent to the
+    worker processes.
+
+    Attributes
+    ----------
+    parameters: SearchParameters
+        Parameters of the search.
+    time_budget_in_ms: float
+        Time each worker searches per frame.
+    worker_count: int
+        Number of searches which run in parallel.
+    last_iteration_count: int
+        Number of iterations of all workers in the last frame.
+
+    Methods
+    -------
+    choose_action(self, simulation: Simulation) -> Action:
+        Action for the next frame of simulation.
+    close(self):
+        Shuts down the worker pool.
+    """
+
+    def __init__(
+        self,
+        level_pack: LevelPack,
+        is_fixed_point: bool = False,
+        time_budget_in_ms: float = TIME_BUDGET_IN_MS,
+        worker_count: int = 1,
+        use_processes: bool = False,
+        parameters: Optional[SearchParameters] = None,
+        iteration_limit: Optional[int] = None,
+        seed: int = 0,
+    ):
+        """
+        level_pack and is_fixed_point must match the played simulation.
+        iteration_limit set runs exactly that many iterations per worker
+        and frame instead of using the time budget, which makes the bot
+        repeatable.
+
+        Raises ValueError if worker_count is not positive.
+        """
+        if worker_count < 1:
+            raise ValueError("worker_count must be at least 1")
+        if parameters is None:
+            parameters = SearchParameters()
+        self._parameters = parameters
+        self._time_budget_in_ms = time_budget_in_ms
+        self._worker_count = worker_count
+        self._iteration_limit = iteration_limit
+        self._random = random.Random(seed)
+        self._predictor = Simulation(level_pack, is_fixed_point=is_fixed_point)
+        self._held_action = Action.NONE
+        self._held_frame_count = 0
+        self._planned_snapshot: Optional[bytes] = None
+        self._visit_counts = [0] * len(SEARCH_ACTIONS)
+        self._value_sums = [0.0] * len(SEARCH_ACTIONS)
+        self._last_iteration_count = 0
+        self._searches: List[_Search] = []
+        self._executor: Optional[Executor] = None
+        if use_processes and worker_count > 1:
+            self._executor = ProcessPoolExecutor(
+                worker_count,
+                initializer=_init_worker_process,
+                initargs=(level_pack, is_fixed_point, parameters),
+            )
+        else:
+            self._searches = [
+                _Search(level_pack, is_fixed_point, parameters)
+                for _ in range(worker_count)
+            ]
+            if worker_count > 1:
+                self._executor = ThreadPoolExecutor(worker_count)
+
+    @property
+    def parameters(self) -> SearchParameters:
+        return self._parameters
+
+    @property
+    def time_budget_in_ms(self) -> float:
+        return self._time_budget_in_ms
+
+    @time_budget_in_ms.setter
+    def time_budget_in_ms(self, time_budget_in_ms: float):
+        self._time_budget_in_ms = time_budget_in_ms
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    @property
+    def last_iteration_count(self) -> int:
+        return self._last_iteration_count
+
+    def choose_action(self, simulation: Simulation) -> Action:
+        """
+        Action for the next frame of simulation.
+        Searches for at most about time_budget_in_ms.
+        """
+        self._last_iteration_count = 0
+        if simulation.is_game_over or simulation.is_level_cleared:
+            return Action.NONE
+        if not any(ball.is_active for ball in simulation.level.balls):
+            self._held_frame_count = 0
+            return Action.SPACE
+
+        if self._held_frame_count == 0:
+            snapshot = simulation.snapshot()
+            is_searched = snapshot != self._planned_snapshot
+            if is_searched:
+                self._reset_statistics()
+                self._search(snapshot)
+            self._held_action = self._best_action(simulation)
+            self._held_frame_count = self._parameters.frames_per_action
+            self._planned_snapshot = self._predict(
+                snapshot, self._held_action, self._held_frame_count
+            )
+            self._reset_statistics()
+        else:
+            is_searched = False
+
+        if not is_searched and self._planned_snapshot is not None:
+            self._search(self._planned_snapshot)
+        self._held_frame_count -= 1
+        return self._held_action
+
+    def close(self):
+        """Shuts down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _search(self, snapshot: bytes):
+        budget_in_s = self._time_budget_in_ms / 1000.0
+        seeds = [
+            self._random.getrandbits(32) for _ in range(self._worker_count)
+        ]
+        if self._executor is None:
+            results = [
+                self._searches[0].run(
+                    snapshot, budget_in_s, self._iteration_limit, seeds[0]
+                )
+            ]
+        elif self._searches:
+            futures = [
+                self._executor.submit(
+                    search.run,
+                    snapshot,
+                    budget_in_s,
+                    self._iteration_limit,
+                    seed,
+                )
+                for search, seed in zip(self._searches, seeds)
+            ]
+            results = [future.result() for future in futures]
+        else:
+            futures = [
+                self._executor.submit(
+                    _run_in_worker_process,
+                    snapshot,
+                    budget_in_s,
+                    self._iteration_limit,
+                    seed,
+                )
+                for seed in seeds
+            ]
+            results = [future.result() for future in futures]
+
+        for statistics in results:
+            for idx, (visit_count, value_sum) in enumerate(statistics):
+                self._visit_counts[idx] += visit_count
+                self._value_sums[idx] += value_sum
+                self._last_iteration_count += visit_count
+
+    def _reset_statistics(self):
+        self._visit_counts = [0] * len(SEARCH_ACTIONS)
+        self._value_sums = [0.0] * len(SEARCH_ACTIONS)
+
+    def _best_action(self, simulation: Simulation) -> Action:
+        """
+        Action with the best mean value. While the search is too short to
+        try each action a few times the platform follows the ball instead.
+        """
+        visit_counts = self._visit_counts
+        value_sums = self._value_sums
+        if min(visit_counts) < MIN_VISIT_COUNT:
+            return tracking_action(simulation)
+        best_idx = max(
+            range(len(SEARCH_ACTIONS)),
+            key=lambda idx: value_sums[idx] / visit_counts[idx],
+        )
+        return SEARCH_ACTIONS[best_idx]
+
+    def _predict(
+        self, snapshot: bytes, action: Action, frame_count: int
+    ) -> Optional[bytes]:
+        """
+        Snapshot after action was held for frame_count frames.
+        None if nothing is left to search in this state.
+        """
+        predictor = self._predictor
+        predictor.restore(snapshot)
+        for _ in range(frame_count):
+            predictor.step(action)
+        predictor.event_queue.drain()
+        if predictor.is_game_over or predictor.is_level_cleared:
+            return None
+        if not any(ball.is_active for ball in predictor.level.balls):
+            return None
+        return predictor.snapshot()
+
+
+class _Node:
+    __slots__ = ("children", "visit_count", "value_sum")
+
+    def __init__(self):
+        self.children: List[Optional[_Node]] = [None] * len(SEARCH_ACTIONS)
+        self.visit_count = 0
+        self.value_sum = 0.0
+
+
+class _Search:
+    """Tree search of one worker on its own headless simulation."""
+
+    def __init__(
+        self,
+        level_pack: LevelPack,
+        is_fixed_point: bool,
+        parameters: SearchParameters,
+    ):
+        self._simulation = Simulation(
+            level_pack, is_fixed_point=is_fixed_point
+        )
+        self._parameters = parameters
+
+    def run(
+        self,
+        snapshot: bytes,
+        budget_in_s: float,
+        iteration_limit: Optional[int],
+        seed: int,
+    ) -> RootStatistics:
+        rng = random.Random(seed)
+        root = _Node()
+        deadline = perf_counter() + budget_in_s
+        iteration_count = 0
+        while True:
+            self._iterate(root, snapshot, rng)
+            iteration_count += 1
+            if iteration_limit is not None:
+                if iteration_count >= iteration_limit:
+                    break
+            elif perf_counter() >= deadline:
+                break
+        return [
+            (child.visit_count, child.value_sum) if child else (0, 0.0)
+            for child in root.children
+        ]
+
+    def _iterate(self, root: _Node, snapshot: bytes, rng: random.Random):
+        simulation = self._simulation
+        simulation.restore(snapshot)
+        parameters = self._parameters
+
+        path = [root]
+        node = root
+        value = 0.0
+        is_done = False
+        while not is_done and None not in node.children:
+            idx = _select_child(node, parameters.exploration)
+            step_value, is_done = self._advance(
+                SEARCH_ACTIONS[idx], parameters.frames_per_action
+            )
+            value += step_value
+            node = node.children[idx]
+            path.append(node)
+
+        if not is_done:
+            idx = rng.choice(
+                [idx for idx, child in enumerate(node.children) if not child]
+            )
+            step_value, is_done = self._advance(
+                SEARCH_ACTIONS[idx], parameters.frames_per_action
+            )
+            value += step_value
+            node.children[idx] = _Node()
+            path.append(node.children[idx])
+
+        frame = 0
+        while not is_done and frame < parameters.rollout_frames:
+            if rng.random() < parameters.random_rollout_share:
+                action = rng.choice(SEARCH_ACTIONS)
+            else:
+                action = tracking_action(simulation)
+            step_value, is_done = self._advance(
+                action, parameters.frames_per_action
+            )
+            value += step_value
+            frame += parameters.frames_per_action
+
+        if not is_done:
+            value -= parameters.distance_penalty * _ball_distance(simulation)
+        simulation.event_queue.drain()
+
+        for node in path:
+            node.visit_count += 1
+            node.value_sum += value
+
+    def _advance(self, action: Action, frame_count: int) -> Tuple[float, bool]:
+        simulation = self._simulation
+        lifes = simulation.lifes
+        score = simulation.score
+        is_life_lost = False
+        for _ in range(frame_count):
+            simulation.step(action)
+            is_life_lost = simulation.lifes < lifes or simulation.is_game_over
+            if is_life_lost or simulation.is_level_cleared:
+                break
+        value = (simulation.score - score) / (
+            POINTS_PER_BRICK_HITPOINTS * simulation.level_idx
+        )
+        if is_life_lost:
+            value -= self._parameters.life_penalty
+        return value, is_life_lost or simulation.is_level_cleared
+
+
+def _select_child(node: _Node, exploration: float) -> int:
+    log_visits = log(node.visit_count)
+    best_idx = 0
+    best_score = float("-inf")
+    for idx, child in enumerate(node.children):
+        score = child.value_sum / child.visit_count + exploration * sqrt(
+            log_visits / child.visit_count
+        )
+        if score > best_score:
+            best_idx = idx
+            best_score = score
+    return best_idx
+
+
+def tracking_action(simulation: Simulation) -> Action:
+    """Moves the platform center below the lowest ball."""
+    offset = _ball_offset(simulation)
+    if offset < -TRACKING_TOLERANCE:
+        return Action.LEFT
+    if offset > TRACKING_TOLERANCE:
+        return Action.RIGHT
+    return Action.NONE
+
+
+def _ball_distance(simulation: Simulation) -> float:
+    """Horizontal distance of the lowest ball to the platform center."""
+    return abs(_ball_offset(simulation)) / simulation.level.grid_width
+
+
+def _ball_offset(simulation: Simulation) -> float:
+    level = simulation.level
+    if not level.balls:
+        return 0.0
+    ball = max(level.balls, key=lambda ball: ball.top_left.y)
+    platform = level.platform
+    ball_x = ball.top_left.x + ball.width / 2.0
+    platform_x = platform.top_left.x + platform.width / 2.0
+    return ball_x - platform_x
+
+
+_worker_search: Optional[_Search] = None
+
+
+def _init_worker_process(
+    level_pack: LevelPack,
+    is_fixed_point: bool,
+    parameters: SearchParameters,
+):
+    global _worker_search
+    _worker_search = _Search(level_pack, is_fixed_point, parameters)
+
+
+def _run_in_worker_process(
+    snapshot: bytes,
+    budget_in_s: float,
+    iteration_limit: Optional[int],
+    seed: int,
+) -> RootStatistics:
+    return _worker_search.run(snapshot, budget_in_s, iteration_limit, seed)
+
+
+def play(simulation: Simulation, bot: MctsBot, frame_count: int):
+    """
+    Lets the bot play a simulation for frame_count frames or until the game
+    is over. After a cleared level the next level is started.
+    """
+    for _ in range(frame_count):
+        simulation.step(bot.choose_action(simulation))
+        simulation.event_queue.drain()
+        if simulation.is_game_over:
+            return
+        if simulation.is_level_cleared:
+            simulation.start_next_level()
+            simulation.event_queue.drain()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Let the tree search bot play without a window."
+    )
+    parser.add_argument(
+        "--seconds",
+        type=float,
+        default=60.0,
+        help="Game time to play in seconds",
+    )
+    parser.add_argument(
+        "--level", type=int, default=1, help="Level to start with"
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=TIME_BUDGET_IN_MS,
+        help="Search time per frame in ms",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of parallel searches"
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Search in processes instead of threads",
+    )
+    parser.add_argument(
+        "--fixed-point",
+        action="store_true",
+        help="Move the ball on a fixed-point grid",
+    )
+    args = parser.parse_args()
+
+    level_pack = load_level_pack("level")
+    simulation = Simulation(
+        level_pack,
+        start_level_idx=args.level,
+        is_fixed_point=args.fixed_point,
+    )
+    bot = MctsBot(
+        level_pack,
+        is_fixed_point=args.fixed_point,
+        time_budget_in_ms=args.budget_ms,
+        worker_count=args.workers,
+        use_processes=args.processes,
+    )
+    frame_count = int(args.seconds * FRAMES_PER_SECOND)
+    start = perf_counter()
+    try:
+        play(simulation, bot, frame_count)
+    finally:
+        bot.close()
+    elapsed_in_s = perf_counter() - start
+    print(
+        "Level: %d  Tier: %d  Lifes: %d  Score: %d"
+        % (
+            simulation.level_idx,
+            simulation.difficulty_tier,
+            simulation.lifes,
+            simulation.score,
+        )
+    )
+    print(
+        "%d frames in %.1f s (%.1f ms per frame)"
+        % (frame_count, elapsed_in_s, elapsed_in_s * 1000.0 / frame_count)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Scaling of game objects from grid coordinates to pixel coordinates."""
+from bricks.game_objects.game_object import GameObject
+
+from typing import Tuple
+
+
+class PixelScaling:
+    """
+    Scales game objects from grid coordinates to pixel coordinates.
+
+    Pixel coordinates are truncated towards zero like pygame.Rect does.
+
+    Attributes
+    ----------
+    width_factor: float
+        Pixels per grid unit in x direction.
+    height_factor: float
+        Pixels per grid unit in y direction.
+
+    Methods
+    -------
+    to_pixel_rect(self, obj: GameObject) -> Tuple[int, int, int, int]:
+        x, y, width and height of obj in pixels.
+    """
+
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        grid_width: int,
+        grid_height: int,
+    ):
+        self._width_factor = screen_width / grid_width
+        self._height_factor = screen_height / grid_height
+
+    @property
+    def width_factor(self) -> float:
+        return self._width_factor
+
+    @property
+    def height_factor(self) -> float:
+        return self._height_factor
+
+    def to_pixel_rect(self, obj: GameObject) -> Tuple[int, int, int, int]:
+        """x, y, width and height of obj in pixels."""
+        return (
+            int(obj.top_left.x * self._width_factor),
+            int(obj.top_left.y * self._height_factor),
+            int(obj.width * self._width_factor),
+            int(obj.height * self._height_factor),
+        )
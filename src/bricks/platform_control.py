@@ -0,0 +1,48 @@
+"""
+Functions to control the platform and the balls from player actions.
+
+The platform is moved by move_platform of the movement solver, which
+keeps it between the walls.
+
+function move_platform_left(platform: Platform, left_wall: Wall,
+    elapsed_time_in_ms: float)
+    Moves the platform to the left, but not into the left wall.
+
+function move_platform_right(platform: Platform, right_wall: Wall,
+    elapsed_time_in_ms: float)
+    Moves the platform to the right, but not into the right wall.
+
+function activate_balls(balls: List[Ball])
+    Sets all balls active.
+"""
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.movement_solver import move_platform
+from bricks.game_objects.platform import Platform
+from bricks.game_objects.wall import Wall
+
+from typing import List
+
+
+def move_platform_left(
+    platform: Platform, left_wall: Wall, elapsed_time_in_ms: float
+):
+    """Moves the platform to the left, but not into the left wall."""
+    if platform.velocity > 0:
+        platform.velocity *= -1
+    move_platform(platform, left_wall, None, elapsed_time_in_ms)
+
+
+def move_platform_right(
+    platform: Platform, right_wall: Wall, elapsed_time_in_ms: float
+):
+    """Moves the platform to the right, but not into the right wall."""
+    if platform.velocity < 0:
+        platform.velocity *= -1
+    move_platform(platform, None, right_wall, elapsed_time_in_ms)
+
+
+def activate_balls(balls: List[Ball]):
+    """Sets all balls active."""
+    for ball in balls:
+        if not ball.is_active:
+            ball.is_active = True
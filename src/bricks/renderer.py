@@ -1,22 +1,53 @@
-"""Module to render level on the screen."""
+"""
+Module to render level on the screen.
+
+The window can be resizable. The pixel rects of walls and bricks, which do
+not move, are computed once per level and again only when the size
+changes. On weak machines the level can be rendered at a lower internal
+resolution which is scaled up to the window.
+
+class Renderer
+    Renders the level with pygame surfaces.
+
+function draw_tile(surface: pygame.Surface, rect: pygame.Rect,
+    color: RGBColor):
+    Draws rect with highlighted edges like all objects of the level.
+
+function surface_as_array(surface: pygame.Surface,
+    out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    Copies the pixels of surface into a RGB array.
+"""
 from bricks.game_objects.ball import Ball
 from bricks.game_objects.brick import Brick
 from bricks.game_objects.game_object import GameObject
-from bricks.game_objects.indestructible_brick import IndestructibleBrick
 from bricks.game_objects.platform import Platform
-from bricks.game_objects.wall import Wall
 from bricks.types.rgb_color import RGBColor
 from bricks.level import Level
+from bricks.pixel_scaling import PixelScaling
+
+from bricks.font_atlas import FontAtlas
 
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy
 import pygame
 
 BLACK = (0, 0, 0)
 
+HUD_COLOR = (0x1E, 0x1E, 0x1E)
+OVERLAY_COLOR = (0xFF, 0xFF, 0xFF)
+OVERLAY_FONT_SIZE = 18
+
+MIN_RENDER_SCALE = 0.1
+
 
 class Renderer:
     """
     Class to render level on the screen.
-    Only one instance of the class should be used at the same time.
+    Only one instance of the class should be used at the same time unless
+    it renders offscreen.
 
     Attributes
     ----------
@@ -24,11 +55,30 @@ class Renderer:
         Indicates if game is in state pause.
     window_title: str
         Defines what is shown on the window title screen.
+    hud_text: str
+        Text which is drawn on the top wall of the level.
+    overlay_lines: List[str]
+        Lines of text which are shown on top of the level. e.g. profiling
+        results.
+
+    is_offscreen: bool
+        Indicates that the level is rendered into a surface without a
+        window.
+    screen_size: Tuple[int, int]
+        Width and height of the window or offscreen surface in pixels.
+    render_size: Tuple[int, int]
+        Width and height in pixels in which the level is rendered before
+        it gets scaled to the screen size.
 
     Mehods
     ------
     render(self, level: Level):
         Renders the level on the screen. 
+    resize(self, screen_width: int, screen_height: int):
+        Changes the size of the window or offscreen surface.
+    frame_as_array(self, out: Optional[numpy.ndarray] = None)
+        -> numpy.ndarray:
+        Copies the last rendered frame into a RGB array.
     """
 
     def __init__(
@@ -37,20 +87,49 @@ class Renderer:
         screen_height: int,
         grid_width: int,
         grid_height: int,
+        is_offscreen: bool = False,
+        is_resizable: bool = False,
+        render_scale: float = 1.0,
     ):
-        self._screen_width = screen_width
-        self._screen_height = screen_height
+        """
+        is_offscreen set to True renders into a surface of screen_width x
+        screen_height without opening a window. Frames can then be read
+        with frame_as_array.
+        is_resizable set to True lets the user resize the window. The level
+        is scaled to the new size on the next render.
+        render_scale below 1.0 renders the level at that fraction of the
+        screen size and scales it up with pygame.transform.scale.
+
+        Raises ValueError if render_scale is not in range MIN_RENDER_SCALE
+        to 1.0.
+        """
+        if not MIN_RENDER_SCALE <= render_scale <= 1.0:
+            raise ValueError(
+                "render_scale must be in range %s to 1.0" % MIN_RENDER_SCALE
+            )
         self._grid_width = grid_width
         self._grid_height = grid_height
-        self._width_factor = screen_width / grid_width
-        self._height_factor = screen_height / grid_height
+        self._is_offscreen = is_offscreen
+        self._is_resizable = is_resizable
+        self._render_scale = render_scale
 
-        self._screen = pygame.display.set_mode((screen_width, screen_height))
-        self._screen.fill(BLACK)
         self._is_paused = False
         self._window_title = ""
+        self._overlay_lines: List[str] = []
+        self._overlay_surfaces: List[pygame.Surface] = []
+        self._overlay_font = None
+        self._hud_text = ""
+        self._hud_surface: Optional[pygame.Surface] = None
+        self._hud_font_atlas: Optional[FontAtlas] = None
+
+        self._static_level: Optional[Level] = None
+        self._static_bricks: List[Brick] = []
+        self._wall_rects: List[pygame.Rect] = []
+        self._brick_rects: List[pygame.Rect] = []
+        self._indestructible_brick_rects: List[pygame.Rect] = []
 
-        pygame.display.flip()
+        self.resize(screen_width, screen_height)
+        self._update_screen()
 
     @property
     def is_paused(self) -> bool:
@@ -60,6 +139,18 @@ class Renderer:
     def is_paused(self, is_paused: bool):
         self._is_paused = is_paused
 
+    @property
+    def is_offscreen(self) -> bool:
+        return self._is_offscreen
+
+    @property
+    def screen_size(self) -> Tuple[int, int]:
+        return self._screen_width, self._screen_height
+
+    @property
+    def render_size(self) -> Tuple[int, int]:
+        return self._render_width, self._render_height
+
     @property
     def window_title(self) -> str:
         return self._window_title
@@ -67,26 +158,161 @@ class Renderer:
     @window_title.setter
     def window_title(self, window_title: str):
         self._window_title = window_title
-        pygame.display.set_caption(window_title)
+        if not self._is_offscreen:
+            self._show_window_title(window_title)
+
+    @property
+    def hud_text(self) -> str:
+        return self._hud_text
+
+    @hud_text.setter
+    def hud_text(self, hud_text: str):
+        self._hud_text = hud_text
+        self._render_hud_text()
+
+    def _render_hud_text(self):
+        if self._hud_font_atlas is None:
+            self._hud_font_atlas = FontAtlas(
+                int(self._scaling.height_factor), HUD_COLOR
+            )
+        self._hud_surface = self._hud_font_atlas.render(self._hud_text)
+
+    @property
+    def overlay_lines(self) -> List[str]:
+        return self._overlay_lines
+
+    @overlay_lines.setter
+    def overlay_lines(self, overlay_lines: List[str]):
+        self._overlay_lines = overlay_lines
+        if self._overlay_font is None:
+            pygame.font.init()
+            self._overlay_font = pygame.font.Font(None, OVERLAY_FONT_SIZE)
+        self._overlay_surfaces = [
+            self._overlay_font.render(line, True, OVERLAY_COLOR, BLACK)
+            for line in overlay_lines
+        ]
 
     def render(self, level: Level):
         """
         Renders the level on the screen. 
         Changes color of level to grayscale if paused active.
+        If the user resized the window the level is scaled to the new size.
         """
+        if not self._is_offscreen:
+            width, height = self._window_size()
+            if (width, height) != self.screen_size:
+                self._apply_size(width, height)
+        if not self._are_static_rects_cached(level):
+            self._cache_static_rects(level)
+
         self._clear_screen()
-        self._render_ball(level.ball)
+        for ball in level.balls:
+            self._render_ball(ball)
         self._render_platform(level.platform)
-        self._render_wall(level.left_wall)
-        self._render_wall(level.right_wall)
-        self._render_wall(level.top_wall)
-
-        for brick in level.bricks:
-            self._render_brick(brick)
-        for indestructible_brick in level.indestructible_bricks:
-            self._render_indestructible_brick(indestructible_brick)
+        brown = RGBColor(0xBF, 0x80, 0x40)
+        for rect in self._wall_rects:
+            self._render_rect(rect, brown)
+
+        for brick, rect in zip(level.bricks, self._brick_rects):
+            if not brick.is_destroyed():
+                self._render_rect(rect, _get_brick_draw_color(brick))
+        red = RGBColor(0xFF, 0x00, 0x00)
+        for rect in self._indestructible_brick_rects:
+            self._render_rect(rect, red)
+        self._render_hud()
+        self._render_overlay()
         self._update_screen()
 
+    def resize(self, screen_width: int, screen_height: int):
+        """
+        Changes the size of the window or offscreen surface.
+        The level is scaled to the new size on the next render.
+
+        Raises ValueError if a size is not positive.
+        """
+        if screen_width < 1 or screen_height < 1:
+            raise ValueError("Screen size must be at least 1 x 1")
+        self._open_window(screen_width, screen_height)
+        self._apply_size(screen_width, screen_height)
+
+    def _apply_size(self, screen_width: int, screen_height: int):
+        self._screen_width = screen_width
+        self._screen_height = screen_height
+        self._render_width = max(1, int(screen_width * self._render_scale))
+        self._render_height = max(
+            1, int(screen_height * self._render_scale)
+        )
+        self._open_render_target(self._render_width, self._render_height)
+        self._scaling = PixelScaling(
+            self._render_width,
+            self._render_height,
+            self._grid_width,
+            self._grid_height,
+        )
+        self._static_level = None
+        if self._hud_font_atlas is not None:
+            self._hud_font_atlas = None
+            self._render_hud_text()
+
+    def _are_static_rects_cached(self, level: Level) -> bool:
+        return (
+            level is self._static_level
+            and level.bricks is self._static_bricks
+            and len(level.bricks) == len(self._brick_rects)
+            and len(level.indestructible_bricks)
+            == len(self._indestructible_brick_rects)
+        )
+
+    def _cache_static_rects(self, level: Level):
+        self._static_level = level
+        self._static_bricks = level.bricks
+        self._wall_rects = [
+            self._to_pygame_rect(wall)
+            for wall in (level.left_wall, level.right_wall, level.top_wall)
+        ]
+        self._brick_rects = [
+            self._to_pygame_rect(brick) for brick in level.bricks
+        ]
+        self._indestructible_brick_rects = [
+            self._to_pygame_rect(brick)
+            for brick in level.indestructible_bricks
+        ]
+
+    def frame_as_array(
+        self, out: Optional[numpy.ndarray] = None
+    ) -> numpy.ndarray:
+        """
+        Copies the last rendered frame into a RGB array of shape
+        (screen_height, screen_width, 3).
+        If out is given the frame is copied into it instead of allocating a
+        new array.
+        """
+        return surface_as_array(self._window, out)
+
+    # The methods below draw with pygame surfaces. Other backends override
+    # them and share the rest.
+
+    def _open_window(self, screen_width: int, screen_height: int):
+        size = (screen_width, screen_height)
+        if self._is_offscreen:
+            self._window = pygame.Surface(size)
+        else:
+            flags = pygame.RESIZABLE if self._is_resizable else 0
+            self._window = pygame.display.set_mode(size, flags)
+        self._window.fill(BLACK)
+
+    def _open_render_target(self, render_width: int, render_height: int):
+        if self._render_scale == 1.0:
+            self._screen = self._window
+        else:
+            self._screen = pygame.Surface((render_width, render_height))
+
+    def _window_size(self) -> Tuple[int, int]:
+        return self._window.get_size()
+
+    def _show_window_title(self, window_title: str):
+        pygame.display.set_caption(window_title)
+
     def _clear_screen(self):
         white = RGBColor(0x1E, 0x1E, 0x1E)
         if not self._is_paused:
@@ -94,8 +320,29 @@ class Renderer:
         else:
             self._screen.fill(white.grayscale().as_tuple())
 
+    def _render_hud(self):
+        if self._hud_surface is not None:
+            self._screen.blit(self._hud_surface, self._hud_position())
+
+    def _hud_position(self) -> Tuple[float, float]:
+        height_factor = self._scaling.height_factor
+        y = (height_factor - self._hud_surface.get_height()) / 2.0
+        x = self._scaling.width_factor * 1.5
+        return x, y
+
+    def _render_overlay(self):
+        y = 0
+        for surface in self._overlay_surfaces:
+            self._screen.blit(surface, (0, y))
+            y += surface.get_height()
+
     def _update_screen(self):
-        pygame.display.update()
+        if self._screen is not self._window:
+            pygame.transform.scale(
+                self._screen, self._window.get_size(), self._window
+            )
+        if not self._is_offscreen:
+            pygame.display.update()
 
     def _render_ball(self, ball: Ball):
         light_blue = RGBColor(0xCC, 0xFF, 0xFF)
@@ -105,58 +352,57 @@ class Renderer:
         gray = RGBColor(0xBF, 0xBF, 0xBF)
         self._render_game_object(platform, gray)
 
-    def _render_wall(self, wall: Wall):
-        brown = RGBColor(0xBF, 0x80, 0x40)
-        self._render_game_object(wall, brown)
-
-    def _render_brick(self, brick: Brick):
-        if brick.is_destroyed():
-            return
-        color = _get_brick_draw_color(brick)
-        self._render_game_object(brick, color)
-
-    def _render_indestructible_brick(
-        self, indestructibleBrick: IndestructibleBrick
-    ):
-        red = RGBColor(0xFF, 0x00, 0x00)
-        self._render_game_object(indestructibleBrick, red)
-
     def _render_game_object(self, obj: GameObject, color: RGBColor):
+        self._render_rect(self._to_pygame_rect(obj), color)
+
+    def _render_rect(self, rect: pygame.Rect, color: RGBColor):
         if self.is_paused:
             color = color.grayscale()
-        rect = self._to_pygame_rect(obj)
-        pygame.draw.rect(self._screen, color.as_tuple(), rect)
-        self._draw_highlights(rect, color)
-
-    def _draw_highlights(self, rect: pygame.Rect, color: RGBColor):
-        x = rect.x
-        y = rect.y
-        w = rect.width
-        h = rect.height
-
-        draw_color = color.lighter().as_tuple()
-        pygame.draw.line(self._screen, draw_color, (x, y + h), (x, y))
-        pygame.draw.line(self._screen, draw_color, (x + 1, y + h), (x + 1, y))
-        pygame.draw.line(self._screen, draw_color, (x, y), (x + w, y))
-        pygame.draw.line(self._screen, draw_color, (x, y + 1), (x + w, y + 1))
-
-        draw_color = color.darker().as_tuple()
-        pygame.draw.line(self._screen, draw_color, (x, y + h), (x + w, y + h))
-        pygame.draw.line(
-            self._screen, draw_color, (x, y + h - 1), (x + w, y + h - 1)
-        )
-        pygame.draw.line(self._screen, draw_color, (x + w, y + h), (x + w, y))
-        pygame.draw.line(
-            self._screen, draw_color, (x + w - 1, y + h), (x + w - 1, y)
-        )
+        draw_tile(self._screen, rect, color)
 
     def _to_pygame_rect(self, obj: GameObject) -> pygame.Rect:
-        return pygame.Rect(
-            obj.top_left.x * self._width_factor,
-            obj.top_left.y * self._height_factor,
-            obj.width * self._width_factor,
-            obj.height * self._height_factor,
-        )
+        return pygame.Rect(self._scaling.to_pixel_rect(obj))
+
+
+def draw_tile(surface: pygame.Surface, rect: pygame.Rect, color: RGBColor):
+    """
+    Draws rect filled with color and with a lighter top left and darker
+    bottom right edge. The edges reach one pixel beyond the right and the
+    bottom of rect.
+    """
+    x = rect.x
+    y = rect.y
+    w = rect.width
+    h = rect.height
+    pygame.draw.rect(surface, color.as_tuple(), rect)
+
+    draw_color = color.lighter().as_tuple()
+    pygame.draw.line(surface, draw_color, (x, y + h), (x, y))
+    pygame.draw.line(surface, draw_color, (x + 1, y + h), (x + 1, y))
+    pygame.draw.line(surface, draw_color, (x, y), (x + w, y))
+    pygame.draw.line(surface, draw_color, (x, y + 1), (x + w, y + 1))
+
+    draw_color = color.darker().as_tuple()
+    pygame.draw.line(surface, draw_color, (x, y + h), (x + w, y + h))
+    pygame.draw.line(surface, draw_color, (x, y + h - 1), (x + w, y + h - 1))
+    pygame.draw.line(surface, draw_color, (x + w, y + h), (x + w, y))
+    pygame.draw.line(surface, draw_color, (x + w - 1, y + h), (x + w - 1, y))
+
+
+def surface_as_array(
+    surface: pygame.Surface, out: Optional[numpy.ndarray] = None
+) -> numpy.ndarray:
+    """
+    Copies the pixels of surface into a RGB array of shape
+    (height, width, 3), into out if it is given.
+    """
+    if out is None:
+        width, height = surface.get_size()
+        out = numpy.empty((height, width, 3), dtype=numpy.uint8)
+    pixels = pygame.surfarray.pixels3d(surface)
+    numpy.copyto(out, pixels.swapaxes(0, 1))
+    del pixels
+    return out
 
 
 def _get_brick_draw_color(brick: Brick) -> RGBColor:
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Module to export recorded sessions as video or GIF without a window.
+
+The replay is rendered offscreen as fast as possible. Frames are handed
+through a bounded queue to a writer thread which streams them as raw RGB
+into the stdin of an encoder process, so rendering and encoding overlap.
+
+class FramePipe
+    Streams frames through a bounded queue into an encoder process.
+
+function ffmpeg_command(filename: str, width: int, height: int, fps: float)
+    -> List[str]:
+    Command line of ffmpeg to encode raw RGB frames from stdin.
+
+function export_replay(recording: InputRecording, filename: str, ...) -> int:
+    Renders a recording offscreen and encodes it to filename.
+"""
+from bricks.audio_device import AudioDevice
+from bricks.game import FRAMES_PER_SECOND
+from bricks.game import Game
+from bricks.game import LEVEL_FOLDER
+from bricks.game import SCREEN_HEIGHT
+from bricks.game import SCREEN_WIDTH
+from bricks.hud import HudMode
+from bricks.input_recording import InputRecording
+from bricks.input_recording import ReplayInputHandler
+from bricks.input_recording import read_input_recording_from_file
+from bricks.level import Level
+from bricks.level_pack import load_level_pack
+from bricks.renderer import Renderer
+
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import argparse
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+
+import numpy
+
+QUEUE_SIZE = 8
+
+EncoderCommand = Callable[[str, int, int, float], List[str]]
+
+
+class FramePipe:
+    """
+    Streams frames through a bounded queue into an encoder process.
+
+    queue_size + 1 frame buffers are allocated once. A buffer is taken with
+    acquire, filled and handed over with submit. The writer thread returns
+    it after writing so no frame is allocated while exporting. acquire
+    blocks if the encoder falls behind.
+
+    Methods
+    -------
+    acquire(self) -> numpy.ndarray:
+        Free frame buffer to fill.
+    submit(self, frame: numpy.ndarray):
+        Queues a filled frame buffer for writing.
+    close(self):
+        Writes all queued frames and waits for the encoder.
+    """
+
+    def __init__(
+        self,
+        command: List[str],
+        frame_shape: Tuple[int, int, int],
+        queue_size: int = QUEUE_SIZE,
+    ):
+        self._process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        self._free: "queue.Queue[numpy.ndarray]" = queue.Queue()
+        self._filled: "queue.Queue[Optional[numpy.ndarray]]" = queue.Queue()
+        for _ in range(queue_size + 1):
+            self._free.put(numpy.empty(frame_shape, dtype=numpy.uint8))
+        self._error: Optional[Exception] = None
+        self._writer = threading.Thread(
+            target=self._write_frames, name="frame-writer", daemon=True
+        )
+        self._writer.start()
+
+    def acquire(self) -> numpy.ndarray:
+        """Free frame buffer to fill."""
+        return self._free.get()
+
+    def submit(self, frame: numpy.ndarray):
+        """Queues a filled frame buffer for writing."""
+        self._filled.put(frame)
+
+    def close(self):
+        """
+        Writes all queued frames and waits for the encoder.
+        Raises IOError if the encoder could not be fed or failed.
+        """
+        self._filled.put(None)
+        self._writer.join()
+        try:
+            self._process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self._process.wait()
+        if self._error is not None:
+            raise IOError("Couldn't write to encoder (%s)" % self._error)
+        if returncode != 0:
+            raise IOError("Encoder exited with code %d" % returncode)
+
+    def _write_frames(self):
+        stdin = self._process.stdin
+        while True:
+            frame = self._filled.get()
+            if frame is None:
+                return
+            if self._error is None:
+                try:
+                    stdin.write(frame.data)
+                except (BrokenPipeError, OSError) as error:
+                    self._error = error
+            self._free.put(frame)
+
+
+class _CapturingRenderer(Renderer):
+    """Offscreen renderer which submits every frame_skip-th frame."""
+
+    def __init__(
+        self,
+        screen_width: int,
+        screen_height: int,
+        grid_width: int,
+        grid_height: int,
+        pipe: FramePipe,
+        frame_skip: int,
+    ):
+        super().__init__(
+            screen_width=screen_width,
+            screen_height=screen_height,
+            grid_width=grid_width,
+            grid_height=grid_height,
+            is_offscreen=True,
+        )
+        self._pipe = pipe
+        self._frame_skip = frame_skip
+        self._rendered_count = 0
+        self._written_count = 0
+
+    @property
+    def written_count(self) -> int:
+        return self._written_count
+
+    def render(self, level: Level):
+        super().render(level)
+        self._rendered_count += 1
+        if (self._rendered_count - 1) % self._frame_skip != 0:
+            return
+        frame = self._pipe.acquire()
+        self.frame_as_array(frame)
+        self._pipe.submit(frame)
+        self._written_count += 1
+
+
+def ffmpeg_command(
+    filename: str, width: int, height: int, fps: float
+) -> List[str]:
+    """Command line of ffmpeg to encode raw RGB frames from stdin."""
+    command = [
+        "ffmpeg",
+        "-y",
+        "-loglevel",
+        "error",
+        "-f",
+        "rawvideo",
+        "-pix_fmt",
+        "rgb24",
+        "-s",
+        "%dx%d" % (width, height),
+        "-r",
+        "%g" % fps,
+        "-i",
+        "-",
+    ]
+    if filename.lower().endswith(".gif"):
+        command += [
+            "-vf",
+            "split[a][b];[a]palettegen[p];[b][p]paletteuse",
+        ]
+    else:
+        command += ["-pix_fmt", "yuv420p"]
+    return command + [filename]
+
+
+def export_replay(
+    recording: InputRecording,
+    filename: str,
+    scale: float = 1.0,
+    frame_skip: int = 1,
+    queue_size: int = QUEUE_SIZE,
+    encoder_command: EncoderCommand = ffmpeg_command,
+) -> int:
+    """
+    Renders a recording offscreen and encodes it to filename.
+
+    scale scales the resolution of the game window. Frames are rendered
+    directly in the output resolution. Width and height are rounded down to
+    even numbers which most video codecs need.
+    frame_skip writes only every frame_skip-th frame. The frame rate of the
+    output is reduced accordingly so the clip keeps the speed of the game.
+    The balls move in the mode the recording was made in.
+    No sound is played.
+
+    Returns the number of written frames.
+    Raises ValueError if scale or frame_skip are not positive.
+    Raises IOError if the encoder failed.
+    """
+    if scale <= 0.0:
+        raise ValueError("scale must be positive")
+    if frame_skip < 1:
+        raise ValueError("frame_skip must be at least 1")
+
+    width = _even(SCREEN_WIDTH * scale)
+    height = _even(SCREEN_HEIGHT * scale)
+    fps = FRAMES_PER_SECOND / frame_skip
+    level_pack = load_level_pack(LEVEL_FOLDER)
+    level = level_pack.make_level(recording.start_level_idx)
+
+    pipe = FramePipe(
+        encoder_command(filename, width, height, fps),
+        (height, width, 3),
+        queue_size,
+    )
+    renderer = _CapturingRenderer(
+        screen_width=width,
+        screen_height=height,
+        grid_width=level.grid_width,
+        grid_height=level.grid_height,
+        pipe=pipe,
+        frame_skip=frame_skip,
+    )
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            game = Game(
+                width,
+                height,
+                input_handler=ReplayInputHandler(recording),
+                is_frame_limited=False,
+                start_level_idx=recording.start_level_idx,
+                difficulty_parameters=recording.difficulty_parameters,
+                difficulty_curves=recording.difficulty_curves,
+                hud_mode=HudMode.IN_WINDOW,
+                data_dir=data_dir,
+                renderer=renderer,
+                is_fixed_point=recording.is_fixed_point,
+                level_pack=level_pack,
+                audio_device=AudioDevice(is_silent=True),
+            )
+            game.run()
+            game.close()
+    finally:
+        pipe.close()
+    return renderer.written_count
+
+
+def _even(value: float) -> int:
+    return max(2, int(value) // 2 * 2)
+
+
+def main():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    parser = argparse.ArgumentParser(
+        description="Export a recorded session as video or GIF with ffmpeg."
+    )
+    parser.add_argument("recording", help="Recording made with --record")
+    parser.add_argument("output", help="e.g. clip.mp4 or clip.gif")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Scale of the resolution"
+    )
+    parser.add_argument(
+        "--frame-skip",
+        type=int,
+        default=1,
+        help="Write only every n-th frame",
+    )
+    args = parser.parse_args()
+
+    recording = read_input_recording_from_file(args.recording)
+    frame_count = export_replay(
+        recording,
+        args.output,
+        scale=args.scale,
+        frame_skip=args.frame_skip,
+    )
+    print("Wrote %d frames to %s" % (frame_count, args.output))
+
+
+if __name__ == "__main__":
+    main()
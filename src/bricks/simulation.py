@@ -0,0 +1,515 @@
+"""
+Game logic of a session without rendering, sound or input devices.
+
+class Action
+    Actions a player can do in a frame.
+
+class Simulation
+    Level, score, lifes and difficulty of a session and the rules to advance
+    them frame by frame.
+"""
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.difficulty_curve import DifficultyCurves
+from bricks.difficulty_curve import DifficultyTable
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.frame_profiler import FrameProfiler
+from bricks.frame_profiler import NullFrameProfiler
+from bricks.game_events import AllLevelsCleared
+from bricks.game_events import BallLost
+from bricks.game_events import BrickDestroyed
+from bricks.game_events import BrickHit
+from bricks.game_events import EventQueue
+from bricks.game_events import ExtraLife
+from bricks.game_events import GameOver
+from bricks.game_events import LevelCleared
+from bricks.game_events import LevelStarted
+from bricks.game_events import PlatformHit
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.fixed_point_ball import FixedPointBall
+from bricks.game_objects.game_object import GameObject
+from bricks.game_objects.movement_solver import solve_tick
+from bricks.game_objects.platform import Platform
+from bricks.level import Level
+from bricks.level_pack import LevelPack
+from bricks.platform_control import activate_balls
+from bricks.platform_control import move_platform_left
+from bricks.platform_control import move_platform_right
+from bricks.types.angle import Angle
+from bricks.types.angle import Quadrant
+from bricks.types.point import Point
+
+from enum import IntEnum
+from typing import List
+from typing import Optional
+
+import struct
+
+FRAMES_PER_SECOND = 60
+MS_PER_FRAME = 1000 / FRAMES_PER_SECOND
+
+POINTS_PER_BRICK_HITPOINTS = 100
+POINTS_FOR_EXTRA_LIVE = 10000
+
+START_LIFES = 5
+
+SNAPSHOT_MAGIC = b"BRKS"
+SNAPSHOT_VERSION = 1
+
+_SNAPSHOT_HEADER = struct.Struct("<4sBHiqiHBddddddddHI")
+_SNAPSHOT_BALL = struct.Struct("<ddddddBd?")
+
+_IS_GAME_OVER = 1
+_IS_LEVEL_CLEARED = 2
+
+
+class Action(IntEnum):
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    SPACE = 3
+
+
+class Simulation:
+    """
+    Level, score, lifes and difficulty of a session and the rules to advance
+    them frame by frame.
+
+    Nothing is rendered or played. Everything which happens is pushed as
+    event to event_queue. The queue is not drained by the simulation.
+
+    Attributes
+    ----------
+    level: Level
+        Level which is currently played.
+    level_idx: int
+        Index of the current level in the level pack starting with 1.
+    score: int
+        Current score.
+    lifes: int
+        Lifes left.
+    difficulty_parameters: DifficultyParameters
+        Difficulty of the current level. Setting it resets the balls and
+        the platform, so it should be set between lifes.
+    difficulty_tier: int
+        Number of times all levels were cleared in this session.
+    difficulty_table: DifficultyTable
+        Difficulty of every level in every tier.
+    is_game_over: bool
+        Indicates that the last life was lost.
+    is_level_cleared: bool
+        Indicates that all bricks of the level are destroyed.
+    event_queue: EventQueue
+        Queue the events of the simulation are pushed to.
+
+    Methods
+    -------
+    apply_action(self, action: Action, elapsed_time_in_ms: float):
+        Moves the platform or activates the balls.
+    update(self, elapsed_time_in_ms: float):
+        Moves the balls and resolves lost balls and collisions.
+    step(self, action: Action, elapsed_time_in_ms: float = MS_PER_FRAME):
+        Applies the action and updates the simulation by one frame.
+    start_next_level(self):
+        Starts the next level after the current one was cleared or the game
+        is over.
+    snapshot(self) -> bytes:
+        Current state of the session as compact bytes.
+    restore(self, snapshot: bytes):
+        Sets the state of the session to a snapshot.
+    """
+
+    def __init__(
+        self,
+        level_pack: LevelPack,
+        start_level_idx: int = 1,
+        difficulty_parameters: Optional[DifficultyParameters] = None,
+        is_fixed_point: bool = False,
+        profiler: Optional[FrameProfiler] = None,
+        difficulty_curves: Optional[DifficultyCurves] = None,
+        start_difficulty_tier: int = 0,
+    ):
+        """
+        difficulty_curves define the difficulty of each level and tier.
+        They default to DEFAULT_CURVES and are precomputed into a table.
+        difficulty_parameters replace the difficulty of the start level.
+        is_fixed_point set to True moves the balls on a fixed-point grid.
+        profiler measures ball movement and collisions.
+        """
+        self._difficulty_table = DifficultyTable(
+            difficulty_curves if difficulty_curves else DEFAULT_CURVES,
+            len(level_pack),
+        )
+        if difficulty_parameters is None:
+            difficulty_parameters = self._difficulty_table.parameters(
+                start_difficulty_tier, start_level_idx
+            )
+        self._level_pack = level_pack
+        self._is_fixed_point = is_fixed_point
+        self._profiler = profiler if profiler else NullFrameProfiler()
+        self._event_queue = EventQueue()
+        self._level_idx = start_level_idx
+        self._difficulty_parameters = difficulty_parameters
+        self._difficulty_tier = start_difficulty_tier
+        self._score = 0
+        self._last_extra_life_divisor = 0
+        self._lifes = START_LIFES
+        self._is_game_over = False
+        self._is_level_cleared = False
+        self._level = self._make_level(start_level_idx)
+
+    @property
+    def level(self) -> Level:
+        return self._level
+
+    @property
+    def level_idx(self) -> int:
+        return self._level_idx
+
+    @property
+    def score(self) -> int:
+        return self._score
+
+    @property
+    def lifes(self) -> int:
+        return self._lifes
+
+    @property
+    def difficulty_parameters(self) -> DifficultyParameters:
+        return self._difficulty_parameters
+
+    @difficulty_parameters.setter
+    def difficulty_parameters(
+        self, difficulty_parameters: DifficultyParameters
+    ):
+        self._difficulty_parameters = difficulty_parameters
+        self._level.difficulty_parameters = difficulty_parameters
+
+    @property
+    def difficulty_tier(self) -> int:
+        return self._difficulty_tier
+
+    @property
+    def difficulty_table(self) -> DifficultyTable:
+        return self._difficulty_table
+
+    @property
+    def is_game_over(self) -> bool:
+        return self._is_game_over
+
+    @property
+    def is_level_cleared(self) -> bool:
+        return self._is_level_cleared
+
+    @property
+    def event_queue(self) -> EventQueue:
+        return self._event_queue
+
+    def apply_action(self, action: Action, elapsed_time_in_ms: float):
+        """Moves the platform or activates the balls."""
+        level = self._level
+        if action == Action.SPACE:
+            activate_balls(level.balls)
+        elif action == Action.LEFT:
+            move_platform_left(
+                level.platform, level.left_wall, elapsed_time_in_ms
+            )
+        elif action == Action.RIGHT:
+            move_platform_right(
+                level.platform, level.right_wall, elapsed_time_in_ms
+            )
+
+    def update(self, elapsed_time_in_ms: float):
+        """
+        Moves the balls and resolves lost balls and collisions.
+        Does nothing until a ball is active or after the game is over or
+        the level is cleared.
+        """
+        if self._is_game_over or self._is_level_cleared:
+            return
+        level = self._level
+        if not any(ball.is_active for ball in level.balls):
+            level.platform.moved_distance = 0.0
+            return
+
+        profiler = self._profiler
+        profiler.start("ball")
+        result = solve_tick(
+            level.balls,
+            level.platform,
+            level.collision_grid,
+            level.grid_height,
+            elapsed_time_in_ms,
+        )
+        profiler.stop("ball")
+
+        level.balls = result.balls
+        profiler.start("collision")
+        self._handle_hits(result.hit_objects_per_ball)
+        for _ in range(result.platform_hit_count):
+            self._event_queue.push(PlatformHit())
+        profiler.stop("collision")
+
+        if not level.balls:
+            self._lifes -= 1
+            self._event_queue.push(
+                BallLost(
+                    self._lifes,
+                    _miss_distance(result.lost_balls[-1], level.platform),
+                )
+            )
+            if self._lifes <= 0:
+                self._is_game_over = True
+                return
+
+            level.reset_balls()
+            level.reset_platform()
+
+        if _all_bricks_are_destroyed(level.bricks):
+            self._is_level_cleared = True
+
+    def step(
+        self, action: Action, elapsed_time_in_ms: float = MS_PER_FRAME
+    ):
+        """Applies the action and updates the simulation by one frame."""
+        self.apply_action(action, elapsed_time_in_ms)
+        self.update(elapsed_time_in_ms)
+
+    def start_next_level(self):
+        """
+        Starts the next level after the current one was cleared or the game
+        is over.
+
+        After game over the session starts again on the first level.
+        After the last level the first level is started in the next tier.
+        The difficulty of the level is looked up in the difficulty table.
+        """
+        if self._is_game_over:
+            self._event_queue.push(GameOver(self._score))
+            self._level_idx = 1
+            self._lifes = START_LIFES
+            self._is_game_over = False
+            self._score = 0
+            self._difficulty_tier = 0
+        elif self._all_levels_finished():
+            self._event_queue.push(AllLevelsCleared())
+            self._level_idx = 1
+            self._difficulty_tier += 1
+        else:
+            self._event_queue.push(LevelCleared(self._level_idx))
+            self._level_idx += 1
+        self._difficulty_parameters = self._difficulty_table.parameters(
+            self._difficulty_tier, self._level_idx
+        )
+        self._is_level_cleared = False
+        self._level = self._make_level(self._level_idx)
+        self._event_queue.push(LevelStarted(self._level_idx))
+
+    def snapshot(self) -> bytes:
+        """
+        Current state of the session as compact bytes.
+
+        Contains score, lifes, difficulty, platform, balls and the hitpoints
+        of all bricks as one byte each. Queued events are not part of the
+        snapshot.
+        """
+        dp = self._difficulty_parameters
+        platform = self._level.platform
+        flags = (_IS_GAME_OVER if self._is_game_over else 0) | (
+            _IS_LEVEL_CLEARED if self._is_level_cleared else 0
+        )
+        parts = [
+            _SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                self._level_idx,
+                self._lifes,
+                self._score,
+                self._last_extra_life_divisor,
+                self._difficulty_tier,
+                flags,
+                dp.platform_velocity,
+                dp.platform_width,
+                dp.ball_velocity,
+                dp.ball_gravity,
+                platform.top_left.x,
+                platform.top_left.y,
+                platform.width,
+                platform.velocity,
+                len(self._level.balls),
+                len(self._level.bricks),
+            )
+        ]
+        for ball in self._level.balls:
+            parts.append(
+                _SNAPSHOT_BALL.pack(
+                    ball.top_left.x,
+                    ball.top_left.y,
+                    ball.width,
+                    ball.height,
+                    ball.velocity,
+                    ball.gravity,
+                    ball.angle.quadrant,
+                    ball.angle.quadrant_angle,
+                    ball.is_active,
+                )
+            )
+        parts.append(bytes([brick.hitpoints for brick in self._level.bricks]))
+        return b"".join(parts)
+
+    def restore(self, snapshot: bytes):
+        """
+        Sets the state of the session to a snapshot.
+
+        The level is only made again if the snapshot is from another level.
+
+        Raises ValueError if snapshot is no valid snapshot of this level
+        pack.
+        """
+        if len(snapshot) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Snapshot is too short")
+        (
+            magic,
+            version,
+            level_idx,
+            lifes,
+            score,
+            last_extra_life_divisor,
+            difficulty_tier,
+            flags,
+            platform_velocity,
+            platform_width,
+            ball_velocity,
+            ball_gravity,
+            platform_x,
+            platform_y,
+            platform_width_in_level,
+            platform_velocity_in_level,
+            ball_count,
+            brick_count,
+        ) = _SNAPSHOT_HEADER.unpack_from(snapshot)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(
+                "Snapshot is no snapshot of version %s" % SNAPSHOT_VERSION
+            )
+        balls_size = ball_count * _SNAPSHOT_BALL.size
+        bricks_offset = _SNAPSHOT_HEADER.size + balls_size
+        if len(snapshot) != bricks_offset + brick_count:
+            raise ValueError("Snapshot is truncated")
+
+        if level_idx != self._level_idx:
+            level = self._make_level(level_idx)
+        else:
+            level = self._level
+        if len(level.bricks) != brick_count:
+            raise ValueError("Snapshot does not match level %s" % level_idx)
+
+        difficulty_parameters = DifficultyParameters(
+            platform_velocity=platform_velocity,
+            platform_width=platform_width,
+            ball_velocity=ball_velocity,
+            ball_gravity=ball_gravity,
+        )
+        level.difficulty_parameters = difficulty_parameters
+
+        level.platform = Platform(
+            top_left=Point(platform_x, platform_y),
+            width=platform_width_in_level,
+            height=level.platform.height,
+            velocity=platform_velocity_in_level,
+        )
+        ball_type = FixedPointBall if self._is_fixed_point else Ball
+        level.balls = [
+            _unpack_ball(ball_type, values)
+            for values in _SNAPSHOT_BALL.iter_unpack(
+                snapshot[_SNAPSHOT_HEADER.size : bricks_offset]
+            )
+        ]
+        for brick, hitpoints in zip(level.bricks, snapshot[bricks_offset:]):
+            brick.hitpoints = hitpoints
+
+        self._level = level
+        self._level_idx = level_idx
+        self._lifes = lifes
+        self._score = score
+        self._last_extra_life_divisor = last_extra_life_divisor
+        self._difficulty_tier = difficulty_tier
+        self._difficulty_parameters = difficulty_parameters
+        self._is_game_over = bool(flags & _IS_GAME_OVER)
+        self._is_level_cleared = bool(flags & _IS_LEVEL_CLEARED)
+
+    def _make_level(self, level_idx: int) -> Level:
+        level = self._level_pack.make_level(level_idx)
+        level.is_fixed_point = self._is_fixed_point
+        level.difficulty_parameters = self._difficulty_parameters
+        return level
+
+    def _all_levels_finished(self) -> bool:
+        return self._level_idx >= len(self._level_pack)
+
+    def _handle_hits(self, hit_objects_per_ball: List[List[GameObject]]):
+        for hit_objects in hit_objects_per_ball:
+            for hit_object in hit_objects:
+                if not isinstance(hit_object, Brick):
+                    continue
+                if hit_object.is_destroyed():
+                    score = self._get_brick_score(hit_object)
+                    self._score += score
+                    self._event_queue.push(BrickDestroyed(hit_object, score))
+                    self._award_extra_life_it_threshold_reached()
+                else:
+                    self._event_queue.push(BrickHit(hit_object))
+
+    def _get_brick_score(self, brick: Brick) -> int:
+        return (
+            POINTS_PER_BRICK_HITPOINTS
+            * brick.start_hitpoints
+            * self._level_idx
+        )
+
+    def _award_extra_life_it_threshold_reached(self):
+        extra_life_divisor = int(self._score / POINTS_FOR_EXTRA_LIVE)
+        if extra_life_divisor != self._last_extra_life_divisor:
+            self._lifes += 1
+            self._event_queue.push(ExtraLife(self._lifes))
+            self._last_extra_life_divisor = extra_life_divisor
+
+
+def _unpack_ball(ball_type: type, values: tuple) -> Ball:
+    (
+        x,
+        y,
+        width,
+        height,
+        velocity,
+        gravity,
+        quadrant,
+        quadrant_angle,
+        is_active,
+    ) = values
+    angle = Angle()
+    angle.quadrant = Quadrant(quadrant)
+    angle.quadrant_angle = quadrant_angle
+    ball = ball_type(
+        top_left=Point(x, y),
+        width=width,
+        height=height,
+        velocity=velocity,
+        angle=angle,
+        gravity=gravity,
+    )
+    ball.is_active = is_active
+    return ball
+
+
+def _miss_distance(ball: Ball, platform: Platform) -> float:
+    """Horizontal distance of the ball center to the platform."""
+    ball_x = ball.top_left.x + ball.width / 2.0
+    return max(
+        0.0, platform.top_left.x - ball_x, ball_x - platform.bottom_right.x
+    )
+
+
+def _all_bricks_are_destroyed(bricks: List[Brick]) -> bool:
+    return all(brick.is_destroyed() for brick in bricks)
+
@@ -1,7 +1,33 @@
-"""Representation of an Angle from 0 - 360 degree."""
+"""
+Representation of an Angle from 0 - 360 degree.
+
+class Quadrant
+    Quadrants of the cartesian coordinate system.
+
+class Angle
+    Angle stored as quadrant and quadrant angle.
+
+class QuantizedAngle
+    Angle which only takes QUADRANT_STEPS steps per quadrant.
+
+function angle_to_step(angle: float) -> int:
+    Nearest step of an angle in rad.
+
+function step_to_angle(step: int) -> float:
+    Angle in rad of a step. Looked up in a table.
+"""
+from bricks.types.fixed_point import QUADRANT_STEPS
 
 from enum import IntEnum
-from numpy import deg2rad
+from math import radians
+
+ANGLE_STEPS = 4 * QUADRANT_STEPS
+STEP_ANGLE = radians(90.0) / QUADRANT_STEPS
+
+_QUARTER_ANGLE = radians(90.0)
+_HALF_ANGLE = radians(180.0)
+_THREE_QUARTER_ANGLE = radians(270.0)
+_FULL_ANGLE = radians(360.0)
 
 
 class Quadrant(IntEnum):
@@ -54,16 +80,7 @@ class Angle:
 
     @quadrant_angle.setter
     def quadrant_angle(self, quadrant_angle: float):
-        if quadrant_angle < deg2rad(0.0) or quadrant_angle > deg2rad(90.0):
-            print(
-                "class Angle: def set_quadrant_angle(self, quadrant_angle):\n"
-                "Out of Range 0.0_deg to 90.0_deg\n"
-                "suplied anngle:%s\n" % quadrant_angle
-            )
-            quadrant_angle = _clamp(
-                deg2rad(0.0), quadrant_angle, deg2rad(90.0)
-            )
-        self._quadrant_angle = quadrant_angle
+        self._quadrant_angle = _checked_quadrant_angle(quadrant_angle)
 
     def mirror_horizontal(self):
         """Mirrors the angle on the horizontal axis"""
@@ -90,16 +107,120 @@ class Angle:
         self.quadrant_angle = _mirror_quadrant_angle(self.quadrant_angle)
 
 
+class QuantizedAngle(Angle):
+    """
+    Angle which only takes QUADRANT_STEPS steps per quadrant.
+
+    The angle is stored as quadrant and integer quadrant step. Angles set
+    in rad are rounded to the nearest step, so they are off by at most
+    STEP_ANGLE / 2. Reading the angle in rad is a table lookup and
+    mirroring is exact. The quadrant step indexes SIN_TABLE of the
+    fixed-point module directly.
+
+    Attributes
+    ----------
+    step : int
+        Angle in steps from 0 to ANGLE_STEPS.
+    quadrant_step : int
+        Quadrant angle in steps from 0 to QUADRANT_STEPS.
+
+    Further attributes and methods are the same as of Angle.
+    """
+
+    def __init__(self, angle: float = 0.0):
+        self.value = angle
+
+    @classmethod
+    def from_angle(cls, angle: Angle) -> "QuantizedAngle":
+        """Nearest quantized angle to angle in the same quadrant."""
+        quantized_angle = cls()
+        quantized_angle.quadrant = angle.quadrant
+        quantized_angle.quadrant_angle = angle.quadrant_angle
+        return quantized_angle
+
+    @property
+    def value(self) -> float:
+        return _STEP_ANGLES[self.step]
+
+    @value.setter
+    def value(self, value: float):
+        value = _calc_angle_if_out_of_rangle(float(value))
+        self.step = angle_to_step(value)
+
+    @property
+    def quadrant_angle(self) -> float:
+        return _STEP_ANGLES[self.quadrant_step]
+
+    @quadrant_angle.setter
+    def quadrant_angle(self, quadrant_angle: float):
+        quadrant_angle = _checked_quadrant_angle(float(quadrant_angle))
+        self.quadrant_step = angle_to_step(quadrant_angle)
+
+    @property
+    def step(self) -> int:
+        return self.quadrant * QUADRANT_STEPS + self.quadrant_step
+
+    @step.setter
+    def step(self, step: int):
+        self.quadrant = _STEP_QUADRANTS[step]
+        self.quadrant_step = _STEP_QUADRANT_STEPS[step]
+
+    def mirror_horizontal(self):
+        """Mirrors the angle on the horizontal axis"""
+        self.quadrant = _MIRRORED_HORIZONTAL[self.quadrant]
+        self.quadrant_step = QUADRANT_STEPS - self.quadrant_step
+
+    def mirror_vertical(self):
+        """Mirrors the angle on the vertical axis"""
+        self.quadrant = _MIRRORED_VERTICAL[self.quadrant]
+        self.quadrant_step = QUADRANT_STEPS - self.quadrant_step
+
+
+_MIRRORED_HORIZONTAL = (Quadrant.IV, Quadrant.III, Quadrant.II, Quadrant.I)
+_MIRRORED_VERTICAL = (Quadrant.II, Quadrant.I, Quadrant.IV, Quadrant.III)
+
+_STEP_ANGLES = tuple(step * STEP_ANGLE for step in range(ANGLE_STEPS + 1))
+_STEP_QUADRANTS = (Quadrant.I,) * (QUADRANT_STEPS + 1) + tuple(
+    quadrant
+    for quadrant in (Quadrant.II, Quadrant.III, Quadrant.IV)
+    for _ in range(QUADRANT_STEPS)
+)
+_STEP_QUADRANT_STEPS = tuple(range(QUADRANT_STEPS + 1)) + tuple(
+    range(1, QUADRANT_STEPS + 1)
+) * 3
+
+
+def angle_to_step(angle: float) -> int:
+    """Nearest step of an angle between 0 and 2 * pi."""
+    return round(angle / STEP_ANGLE)
+
+
+def step_to_angle(step: int) -> float:
+    """Angle in rad of a step. Looked up in a table."""
+    return _STEP_ANGLES[step]
+
+
+def _checked_quadrant_angle(quadrant_angle: float) -> float:
+    if quadrant_angle < 0.0 or quadrant_angle > _QUARTER_ANGLE:
+        print(
+            "class Angle: def set_quadrant_angle(self, quadrant_angle):\n"
+            "Out of Range 0.0_deg to 90.0_deg\n"
+            "suplied anngle:%s\n" % quadrant_angle
+        )
+        quadrant_angle = _clamp(0.0, quadrant_angle, _QUARTER_ANGLE)
+    return quadrant_angle
+
+
 def _clamp(minimum: float, x: float, maximum: float) -> float:
     return max(minimum, min(x, maximum))
 
 
 def _mirror_quadrant_angle(quadrant_angle: float) -> float:
-    return deg2rad(90.0) - quadrant_angle
+    return _QUARTER_ANGLE - quadrant_angle
 
 
 def _calc_quadrant(angle: float) -> Quadrant:
-    assert deg2rad(0.0) <= angle <= deg2rad(360.0)
+    assert 0.0 <= angle <= _FULL_ANGLE
 
     if _is_in_quadrant_I(angle):
         return Quadrant.I
@@ -114,32 +235,30 @@ def _calc_quadrant(angle: float) -> Quadrant:
 
 
 def _is_in_quadrant_I(angle: float) -> float:
-    return deg2rad(0.0) <= angle <= deg2rad(90.0)
+    return 0.0 <= angle <= _QUARTER_ANGLE
 
 
 def _is_in_quadrant_II(angle: float) -> float:
-    return deg2rad(90.0) < angle <= deg2rad(180.0)
+    return _QUARTER_ANGLE < angle <= _HALF_ANGLE
 
 
 def _is_in_quadrant_III(angle: float) -> float:
-    return deg2rad(180.0) < angle <= deg2rad(270.0)
+    return _HALF_ANGLE < angle <= _THREE_QUARTER_ANGLE
 
 
 def _is_in_quadrant_IV(angle: float) -> float:
-    return deg2rad(270.0) < angle <= deg2rad(360.0)
+    return _THREE_QUARTER_ANGLE < angle <= _FULL_ANGLE
 
 
 def _angle_to_quadrant_angle(angle: float, quadrant: Quadrant) -> float:
-    return angle - deg2rad(90.0) * quadrant
+    return angle - _QUARTER_ANGLE * quadrant
 
 
 def _quadrant_angle_to_angle(quadrant_angle: float, quadrant: Quadrant):
-    return quadrant_angle + deg2rad(90.0) * quadrant
+    return quadrant_angle + _QUARTER_ANGLE * quadrant
 
 
 def _calc_angle_if_out_of_rangle(angle: float) -> float:
-    while angle < deg2rad(0.0):
-        angle += deg2rad(360)
-    while angle > deg2rad(360.0):
-        angle -= deg2rad(360.0)
-    return angle
+    if 0.0 <= angle <= _FULL_ANGLE:
+        return angle
+    return angle % _FULL_ANGLE
@@ -0,0 +1,75 @@
+"""
+Fixed-point numbers with 16 fraction bits.
+
+Values are plain ints counting 2^-16 units. Conversions between float and
+fixed point only multiply by powers of two and round, so they give the same
+result on every machine. The sine table is computed with integer arithmetic
+only and does not depend on the platform libm. It is only needed in
+fixed-point mode, so it is built on first access of SIN_TABLE.
+
+function to_fixed(value: float) -> int
+    Rounds a float to the nearest fixed-point value.
+
+function to_float(value: int) -> float
+    Converts a fixed-point value to float. The result is exact.
+
+function multiply(a: int, b: int) -> int
+    Product of two fixed-point values rounded to fixed point.
+"""
+from typing import Tuple
+
+FRACTION_BITS = 16
+ONE = 1 << FRACTION_BITS
+QUADRANT_STEPS = 4096
+
+_HALF = 1 << (FRACTION_BITS - 1)
+
+# pi / 2 * 2^48, rounded
+_SERIES_BITS = 48
+_HALF_PI_SERIES = 442139859501778
+
+
+def to_fixed(value: float) -> int:
+    """Rounds a float to the nearest fixed-point value."""
+    return round(value * ONE)
+
+
+def to_float(value: int) -> float:
+    """Converts a fixed-point value to float. The result is exact."""
+    return value / ONE
+
+
+def multiply(a: int, b: int) -> int:
+    """Product of two fixed-point values rounded to fixed point."""
+    return (a * b + _HALF) >> FRACTION_BITS
+
+
+def _integer_sin(step: int) -> int:
+    """
+    sin(step / QUADRANT_STEPS * pi / 2) in fixed point.
+    Taylor series evaluated with integers at 48 fraction bits.
+    """
+    scale = 1 << _SERIES_BITS
+    x = _HALF_PI_SERIES * step // QUADRANT_STEPS
+    x_squared = x * x // scale
+    term = x
+    result = 0
+    k = 1
+    while term != 0:
+        result += term
+        term = -term * x_squared // scale // ((k + 1) * (k + 2))
+        k += 2
+    shift = _SERIES_BITS - FRACTION_BITS
+    return (result + (1 << (shift - 1))) >> shift
+
+
+def _make_sin_table() -> Tuple[int, ...]:
+    return tuple(_integer_sin(step) for step in range(QUADRANT_STEPS + 1))
+
+
+def __getattr__(name: str):
+    if name == "SIN_TABLE":
+        sin_table = _make_sin_table()
+        globals()["SIN_TABLE"] = sin_table
+        return sin_table
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
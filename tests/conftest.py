@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path_factory, monkeypatch):
+    """Keeps highscores and the level pack cache out of the home folder."""
+    data_dir = tmp_path_factory.mktemp("data")
+    monkeypatch.setenv("BRICKS_DATA_DIR", str(data_dir))
+    return data_dir
@@ -68,3 +68,22 @@ class TestBrick:
 
         obj.decrease_hitpoints()
         assert obj.is_destroyed() == True
+
+    def test_set_hitpoints(self):
+        obj = Brick(
+            top_left=Point(8.2, 1.3), width=3.1, height=4.2, hitpoints=5
+        )
+        obj.hitpoints = 0
+        assert obj.is_destroyed() == True
+
+        obj.hitpoints = 5
+        assert obj.hitpoints == 5
+        assert obj.is_destroyed() == False
+
+    @pytest.mark.parametrize("hitpoints", [(-1), (6)])
+    def test_set_hitpoints_throws_ValueError(self, hitpoints):
+        obj = Brick(
+            top_left=Point(8.2, 1.3), width=3.1, height=4.2, hitpoints=5
+        )
+        with pytest.raises(ValueError):
+            obj.hitpoints = hitpoints
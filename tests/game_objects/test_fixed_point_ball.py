@@ -0,0 +1,148 @@
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.fixed_point_ball import FixedPointBall
+from bricks.game_objects.physics import reflect_balls_from_game_objects
+from bricks.game_objects.physics import reflect_from_platform
+from bricks.level_generator import generate_level
+from bricks.types.angle import Angle
+from bricks.types.angle import Quadrant
+from bricks.types.angle import QuantizedAngle
+from bricks.types.fixed_point import to_fixed
+from bricks.types.point import Point
+
+from math import hypot
+from pytest import approx
+
+from numpy import deg2rad
+
+import random
+import pytest
+
+MS_PER_FRAME = 1000.0 / 60.0
+
+
+def _simulate(seed, is_fixed_point, frame_count=600):
+    """Positions of the ball and destroyed bricks until the ball is lost."""
+    level = generate_level(seed)
+    level.is_fixed_point = is_fixed_point
+    ball = level.balls[0]
+    ball.is_active = True
+    positions = []
+    destroyed_count = 0
+    for _ in range(frame_count):
+        ball.move(MS_PER_FRAME)
+        if ball.bottom_right.y >= level.grid_height:
+            break
+        hit_objects = reflect_balls_from_game_objects(
+            level.balls, level.collision_grid
+        )[0]
+        destroyed_count += sum(
+            1
+            for obj in hit_objects
+            if isinstance(obj, Brick) and obj.is_destroyed()
+        )
+        reflect_from_platform(ball, level.platform)
+        positions.append((ball.top_left.x, ball.top_left.y))
+    return positions, destroyed_count
+
+
+class TestFixedPointBall:
+    def test_position_is_snapped_to_grid(self):
+        obj = FixedPointBall(top_left=Point(1.0 / 3.0, 2.0 / 3.0))
+        assert obj.top_left.x == 21845 / 65536
+        assert obj.top_left.y == 43691 / 65536
+
+    def test_inactive_ball_does_not_move(self):
+        obj = FixedPointBall(top_left=Point(1.0, 1.0), velocity=16.0)
+        obj.move(MS_PER_FRAME)
+        assert obj.top_left.x == 1.0
+        assert obj.top_left.y == 1.0
+
+    @pytest.mark.parametrize(
+        "angle, x, y",
+        [
+            (0.0, 11.0, 10.0),
+            (90.0, 10.0, 11.0),
+            (180.0, 9.0, 10.0),
+            (270.0, 10.0, 9.0),
+        ],
+    )
+    def test_move_axis(self, angle, x, y):
+        obj = FixedPointBall(
+            top_left=Point(10.0, 10.0),
+            velocity=1.0,
+            angle=Angle(deg2rad(angle)),
+        )
+        obj.is_active = True
+        obj.move(1000.0)
+        assert obj.top_left.x == x
+        assert obj.top_left.y == y
+
+    def test_angle_is_quantized(self):
+        angle = Angle(deg2rad(135.0))
+        obj = FixedPointBall(angle=angle)
+        assert isinstance(obj.angle, QuantizedAngle)
+        assert obj.angle.value == approx(angle.value)
+        obj.angle = Angle(deg2rad(30.0))
+        assert isinstance(obj.angle, QuantizedAngle)
+        assert obj.angle.quadrant == Quadrant.I
+
+    def test_positions_stay_on_grid(self):
+        positions, _ = _simulate(1, True)
+        for x, y in positions:
+            assert to_fixed(x) / 65536 == x
+            assert to_fixed(y) / 65536 == y
+
+    def test_single_move_matches_float_mode(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            angle = rng.uniform(0.0, 2.0 * 3.141592653589793)
+            velocity = rng.uniform(1.0, 30.0)
+            gravity = rng.uniform(0.0, 5.0)
+            balls = [
+                ball_type(
+                    top_left=Point(10.0, 10.0),
+                    velocity=velocity,
+                    angle=Angle(angle),
+                    gravity=gravity,
+                )
+                for ball_type in (Ball, FixedPointBall)
+            ]
+            for ball in balls:
+                ball.is_active = True
+                ball.move(MS_PER_FRAME)
+            distance = hypot(
+                balls[0].top_left.x - balls[1].top_left.x,
+                balls[0].top_left.y - balls[1].top_left.y,
+            )
+            traveld_way = MS_PER_FRAME / 1000.0 * velocity
+            assert distance < traveld_way * 4e-4 + 2.0 / 65536
+
+    def test_trajectories_match_float_mode_statistically(self):
+        same_destroyed_count = 0
+        mean_distances = []
+        for seed in range(30):
+            float_positions, float_destroyed = _simulate(seed, False)
+            fixed_positions, fixed_destroyed = _simulate(seed, True)
+            if float_destroyed == fixed_destroyed:
+                same_destroyed_count += 1
+            frame_count = min(len(float_positions), len(fixed_positions), 60)
+            mean_distances.append(
+                sum(
+                    hypot(a[0] - b[0], a[1] - b[1])
+                    for a, b in zip(
+                        float_positions[:frame_count],
+                        fixed_positions[:frame_count],
+                    )
+                )
+                / frame_count
+            )
+        assert same_destroyed_count >= 27
+        assert sum(mean_distances) / len(mean_distances) < 1e-3
+
+    def test_trajectory_is_bit_exact(self):
+        # Must give the same result on every machine.
+        positions, destroyed_count = _simulate(1, True)
+        x, y = positions[-1]
+        assert (len(positions), destroyed_count) == (174, 4)
+        assert (to_fixed(x), to_fixed(y)) == (1388463, 1194490)
@@ -0,0 +1,110 @@
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.movement_solver import move_platform
+from bricks.game_objects.movement_solver import solve_tick
+from bricks.game_objects.physics import reflect_from_platform
+from bricks.game_objects.platform import Platform
+from bricks.game_objects.spatial_grid import SpatialGrid
+from bricks.game_objects.wall import Wall
+from bricks.types.angle import Angle
+from bricks.types.point import Point
+
+from numpy import deg2rad
+from pytest import approx
+import pytest
+
+MS_PER_FRAME = 1000.0 / 60.0
+
+
+def _make_walls():
+    return Wall(Point(0.0, 0.0), 1.0, 20.0), Wall(Point(11.0, 0.0), 1.0, 20.0)
+
+
+def _make_platform(velocity: float = 16.0) -> Platform:
+    return Platform(Point(5.0, 19.0), 4.0, 1.0, velocity)
+
+
+def _make_ball_above_platform() -> Ball:
+    ball = Ball(Point(6.0, 18.8), 0.5, 0.5, 16.0, Angle(deg2rad(80.0)))
+    ball.is_active = True
+    return ball
+
+
+class TestMovePlatform:
+    def test_moves_with_velocity(self):
+        left_wall, right_wall = _make_walls()
+        platform = _make_platform(-16.0)
+        distance = move_platform(platform, left_wall, right_wall, 125.0)
+        assert distance == approx(-2.0)
+        assert platform.top_left.x == approx(3.0)
+        assert platform.moved_distance == approx(-2.0)
+
+    @pytest.mark.parametrize(
+        "velocity, expected_x", [(16.0, 7.0), (-16.0, 1.0)]
+    )
+    def test_long_move_stops_at_wall(self, velocity, expected_x):
+        left_wall, right_wall = _make_walls()
+        platform = _make_platform(velocity)
+        move_platform(platform, left_wall, right_wall, 10000.0)
+        assert platform.top_left.x == approx(expected_x)
+
+    def test_moved_distance_sums_up(self):
+        left_wall, right_wall = _make_walls()
+        platform = _make_platform()
+        move_platform(platform, left_wall, right_wall, 62.5)
+        move_platform(platform, left_wall, right_wall, 10000.0)
+        assert platform.moved_distance == approx(2.0)
+
+    def test_none_wall_does_not_limit(self):
+        left_wall, _ = _make_walls()
+        platform = _make_platform()
+        move_platform(platform, left_wall, None, 1000.0)
+        assert platform.top_left.x == approx(21.0)
+
+
+class TestSolveTick:
+    def test_lost_balls_are_not_reflected(self):
+        platform = _make_platform()
+        lost_ball = Ball(Point(6.0, 19.8), 0.5, 0.5, 16.0, Angle(deg2rad(90)))
+        lost_ball.is_active = True
+        ball = _make_ball_above_platform()
+        result = solve_tick(
+            [lost_ball, ball], platform, SpatialGrid([]), 20.0, 1.0
+        )
+        assert result.balls == [ball]
+        assert result.lost_balls == [lost_ball]
+        assert result.platform_hit_count == 1
+        assert len(result.hit_objects_per_ball) == 1
+
+    def test_moved_distance_is_reset(self):
+        platform = _make_platform()
+        platform.moved_distance = 0.5
+        solve_tick([], platform, SpatialGrid([]), 20.0, MS_PER_FRAME)
+        assert platform.moved_distance == 0.0
+
+    @pytest.mark.parametrize(
+        "platform_velocity, expected_angle",
+        [
+            (0.0, 296.25),
+            (8.0, 296.25 + 7.5),
+            (-8.0, 296.25 - 7.5),
+            (100.0, 296.25 + 15.0),
+            # clamped away from straight up
+            (-100.0, 285.0),
+        ],
+    )
+    def test_reflect_from_platform_with_spin(
+        self, platform_velocity, expected_angle
+    ):
+        ball = _make_ball_above_platform()
+        assert reflect_from_platform(ball, _make_platform(), platform_velocity)
+        assert ball.angle.value == approx(deg2rad(expected_angle))
+
+    def test_platform_velocity_of_tick_is_used(self):
+        platform = _make_platform()
+        platform.moved_distance = 0.5
+        ball = _make_ball_above_platform()
+        ball.is_active = False
+        solve_tick([ball], platform, SpatialGrid([]), 20.0, 31.25)
+        still_ball = _make_ball_above_platform()
+        reflect_from_platform(still_ball, _make_platform(), 16.0)
+        assert ball.angle.value == approx(still_ball.angle.value)
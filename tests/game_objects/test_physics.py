@@ -4,8 +4,14 @@ from bricks.game_objects.platform import Platform
 from bricks.game_objects.game_object import GameObject
 from bricks.types.point import Point
 from bricks.types.angle import Angle, Quadrant
+from bricks.types.angle import ANGLE_STEPS
+from bricks.types.angle import QuantizedAngle
+from bricks.types.angle import STEP_ANGLE
+from bricks.types.angle import step_to_angle
 
 from bricks.game_objects.physics import reflect_from_game_objects
+from bricks.game_objects.physics import reflect_balls_from_game_objects
+from bricks.game_objects.spatial_grid import SpatialGrid
 from bricks.game_objects.physics import _calc_angle_factor
 from bricks.game_objects.physics import _clamp_angle
 
@@ -406,3 +412,92 @@ class TestPhysics:
         angle = Angle(deg2rad(input_angle))
         output = _clamp_angle(angle)
         assert output.value == approx(deg2rad(output_angle))
+
+    def test_clamp_quantized_angle_matches_float(self):
+        for step in range(ANGLE_STEPS + 1):
+            angle = QuantizedAngle()
+            angle.step = step
+            expected = _clamp_angle(Angle(step_to_angle(step)))
+            output = _clamp_angle(angle)
+            assert output.quadrant == expected.quadrant
+            assert abs(output.value - expected.value) <= STEP_ANGLE / 2.0
+
+    def test_reflect_balls_matches_single_ball_reflection(self):
+        bricks = [
+            Brick(top_left=Point(3.0, 1.0), width=4.0, height=4.0),
+            Brick(top_left=Point(3.0, 5.0), width=4.0, height=4.0),
+            Brick(top_left=Point(3.0, 9.0), width=4.0, height=4.0),
+        ]
+        grid = SpatialGrid(bricks)
+        ball_1 = Ball(
+            top_left=Point(1.0, 3.0),
+            width=3.0,
+            height=2.5,
+            velocity=1.0,
+            angle=Angle(deg2rad(30.0)),
+        )
+        ball_2 = Ball(
+            top_left=Point(6.0, 11.0),
+            width=3.0,
+            height=2.5,
+            velocity=1.0,
+            angle=Angle(deg2rad(150.0)),
+        )
+
+        hit_objects = reflect_balls_from_game_objects([ball_1, ball_2], grid)
+
+        assert hit_objects == [[bricks[0], bricks[1]], [bricks[2]]]
+        assert ball_1.top_left.x == 0.0
+        assert ball_1.angle.value == approx(deg2rad(150.0))
+        assert ball_2.top_left.x == 7.0
+        assert ball_2.angle.value == approx(deg2rad(30.0))
+
+    def test_reflect_balls_hitting_same_brick(self):
+        brick = Brick(top_left=Point(3.0, 1.0), width=4.0, height=4.0)
+        grid = SpatialGrid([brick])
+        ball_1 = Ball(
+            top_left=Point(1.0, 2.0),
+            width=3.0,
+            height=2.5,
+            velocity=1.0,
+            angle=Angle(deg2rad(30.0)),
+        )
+        ball_2 = Ball(
+            top_left=Point(6.0, 2.0),
+            width=3.0,
+            height=2.5,
+            velocity=1.0,
+            angle=Angle(deg2rad(150.0)),
+        )
+
+        hit_objects = reflect_balls_from_game_objects([ball_1, ball_2], grid)
+
+        assert brick.is_destroyed()
+        assert hit_objects == [[brick], []]
+        assert ball_1.angle.value == approx(deg2rad(150.0))
+        assert ball_2.angle.value == approx(deg2rad(30.0))
+
+    def test_reflect_balls_each_ball_decreases_hitpoints(self):
+        brick = Brick(
+            top_left=Point(3.0, 1.0), width=4.0, height=4.0, hitpoints=3
+        )
+        grid = SpatialGrid([brick])
+        balls = [
+            Ball(
+                top_left=Point(1.0, 2.0),
+                width=3.0,
+                height=2.5,
+                angle=Angle(deg2rad(30.0)),
+            ),
+            Ball(
+                top_left=Point(6.0, 2.0),
+                width=3.0,
+                height=2.5,
+                angle=Angle(deg2rad(150.0)),
+            ),
+        ]
+
+        hit_objects = reflect_balls_from_game_objects(balls, grid)
+
+        assert brick.hitpoints == 1
+        assert hit_objects == [[brick], [brick]]
@@ -0,0 +1,44 @@
+from bricks.game_objects.brick import Brick
+from bricks.game_objects.ball import Ball
+from bricks.game_objects.spatial_grid import SpatialGrid
+from bricks.types.point import Point
+
+import pytest
+
+
+class TestSpatialGrid:
+    def test_query_returns_objects_in_construction_order(self):
+        bricks = [
+            Brick(top_left=Point(4.0, 0.0), width=1.0, height=1.0),
+            Brick(top_left=Point(0.0, 0.0), width=1.0, height=1.0),
+            Brick(top_left=Point(2.0, 0.0), width=1.0, height=1.0),
+        ]
+        grid = SpatialGrid(bricks)
+        ball = Ball(top_left=Point(0.5, 0.0), width=4.0, height=0.5)
+
+        assert grid.query(ball) == bricks
+
+    def test_query_far_away_is_empty(self):
+        grid = SpatialGrid(
+            [Brick(top_left=Point(0.0, 0.0), width=1.0, height=1.0)]
+        )
+        ball = Ball(top_left=Point(5.0, 5.0), width=0.75, height=0.75)
+
+        assert grid.query(ball) == []
+
+    @pytest.mark.parametrize(
+        "ball_top_left", [(Point(2.0, 0.0)), (Point(0.25, 2.0))]
+    )
+    def test_query_contains_touching_objects(self, ball_top_left):
+        brick = Brick(top_left=Point(0.0, 0.0), width=2.0, height=2.0)
+        grid = SpatialGrid([brick], cell_size=2.0)
+        ball = Ball(top_left=ball_top_left, width=0.75, height=0.75)
+
+        assert grid.query(ball) == [brick]
+
+    def test_large_object_is_in_all_cells(self):
+        wall = Brick(top_left=Point(0.0, 0.0), width=1.0, height=20.0)
+        grid = SpatialGrid([wall])
+        for y in range(20):
+            ball = Ball(top_left=Point(0.5, float(y)), width=0.5, height=0.5)
+            assert grid.query(ball) == [wall]
@@ -0,0 +1,165 @@
+from bricks.adaptive_difficulty import AdaptiveBounds
+from bricks.adaptive_difficulty import AdaptiveDifficultyController
+from bricks.adaptive_difficulty import MIN_OBSERVED_TIME_IN_MS
+from bricks.adaptive_difficulty import Telemetry
+from bricks.adaptive_difficulty import TelemetryTargets
+from bricks.adaptive_difficulty import run_session
+from bricks.difficulty_sweep import ReactionPlayer
+from bricks.game_events import BallLost
+from bricks.game_events import BrickDestroyed
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+from bricks.simulation import Simulation
+
+from pytest import approx
+import random
+
+
+def _make_level_pack():
+    return LevelPack(
+        [
+            ("level%d.json" % seed, generate_level_data(seed))
+            for seed in (1, 2)
+        ],
+        {},
+    )
+
+
+def _lose_balls(simulation, count, miss_distance=4.0):
+    for _ in range(count):
+        simulation.event_queue.push(BallLost(3, miss_distance))
+    simulation.event_queue.drain()
+
+
+class TestTelemetry:
+    def test_rates_in_window(self):
+        telemetry = Telemetry(window_in_ms=60000.0)
+        telemetry.record_frame(30000.0)
+        telemetry.record_ball_lost(1.0)
+        telemetry.record_brick_destroyed()
+        telemetry.record_brick_destroyed()
+        assert telemetry.balls_lost_per_minute == approx(2.0)
+        assert telemetry.seconds_per_brick == approx(15.0)
+
+    def test_old_entries_leave_window(self):
+        telemetry = Telemetry(window_in_ms=60000.0)
+        telemetry.record_ball_lost(1.0)
+        telemetry.record_frame(90000.0)
+        assert telemetry.observed_time_in_ms == 60000.0
+        assert telemetry.balls_lost_per_minute == 0.0
+        assert telemetry.seconds_per_brick == approx(60.0)
+
+    def test_miss_distance_is_smoothed(self):
+        telemetry = Telemetry()
+        telemetry.record_ball_lost(2.0)
+        telemetry.record_ball_lost(2.0)
+        assert 1.0 < telemetry.miss_distance < 2.0
+
+
+class TestAdaptiveDifficultyController:
+    def test_no_adjustment_before_min_observed_time(self):
+        simulation = Simulation(_make_level_pack())
+        controller = AdaptiveDifficultyController(simulation)
+        _lose_balls(simulation, 3)
+        assert controller.skill == 0.0
+        assert controller.adjustment_count == 3
+
+    def test_struggling_player_gets_easier_game(self):
+        simulation = Simulation(_make_level_pack())
+        base = simulation.difficulty_parameters
+        controller = AdaptiveDifficultyController(simulation)
+        controller.telemetry.record_frame(MIN_OBSERVED_TIME_IN_MS)
+        _lose_balls(simulation, 2)
+        assert controller.skill < 0.0
+        parameters = simulation.difficulty_parameters
+        assert parameters.ball_velocity < base.ball_velocity
+        assert parameters.platform_width > base.platform_width
+        assert simulation.level.balls[0].velocity == parameters.ball_velocity
+
+    def test_skill_stays_within_bounds(self):
+        simulation = Simulation(_make_level_pack())
+        bounds = AdaptiveBounds()
+        base = simulation.difficulty_parameters
+        controller = AdaptiveDifficultyController(simulation, bounds)
+        controller.telemetry.record_frame(MIN_OBSERVED_TIME_IN_MS)
+        _lose_balls(simulation, 50)
+        assert controller.skill == -1.0
+        assert simulation.difficulty_parameters.ball_velocity == approx(
+            base.ball_velocity * (1.0 - bounds.ball_velocity_range)
+        )
+
+    def test_good_player_gets_harder_game(self):
+        simulation = Simulation(_make_level_pack())
+        base = simulation.difficulty_parameters
+        controller = AdaptiveDifficultyController(simulation)
+        controller.telemetry.record_frame(4 * 60000.0)
+        for _ in range(60):
+            simulation.event_queue.push(BrickDestroyed(None, 100))
+        _lose_balls(simulation, 1, miss_distance=0.0)
+        assert controller.skill > 0.0
+        assert simulation.difficulty_parameters.ball_velocity > (
+            base.ball_velocity
+        )
+
+    def test_last_lost_ball_is_recorded_without_adjustment(self):
+        simulation = Simulation(_make_level_pack())
+        controller = AdaptiveDifficultyController(simulation)
+        simulation.event_queue.push(BallLost(0, 4.0))
+        simulation.event_queue.drain()
+        assert controller.telemetry.miss_distance > 0.0
+        assert controller.adjustment_count == 0
+
+    def test_update_counts_only_time_with_active_ball(self):
+        simulation = Simulation(_make_level_pack())
+        controller = AdaptiveDifficultyController(simulation)
+        controller.update(100.0)
+        assert controller.telemetry.observed_time_in_ms == 0.0
+        simulation.level.balls[0].is_active = True
+        controller.update(100.0)
+        assert controller.telemetry.observed_time_in_ms == 100.0
+
+
+def _session(reaction_frames, bounds=AdaptiveBounds()):
+    return run_session(
+        _make_level_pack(),
+        ReactionPlayer(random.Random(0), *reaction_frames),
+        frame_count=3 * 60 * 60,
+        bounds=bounds,
+    )
+
+
+def _direction_changes(skill_history):
+    changes = [
+        b - a for a, b in zip(skill_history, skill_history[1:]) if a != b
+    ]
+    return sum(1 for a, b in zip(changes, changes[1:]) if (a > 0) != (b > 0))
+
+
+class TestRunSession:
+    def test_skill_follows_player(self):
+        fast = _session((1, 3))
+        slow = _session((20, 40))
+        assert slow.final_skill() < 0.0
+        assert slow.final_skill() < fast.final_skill()
+
+    def test_skill_settles(self):
+        slow = _session((20, 40))
+        settled = slow.skill_history[len(slow.skill_history) // 2 :]
+        assert len(settled) >= 8
+        assert _direction_changes(settled) <= 2
+        assert max(settled[-8:]) - min(settled[-8:]) <= 0.1
+
+    def test_lost_balls_move_towards_target(self):
+        target = TelemetryTargets().balls_lost_per_minute
+        adaptive = _session((20, 40))
+        fixed = _session(
+            (20, 40),
+            AdaptiveBounds(
+                ball_velocity_range=0.0,
+                ball_gravity_range=0.0,
+                platform_width_range=0.0,
+            ),
+        )
+        assert abs(adaptive.balls_lost_per_minute - target) < 0.75 * abs(
+            fixed.balls_lost_per_minute - target
+        )
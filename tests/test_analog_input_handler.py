@@ -0,0 +1,188 @@
+from bricks.analog_input_handler import AnalogInputHandler
+from bricks.level_generator import generate_level
+
+from types import SimpleNamespace
+
+import pygame
+import pytest
+from pygame.constants import K_LEFT, K_RIGHT, K_SPACE, K_p, KEYDOWN, KEYUP
+
+MS_PER_FRAME = 1000.0 / 60.0
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((280, 190))
+    pressed_keys = set()
+    monkeypatch.setattr(
+        pygame.key,
+        "get_pressed",
+        lambda: {key: key in pressed_keys for key in (K_LEFT, K_RIGHT)},
+    )
+    pygame.event.clear()
+    yield pressed_keys
+    pygame.display.quit()
+
+
+@pytest.fixture
+def level():
+    return generate_level(3)
+
+
+def _post_key(event_type, key, pressed_keys):
+    pygame.event.post(pygame.event.Event(event_type, key=key))
+    if event_type == KEYDOWN:
+        pressed_keys.add(key)
+    else:
+        pressed_keys.discard(key)
+
+
+class TestAnalogInputHandler:
+    def test_full_frame_held_moves_full_frame(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        _post_key(KEYDOWN, K_RIGHT, display)
+        handler.handle_input(level, MS_PER_FRAME)
+        x = level.platform.top_left.x
+        clock.now += MS_PER_FRAME
+        handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.top_left.x - x == pytest.approx(
+            level.platform.velocity * MS_PER_FRAME / 1000.0
+        )
+
+    def test_press_late_in_frame_moves_less(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        clock.now += MS_PER_FRAME * 0.75
+        handler.poll()
+        _post_key(KEYDOWN, K_RIGHT, display)
+        clock.now += MS_PER_FRAME * 0.25
+        x = level.platform.top_left.x
+        handler.handle_input(level, MS_PER_FRAME)
+        full_frame = level.platform.velocity * MS_PER_FRAME / 1000.0
+        # press is assumed halfway between the polls
+        assert level.platform.top_left.x - x == pytest.approx(
+            full_frame * 0.125
+        )
+
+    def test_release_of_other_key_keeps_moving(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        _post_key(KEYDOWN, K_LEFT, display)
+        _post_key(KEYDOWN, K_SPACE, display)
+        _post_key(KEYUP, K_SPACE, display)
+        handler.poll()
+        clock.now += MS_PER_FRAME
+        x = level.platform.top_left.x
+        handler.handle_input(level, MS_PER_FRAME)
+        clock.now += MS_PER_FRAME
+        handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.top_left.x - x == pytest.approx(
+            -2 * abs(level.platform.velocity) * MS_PER_FRAME / 1000.0
+        )
+
+    def test_both_directions_cancel(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        display.update((K_LEFT, K_RIGHT))
+        handler.poll()
+        clock.now += MS_PER_FRAME
+        x = level.platform.top_left.x
+        handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.top_left.x == pytest.approx(x)
+
+    def test_space_activates_balls(self, display, level):
+        handler = AnalogInputHandler(_Clock())
+        _post_key(KEYDOWN, K_SPACE, display)
+        handler.handle_input(level, MS_PER_FRAME)
+        assert all(ball.is_active for ball in level.balls)
+
+    def test_records_mouse_latency_apart_from_presses(self, display, level):
+        handler = AnalogInputHandler(_Clock())
+        for x in range(3):
+            pygame.event.post(
+                pygame.event.Event(
+                    pygame.MOUSEMOTION, pos=(x, 100), rel=(1, 0)
+                )
+            )
+        handler.handle_input(level, MS_PER_FRAME)
+        assert handler.pump.latency_count == 0
+        assert handler.pump.motion_latency_count == 3
+
+    def test_mouse_moves_platform_to_pointer(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        pygame.event.post(
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 100), rel=(0, 0))
+        )
+        for _ in range(200):
+            clock.now += MS_PER_FRAME
+            handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.top_left.x == pytest.approx(
+            level.left_wall.bottom_right.x
+        )
+
+    def test_mouse_in_window_without_display_surface(
+        self, display, level, monkeypatch
+    ):
+        monkeypatch.setattr(pygame.display, "get_surface", lambda: None)
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        pygame.event.post(
+            pygame.event.Event(
+                pygame.MOUSEMOTION,
+                pos=(280, 100),
+                rel=(0, 0),
+                window=SimpleNamespace(size=(280, 190)),
+            )
+        )
+        for _ in range(200):
+            clock.now += MS_PER_FRAME
+            handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.bottom_right.x == pytest.approx(
+            level.right_wall.top_left.x
+        )
+
+    def test_pause(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        _post_key(KEYDOWN, K_p, display)
+        handler.handle_input(level, MS_PER_FRAME)
+        assert handler.is_paused
+        assert handler.changed_pause_state
+
+        display.add(K_RIGHT)
+        x = level.platform.top_left.x
+        clock.now += MS_PER_FRAME
+        handler.handle_input(level, MS_PER_FRAME)
+        assert level.platform.top_left.x == x
+        assert not handler.changed_pause_state
+
+    def test_quit(self, display, level):
+        handler = AnalogInputHandler(_Clock())
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        handler.handle_input(level, MS_PER_FRAME)
+        assert handler.is_quit
+
+    def test_records_latency_from_press_to_movement(self, display, level):
+        clock = _Clock()
+        handler = AnalogInputHandler(clock)
+        handler.poll()
+        clock.now += 4.0
+        _post_key(KEYDOWN, K_RIGHT, display)
+        handler.poll()
+        clock.now += 6.0
+        handler.handle_input(level, MS_PER_FRAME)
+        assert handler.pump.latency_count == 1
+        # press is assumed halfway between the polls at 0 and 4 ms
+        assert handler.pump.latency_percentiles()[0] == pytest.approx(8.0)
@@ -0,0 +1,65 @@
+from bricks.array_rasterizer import ArrayRasterizer
+from bricks.array_rasterizer import BALL_SHADE
+from bricks.array_rasterizer import BRICK_SHADES
+from bricks.array_rasterizer import PLATFORM_SHADE
+from bricks.array_rasterizer import WALL_SHADE
+from bricks.level_generator import generate_level
+from bricks.pixel_scaling import PixelScaling
+from bricks.types.point import Point
+
+import numpy
+import pytest
+
+
+@pytest.fixture
+def level():
+    return generate_level(5)
+
+
+def _make_rasterizer(level, width=84, height=84):
+    return ArrayRasterizer(width, height, level.grid_width, level.grid_height)
+
+
+class TestArrayRasterizer:
+    def test_frame_shape(self, level):
+        frame = _make_rasterizer(level, 84, 64).render(level)
+        assert frame.shape == (64, 84)
+        assert frame.dtype == numpy.uint8
+
+    def test_frame_is_reused(self, level):
+        rasterizer = _make_rasterizer(level)
+        frame = rasterizer.render(level)
+        assert rasterizer.render(level) is frame
+        assert rasterizer.frame is frame
+
+    def test_objects_are_painted(self, level):
+        frame = _make_rasterizer(level).render(level)
+        assert frame[0, 0] == WALL_SHADE
+        assert frame[83, 0] == WALL_SHADE
+        assert PLATFORM_SHADE in frame
+        assert BALL_SHADE in frame
+        for brick in level.bricks:
+            assert BRICK_SHADES[brick.hitpoints] in frame
+
+    def test_destroyed_brick_is_not_painted(self, level):
+        rasterizer = _make_rasterizer(level, 260, 180)
+        frame = rasterizer.render(level).copy()
+        brick = level.bricks[0]
+        while not brick.is_destroyed():
+            brick.decrease_hitpoints()
+        changed = rasterizer.render(level) != frame
+        x, y, width, height = PixelScaling(
+            260, 180, level.grid_width, level.grid_height
+        ).to_pixel_rect(brick)
+        assert changed[y : y + height, x : x + width].all()
+        assert changed.sum() == width * height
+
+    def test_moving_ball_keeps_background(self, level):
+        rasterizer = _make_rasterizer(level)
+        rasterizer.render(level)
+        ball = level.balls[0]
+        ball.top_left = Point(ball.top_left.x, ball.top_left.y - 3.0)
+        frame = rasterizer.render(level)
+        assert (frame == BALL_SHADE).sum() > 0
+        level.balls = []
+        assert BALL_SHADE not in rasterizer.render(level)
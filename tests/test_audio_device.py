@@ -0,0 +1,77 @@
+from bricks.audio_device import AudioDevice
+from bricks.audio_device import play_hit_brick
+
+import pygame
+import pytest
+import threading
+
+
+@pytest.fixture
+def audio(monkeypatch):
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    yield
+    pygame.mixer.quit()
+
+
+class TestAudioDevice:
+    def test_opens_on_calling_thread(self, audio, monkeypatch):
+        threads = []
+        init = pygame.mixer.init
+
+        def recording_init():
+            threads.append(threading.current_thread())
+            init()
+
+        monkeypatch.setattr(pygame.mixer, "init", recording_init)
+        audio_device = AudioDevice()
+        assert threads == [threading.current_thread()]
+        assert audio_device.wait_until_ready(5.0)
+        assert audio_device.is_ready
+        assert not audio_device.is_failed
+        assert pygame.mixer.get_init() is not None
+        play_hit_brick(audio_device)
+
+    def test_sound_before_ready_is_skipped(self, audio, monkeypatch):
+        release = threading.Event()
+        sound = pygame.mixer.Sound
+
+        def slow_sound(filename):
+            release.wait(5.0)
+            return sound(filename)
+
+        monkeypatch.setattr(pygame.mixer, "Sound", slow_sound)
+        audio_device = AudioDevice()
+        play_hit_brick(audio_device)
+        assert not audio_device.is_ready
+        release.set()
+        assert audio_device.wait_until_ready(5.0)
+
+    def test_without_device_plays_nothing(self, audio, monkeypatch):
+        def fail():
+            raise pygame.error("No audio device")
+
+        monkeypatch.setattr(pygame.mixer, "init", fail)
+        audio_device = AudioDevice()
+        assert not audio_device.wait_until_ready()
+        assert audio_device.is_failed
+        play_hit_brick(audio_device)
+
+    def test_silent_device_does_not_open_mixer(self, audio, monkeypatch):
+        def fail():
+            raise AssertionError("Mixer opened")
+
+        monkeypatch.setattr(pygame.mixer, "init", fail)
+        audio_device = AudioDevice(is_silent=True)
+        assert not audio_device.wait_until_ready()
+        assert not audio_device.is_failed
+        play_hit_brick(audio_device)
+
+    def test_missing_sound_does_not_block(self, audio, monkeypatch):
+        def fail(filename):
+            raise IOError("No such file: %s" % filename)
+
+        monkeypatch.setattr(pygame.mixer, "Sound", fail)
+        audio_device = AudioDevice()
+        assert not audio_device.wait_until_ready()
+        assert audio_device.is_failed
+        play_hit_brick(audio_device)
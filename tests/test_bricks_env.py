@@ -0,0 +1,208 @@
+from bricks.bricks_env import BALL_VELOCITY_X
+from bricks.bricks_env import BALL_VELOCITY_Y
+from bricks.bricks_env import BALL_X
+from bricks.bricks_env import BALL_Y
+from bricks.bricks_env import BricksEnv
+from bricks.bricks_env import BricksVecEnv
+from bricks.bricks_env import IS_BALL_ACTIVE
+from bricks.bricks_env import PLATFORM_X
+from bricks.bricks_env import STATE_SIZE
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+from bricks.simulation import Action
+from bricks.simulation import MS_PER_FRAME
+
+import subprocess
+import sys
+
+import numpy
+import pytest
+
+
+def _make_level_pack():
+    return LevelPack(
+        [
+            ("level1.json", generate_level_data(1)),
+            ("level2.json", generate_level_data(2)),
+        ],
+        {},
+    )
+
+
+class TestBricksEnv:
+    def test_reset(self):
+        env = BricksEnv(_make_level_pack())
+        observation, info = env.reset()
+        level = env.simulation.level
+
+        assert observation["state"].shape == (STATE_SIZE,)
+        assert observation["state"].dtype == numpy.float32
+        assert observation["state"][PLATFORM_X] == level.platform.top_left.x
+        assert observation["state"][BALL_X] == level.balls[0].top_left.x
+        assert observation["state"][IS_BALL_ACTIVE] == 0.0
+        assert observation["bricks"].shape == env.grid_shape
+        assert info == {"score": 0, "lifes": 5, "level_idx": 1}
+
+    def test_brick_grid_contains_hitpoints(self):
+        env = BricksEnv(_make_level_pack())
+        observation, _ = env.reset()
+        bricks = env.simulation.level.bricks
+        assert observation["bricks"].sum() == sum(
+            brick.hitpoints * brick.width * brick.height for brick in bricks
+        )
+        brick = bricks[0]
+        x = int(brick.top_left.x)
+        y = int(brick.top_left.y)
+        assert observation["bricks"][y, x] == brick.hitpoints
+
+    def test_ball_velocity_includes_gravity(self):
+        env = BricksEnv(_make_level_pack())
+        env.reset()
+        env.step(Action.SPACE)
+        # The ball is reflected from the platform in the second frame.
+        observation, *_ = env.step(Action.NONE)
+        assert env.simulation.level.balls[0].gravity > 0.0
+        next_observation, *_ = env.step(Action.NONE)
+
+        state = observation["state"]
+        moved = next_observation["state"] - state
+        seconds = MS_PER_FRAME / 1000.0
+        assert moved[BALL_X] == pytest.approx(
+            state[BALL_VELOCITY_X] * seconds, rel=1e-3
+        )
+        assert moved[BALL_Y] == pytest.approx(
+            state[BALL_VELOCITY_Y] * seconds, rel=1e-3
+        )
+
+    def test_step_moves_platform(self):
+        env = BricksEnv(_make_level_pack())
+        observation, _ = env.reset()
+        x = observation["state"][PLATFORM_X]
+        observation, reward, is_terminated, is_truncated, _ = env.step(
+            Action.LEFT
+        )
+        assert observation["state"][PLATFORM_X] < x
+        assert reward == 0.0
+        assert not is_terminated
+        assert not is_truncated
+
+    def test_reward_is_scored_hitpoints(self):
+        env = BricksEnv(_make_level_pack(), is_fixed_point=True)
+        env.reset()
+        env.step(Action.SPACE)
+        total_reward = 0.0
+        for _ in range(600):
+            _, reward, _, _, info = env.step(Action.NONE)
+            total_reward += reward
+        assert total_reward > 0.0
+        assert total_reward * 100 == info["score"]
+
+    def test_reset_starts_again(self):
+        env = BricksEnv(_make_level_pack())
+        first_observation, _ = env.reset()
+        env.step(Action.SPACE)
+        for _ in range(100):
+            env.step(Action.RIGHT)
+        observation, info = env.reset()
+        assert numpy.array_equal(
+            observation["state"], first_observation["state"]
+        )
+        assert numpy.array_equal(
+            observation["bricks"], first_observation["bricks"]
+        )
+        assert info["score"] == 0
+
+    def test_truncates_after_max_frames(self):
+        env = BricksEnv(_make_level_pack(), max_frames=3)
+        env.reset()
+        assert not env.step(Action.NONE)[3]
+        assert not env.step(Action.NONE)[3]
+        assert env.step(Action.NONE)[3]
+
+    def test_does_not_import_pygame(self):
+        code = (
+            "import sys\n"
+            "from bricks.bricks_env import BricksVecEnv\n"
+            "assert 'pygame' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestBricksVecEnv:
+    def test_init_throws_ValueError(self):
+        with pytest.raises(ValueError):
+            BricksVecEnv(0, _make_level_pack())
+
+    def test_step_batches_observations(self):
+        vec_env = BricksVecEnv(3, _make_level_pack())
+        observations, infos = vec_env.reset()
+        assert observations["state"].shape == (3, STATE_SIZE)
+        assert observations["bricks"].shape == (3,) + (
+            vec_env.envs[0].grid_shape
+        )
+        assert len(infos) == 3
+
+        x = observations["state"][:, PLATFORM_X].copy()
+        observations, rewards, terminated, truncated, infos = vec_env.step(
+            [Action.LEFT, Action.NONE, Action.RIGHT]
+        )
+        assert observations["state"][0, PLATFORM_X] < x[0]
+        assert observations["state"][1, PLATFORM_X] == x[1]
+        assert observations["state"][2, PLATFORM_X] > x[2]
+        assert rewards.shape == (3,)
+        assert not terminated.any()
+        assert not truncated.any()
+
+    def test_matches_single_environments(self):
+        level_pack = _make_level_pack()
+        vec_env = BricksVecEnv(2, level_pack)
+        envs = [BricksEnv(level_pack), BricksEnv(level_pack)]
+        vec_env.reset()
+        for env in envs:
+            env.reset()
+        rng = numpy.random.default_rng(0)
+        for _ in range(200):
+            actions = rng.integers(0, 4, 2)
+            observations, rewards, *_ = vec_env.step(actions)
+            for idx, env in enumerate(envs):
+                observation, reward, *_ = env.step(actions[idx])
+                assert numpy.array_equal(
+                    observations["state"][idx], observation["state"]
+                )
+                assert numpy.array_equal(
+                    observations["bricks"][idx], observation["bricks"]
+                )
+                assert rewards[idx] == reward
+
+    def test_resets_truncated_environments(self):
+        vec_env = BricksVecEnv(2, _make_level_pack(), max_frames=2)
+        first_observations, _ = vec_env.reset()
+        first_states = first_observations["state"].copy()
+        vec_env.step([Action.LEFT, Action.LEFT])
+        observations, _, _, truncated, infos = vec_env.step(
+            [Action.LEFT, Action.LEFT]
+        )
+        assert truncated.all()
+        assert numpy.array_equal(observations["state"], first_states)
+
+        env = BricksEnv(_make_level_pack(), max_frames=2)
+        env.reset()
+        env.step(Action.LEFT)
+        final_observation, *_ = env.step(Action.LEFT)
+        for info in infos:
+            assert numpy.array_equal(
+                info["final_observation"]["state"], final_observation["state"]
+            )
+            assert numpy.array_equal(
+                info["final_observation"]["bricks"],
+                final_observation["bricks"],
+            )
+        assert not numpy.array_equal(
+            infos[0]["final_observation"]["state"], first_states[0]
+        )
+
+    def test_step_throws_ValueError_on_wrong_action_count(self):
+        vec_env = BricksVecEnv(2, _make_level_pack())
+        vec_env.reset()
+        with pytest.raises(ValueError):
+            vec_env.step([Action.NONE])
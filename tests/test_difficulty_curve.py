@@ -0,0 +1,108 @@
+from bricks.difficulty_curve import Curve
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.difficulty_curve import DifficultyTable
+from bricks.difficulty_curve import load_difficulty_curves
+from bricks.difficulty_curve import read_difficulty_curves_from_json_data
+from bricks.difficulty_curve import read_difficulty_curves_from_json_file
+from bricks.difficulty_parameters import DifficultyParameters
+
+import json
+import pytest
+
+
+class TestCurve:
+    @pytest.mark.parametrize(
+        "tier, level_idx, expected_value",
+        [(0, 1, 10.0), (0, 3, 12.0), (2, 1, 16.0), (2, 3, 18.0), (9, 1, 20.0)],
+    )
+    def test_value(self, tier, level_idx, expected_value):
+        curve = Curve(start=10.0, per_level=1.0, per_loop=3.0, maximum=20.0)
+        assert curve.value(tier, level_idx) == expected_value
+
+    def test_value_clamped_to_minimum(self):
+        assert Curve(start=4.0, per_loop=-1.0, minimum=2.0).value(5, 1) == 2.0
+
+
+class TestDifficultyTable:
+    def test_default_curves_match_default_parameters(self):
+        table = DifficultyTable(DEFAULT_CURVES, 5)
+        parameters = table.parameters(0, 1)
+        default = DifficultyParameters()
+        assert parameters.platform_velocity == default.platform_velocity
+        assert parameters.platform_width == default.platform_width
+        assert parameters.ball_velocity == default.ball_velocity
+        assert parameters.ball_gravity == default.ball_gravity
+
+    def test_tiers_after_last_repeat_last(self):
+        table = DifficultyTable(DEFAULT_CURVES, 5)
+        last = table.parameters(table.tier_count - 1, 5)
+        later = table.parameters(table.tier_count + 10, 7)
+        assert later.ball_velocity == last.ball_velocity
+        assert later.platform_width == last.platform_width
+
+    def test_changing_parameters_does_not_change_table(self):
+        table = DifficultyTable(DEFAULT_CURVES, 2)
+        table.parameters(1, 1).ball_velocity = 100.0
+        assert table.parameters(1, 1).ball_velocity == 18.0
+
+    def test_invalid_level_count(self):
+        with pytest.raises(ValueError):
+            DifficultyTable(DEFAULT_CURVES, 0)
+
+
+class TestReadDifficultyCurves:
+    def test_missing_entries_keep_defaults(self):
+        curves = read_difficulty_curves_from_json_data(
+            {"tier_count": 3, "ball_velocity": {"per_level": 0.5}}
+        )
+        assert curves.tier_count == 3
+        assert curves.ball_velocity.per_level == 0.5
+        assert curves.ball_velocity.start == DEFAULT_CURVES.ball_velocity.start
+        assert curves.platform_width == DEFAULT_CURVES.platform_width
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            [],
+            {"speed": {}},
+            {"tier_count": 0},
+            {"tier_count": 1.5},
+            {"ball_velocity": []},
+            {"ball_velocity": {"slope": 1.0}},
+            {"ball_velocity": {"start": "fast"}},
+            {"ball_velocity": {"start": True}},
+            {"ball_velocity": {"min": 5.0, "max": 4.0}},
+        ],
+    )
+    def test_invalid_data_throws_ValueError(self, data):
+        with pytest.raises(ValueError):
+            read_difficulty_curves_from_json_data(data)
+
+    def test_shipped_file_matches_defaults(self):
+        curves = read_difficulty_curves_from_json_file("difficulty.json")
+        assert curves == DEFAULT_CURVES
+
+    def test_invalid_json_throws_ValueError(self, tmp_path):
+        filename = tmp_path / "difficulty.json"
+        filename.write_text("{")
+        with pytest.raises(ValueError):
+            read_difficulty_curves_from_json_file(str(filename))
+
+    def test_read_file(self, tmp_path):
+        filename = tmp_path / "difficulty.json"
+        filename.write_text(json.dumps({"tier_count": 2}))
+        assert read_difficulty_curves_from_json_file(str(filename)) == (
+            DEFAULT_CURVES._replace(tier_count=2)
+        )
+
+    def test_load_missing_file_gives_defaults(self, tmp_path):
+        filename = str(tmp_path / "difficulty.json")
+        assert load_difficulty_curves(filename) == DEFAULT_CURVES
+
+    def test_load_file(self, tmp_path):
+        filename = tmp_path / "difficulty.json"
+        filename.write_text(json.dumps({"tier_count": 2}))
+        assert load_difficulty_curves(str(filename)).tier_count == 2
+        filename.write_text(json.dumps({"tier_count": 0}))
+        with pytest.raises(ValueError, match="Invalid difficulty file"):
+            load_difficulty_curves(str(filename))
@@ -0,0 +1,22 @@
+from bricks.difficulty_parameters import DifficultyParameters
+
+
+class TestDifficultyParameters:
+    def test_init(self):
+        parameters = DifficultyParameters(
+            platform_velocity=1.0,
+            platform_width=2.0,
+            ball_velocity=3.0,
+            ball_gravity=4.0,
+        )
+        assert parameters.platform_velocity == 1.0
+        assert parameters.platform_width == 2.0
+        assert parameters.ball_velocity == 3.0
+        assert parameters.ball_gravity == 4.0
+
+    def test_ball_velocity_is_independent_of_platform_velocity(self):
+        parameters = DifficultyParameters()
+        parameters.platform_velocity = 20.0
+        parameters.ball_velocity = 25.0
+        assert parameters.ball_velocity == 25.0
+        assert parameters.platform_velocity == 20.0
@@ -0,0 +1,33 @@
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.difficulty_sweep import sweep_tiers
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+
+import pytest
+
+
+def _make_level_pack():
+    return LevelPack([("level1.json", generate_level_data(1))], {})
+
+
+class TestSweepTiers:
+    def test_one_result_per_tier(self):
+        curves = DEFAULT_CURVES._replace(tier_count=3)
+        results = sweep_tiers(
+            _make_level_pack(), curves, game_count=2, max_frames=600
+        )
+        assert [result.tier for result in results] == [0, 1, 2]
+        for result in results:
+            assert result.game_count == 2
+            assert 0.0 < result.average_seconds <= 10.0
+            assert 0 <= result.capped_count <= 2
+
+    def test_is_deterministic(self):
+        curves = DEFAULT_CURVES._replace(tier_count=2)
+        first = sweep_tiers(_make_level_pack(), curves, 2, 600, seed=3)
+        second = sweep_tiers(_make_level_pack(), curves, 2, 600, seed=3)
+        assert first == second
+
+    def test_invalid_game_count(self):
+        with pytest.raises(ValueError):
+            sweep_tiers(_make_level_pack(), DEFAULT_CURVES, 0, 600)
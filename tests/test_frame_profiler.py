@@ -0,0 +1,50 @@
+from bricks.frame_profiler import FrameProfiler
+
+from pytest import approx
+from time import sleep
+
+
+class TestFrameProfiler:
+    def test_sections_are_summed_per_frame(self):
+        profiler = FrameProfiler(sections=("a", "b"), capacity=4)
+        profiler.begin_frame()
+        for _ in range(2):
+            profiler.start("a")
+            sleep(0.002)
+            profiler.stop("a")
+        profiler.end_frame()
+
+        p50_a = profiler.percentiles()["a"][0]
+        p50_b = profiler.percentiles()["b"][0]
+        p50_total = profiler.percentiles()["total"][0]
+        assert p50_a >= 4.0
+        assert p50_b == 0.0
+        assert p50_total >= p50_a
+
+    def test_ring_buffer_keeps_last_frames(self):
+        profiler = FrameProfiler(sections=("a",), capacity=3)
+        for _ in range(5):
+            profiler.begin_frame()
+            profiler.end_frame()
+
+        assert profiler.frame_count == 3
+        assert profiler.total_frame_count == 5
+
+    def test_percentiles_empty(self):
+        assert FrameProfiler().percentiles() == {}
+
+    def test_write_csv_oldest_frame_first(self, tmp_path):
+        profiler = FrameProfiler(sections=("a",), capacity=3)
+        for idx in range(4):
+            profiler.begin_frame()
+            profiler._current[0] = idx / 1000.0
+            profiler.end_frame()
+        filename = tmp_path / "frames.csv"
+
+        profiler.write_csv(str(filename))
+
+        lines = filename.read_text().splitlines()
+        assert lines[0] == "a,total"
+        assert [float(line.split(",")[0]) for line in lines[1:]] == approx(
+            [1.0, 2.0, 3.0]
+        )
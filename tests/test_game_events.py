@@ -0,0 +1,39 @@
+from bricks.game_events import BallLost
+from bricks.game_events import EventQueue
+from bricks.game_events import ExtraLife
+from bricks.game_events import PlatformHit
+
+
+class TestEventQueue:
+    def test_drain_passes_events_in_order(self):
+        queue = EventQueue()
+        received = []
+        queue.subscribe(BallLost, received.append)
+        queue.subscribe(ExtraLife, received.append)
+
+        queue.push(ExtraLife(6))
+        queue.push(PlatformHit())
+        queue.push(BallLost(5))
+        assert received == []
+        assert len(queue) == 3
+
+        queue.drain()
+        assert received == [ExtraLife(6), BallLost(5)]
+        assert len(queue) == 0
+
+    def test_drain_without_subscribers(self):
+        queue = EventQueue()
+        queue.push(PlatformHit())
+        queue.drain()
+        assert len(queue) == 0
+
+    def test_events_pushed_while_draining_are_drained(self):
+        queue = EventQueue()
+        received = []
+        queue.subscribe(BallLost, lambda event: queue.push(ExtraLife(1)))
+        queue.subscribe(ExtraLife, received.append)
+
+        queue.push(BallLost(0))
+        queue.drain()
+
+        assert received == [ExtraLife(1)]
@@ -0,0 +1,99 @@
+from bricks.gpu_renderer import GpuRenderer
+from bricks.level_generator import generate_level
+from bricks.renderer import Renderer
+
+import gc
+import numpy
+import pygame
+import pytest
+
+
+@pytest.fixture
+def level(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    yield generate_level(3)
+    # Windows must be destroyed before the video subsystem quits.
+    gc.collect()
+    pygame.display.quit()
+
+
+def _make_renderer(renderer_class, level, render_scale=1.0):
+    return renderer_class(
+        screen_width=260,
+        screen_height=180,
+        grid_width=level.grid_width,
+        grid_height=level.grid_height,
+        is_offscreen=True,
+        render_scale=render_scale,
+    )
+
+
+def _rendered_frame(renderer, level):
+    renderer.render(level)
+    return renderer.frame_as_array()
+
+
+class TestGpuRenderer:
+    @pytest.mark.parametrize("render_scale", [1.0, 0.5])
+    def test_frame_equals_renderer(self, level, render_scale):
+        level.bricks[0].hitpoints = 0
+        frame = _rendered_frame(
+            _make_renderer(GpuRenderer, level, render_scale), level
+        )
+        assert frame.shape == (180, 260, 3)
+        assert numpy.array_equal(
+            frame,
+            _rendered_frame(
+                _make_renderer(Renderer, level, render_scale), level
+            ),
+        )
+
+    def test_paused_frame_equals_renderer(self, level):
+        gpu_renderer = _make_renderer(GpuRenderer, level)
+        renderer = _make_renderer(Renderer, level)
+        gpu_renderer.is_paused = True
+        renderer.is_paused = True
+        assert numpy.array_equal(
+            _rendered_frame(gpu_renderer, level),
+            _rendered_frame(renderer, level),
+        )
+
+    def test_hud_and_overlay(self, level):
+        frames = []
+        for renderer_class in (GpuRenderer, Renderer):
+            renderer = _make_renderer(renderer_class, level)
+            renderer.hud_text = "Level: 3"
+            renderer.overlay_lines = ["render 1.0 ms"]
+            frames.append(_rendered_frame(renderer, level))
+        assert not numpy.array_equal(
+            frames[0], _rendered_frame(_make_renderer(Renderer, level), level)
+        )
+        # Blending of the antialiased text may differ by rounding.
+        difference = numpy.abs(frames[0].astype(int) - frames[1])
+        assert difference.max() <= 2
+
+    def test_resize(self, level):
+        renderer = _make_renderer(GpuRenderer, level)
+        renderer.render(level)
+        renderer.resize(520, 360)
+        frame = _rendered_frame(renderer, level)
+        expected = Renderer(
+            screen_width=520,
+            screen_height=360,
+            grid_width=level.grid_width,
+            grid_height=level.grid_height,
+            is_offscreen=True,
+        )
+        assert numpy.array_equal(frame, _rendered_frame(expected, level))
+
+    def test_window_title(self, level):
+        renderer = GpuRenderer(
+            screen_width=260,
+            screen_height=180,
+            grid_width=level.grid_width,
+            grid_height=level.grid_height,
+        )
+        renderer.window_title = "title"
+        renderer.render(level)
+        assert renderer.window_title == "title"
+        assert renderer.screen_size == (260, 180)
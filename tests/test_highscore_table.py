@@ -0,0 +1,85 @@
+from bricks.highscore_table import HighscoreTable
+from bricks.highscore_table import default_data_dir
+from bricks.highscore_table import highscore_key
+
+import json
+import os
+
+
+class TestHighscoreTable:
+    def test_empty_table(self, tmp_path):
+        table = HighscoreTable(str(tmp_path / "highscores.json"))
+        assert table.best("level/0") == 0
+        assert table.scores("level/0") == []
+
+    def test_add_keeps_best_scores_sorted(self, tmp_path):
+        table = HighscoreTable(str(tmp_path / "highscores.json"), 3)
+        for score in (300, 100, 500, 200):
+            table.add("level/0", score)
+        table.close()
+        assert table.scores("level/0") == [500, 300, 200]
+        assert table.best("level/0") == 500
+
+    def test_add_too_low_score(self, tmp_path):
+        table = HighscoreTable(str(tmp_path / "highscores.json"), 2)
+        assert table.add("level/0", 300)
+        assert table.add("level/0", 300)
+        assert not table.add("level/0", 300)
+        assert not table.add("level/0", 100)
+        table.close()
+        assert table.scores("level/0") == [300, 300]
+
+    def test_scores_are_kept_per_key(self, tmp_path):
+        table = HighscoreTable(str(tmp_path / "highscores.json"))
+        table.add(highscore_key("level", 0), 100)
+        table.add(highscore_key("level", 1), 200)
+        table.close()
+        assert table.scores("level/0") == [100]
+        assert table.scores("level/1") == [200]
+
+    def test_written_table_is_read_again(self, tmp_path):
+        filename = str(tmp_path / "data" / "highscores.json")
+        table = HighscoreTable(filename)
+        table.add("level/0", 100)
+        table.add("level/0", 400)
+        table.close()
+        assert HighscoreTable(filename).scores("level/0") == [400, 100]
+        assert os.listdir(str(tmp_path / "data")) == ["highscores.json"]
+
+    def test_scores_of_other_instance_are_merged(self, tmp_path):
+        filename = str(tmp_path / "highscores.json")
+        table1 = HighscoreTable(filename)
+        table2 = HighscoreTable(filename)
+        table1.add("level/0", 100)
+        table1.close()
+        table2.add("level/0", 200)
+        table2.add("level/1", 300)
+        table2.close()
+        table = HighscoreTable(filename)
+        assert table.scores("level/0") == [200, 100]
+        assert table.scores("level/1") == [300]
+
+    def test_invalid_file_is_ignored(self, tmp_path):
+        filename = str(tmp_path / "highscores.json")
+        with open(filename, "w") as file:
+            file.write("{no json")
+        table = HighscoreTable(filename)
+        assert table.best("level/0") == 0
+        table.add("level/0", 100)
+        table.close()
+        with open(filename) as file:
+            assert json.load(file) == {"level/0": [100]}
+
+    def test_close_without_writes(self, tmp_path):
+        table = HighscoreTable(str(tmp_path / "highscores.json"))
+        table.close()
+        assert not os.path.exists(table.filename)
+
+    def test_default_data_dir_from_environment(self, monkeypatch):
+        monkeypatch.setenv("BRICKS_DATA_DIR", "/tmp/bricks-data")
+        assert default_data_dir() == "/tmp/bricks-data"
+
+    def test_default_data_dir(self, monkeypatch):
+        monkeypatch.delenv("BRICKS_DATA_DIR", raising=False)
+        monkeypatch.setenv("XDG_DATA_HOME", "/tmp/xdg")
+        assert default_data_dir() == os.path.join("/tmp/xdg", "bricks")
@@ -0,0 +1,53 @@
+from bricks.hud import Hud
+from bricks.hud import HudMode
+
+
+class _FakeRenderer:
+    def __init__(self):
+        self.window_title = ""
+        self.hud_text = ""
+        self.title_updates = 0
+
+    def __setattr__(self, name, value):
+        if name == "window_title" and value:
+            object.__setattr__(self, "title_updates", self.title_updates + 1)
+        object.__setattr__(self, name, value)
+
+
+class TestHud:
+    def test_flush_only_if_dirty(self):
+        hud = Hud()
+        renderer = _FakeRenderer()
+
+        assert hud.flush(renderer)
+        assert not hud.flush(renderer)
+        hud.score = 0
+        assert not hud.flush(renderer)
+        hud.score = 100
+        hud.lifes = 4
+        assert hud.flush(renderer)
+
+        assert renderer.title_updates == 2
+        assert "Lifes: 4" in renderer.window_title
+        assert "Score: 100" in renderer.window_title
+
+    def test_flush_interval(self):
+        hud = Hud(flush_interval_in_ms=60000.0)
+        renderer = _FakeRenderer()
+
+        assert hud.flush(renderer)
+        hud.score = 100
+        assert not hud.flush(renderer)
+        assert hud.is_dirty
+        assert hud.flush(renderer, force=True)
+        assert not hud.is_dirty
+
+    def test_in_window_mode(self):
+        hud = Hud(mode=HudMode.IN_WINDOW)
+        renderer = _FakeRenderer()
+        hud.level = 3
+
+        hud.flush(renderer)
+
+        assert renderer.window_title == ""
+        assert renderer.hud_text.startswith("Level: 3")
@@ -0,0 +1,87 @@
+from bricks.input_pump import InputPump
+
+import pygame
+import pytest
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.event.clear()
+    yield
+    pygame.display.quit()
+
+
+def _post_user_event(number: int):
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, number=number))
+
+
+class TestInputPump:
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            InputPump(capacity=0)
+
+    def test_events_are_spread_since_last_poll(self, display):
+        clock = _Clock()
+        pump = InputPump(clock)
+        clock.now = 9.0
+        for number in range(2):
+            _post_user_event(number)
+        pump.poll()
+        events = pump.drain()
+        assert [event.event.number for event in events] == [0, 1]
+        assert [event.timestamp for event in events] == [3.0, 6.0]
+        assert pump.drain() == []
+
+    def test_polls_accumulate_until_drained(self, display):
+        clock = _Clock()
+        pump = InputPump(clock)
+        _post_user_event(0)
+        clock.now = 2.0
+        pump.poll()
+        _post_user_event(1)
+        clock.now = 4.0
+        pump.poll()
+        assert [event.timestamp for event in pump.drain()] == [1.0, 3.0]
+
+    def test_full_buffer_drops_oldest(self, display):
+        pump = InputPump(_Clock(), capacity=2)
+        for number in range(3):
+            _post_user_event(number)
+        pump.poll()
+        assert [event.event.number for event in pump.drain()] == [1, 2]
+        assert pump.dropped_count == 1
+
+    def test_latency_percentiles(self):
+        clock = _Clock()
+        pump = InputPump(clock, latency_capacity=3)
+        assert pump.latency_percentiles() == (0.0, 0.0, 0.0)
+        clock.now = 10.0
+        for timestamp in (9.0, 8.0, 7.0, 6.0):
+            pump.record_latency(timestamp)
+        assert pump.latency_count == 3
+        assert pump.latency_percentiles()[0] == pytest.approx(3.0)
+        assert "input lat" in pump.latency_summary_line()
+        assert pump.motion_latency_count == 0
+
+    def test_motion_latencies_are_kept_apart(self):
+        clock = _Clock()
+        pump = InputPump(clock)
+        clock.now = 10.0
+        pump.record_latency(8.0)
+        for _ in range(100):
+            pump.record_motion_latency(9.5)
+        assert pump.latency_count == 1
+        assert pump.latency_percentiles() == (2.0, 2.0, 2.0)
+        assert pump.motion_latency_count == 100
+        assert pump.motion_latency_percentiles()[0] == pytest.approx(0.5)
+        assert "mouse lat" in pump.motion_latency_summary_line()
@@ -0,0 +1,110 @@
+from bricks.difficulty_curve import Curve
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.difficulty_parameters import DifficultyParameters
+from bricks.input_recording import InputRecording
+from bricks.input_recording import VERSION
+from bricks.input_recording import ReplayInputHandler
+from bricks.input_recording import read_input_recording_from_file
+from bricks.input_recording import write_input_recording_to_file
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+from bricks.simulation import Action
+from bricks.simulation import Simulation
+
+import pytest
+
+
+class TestInputRecording:
+    def test_append_run_length_encodes(self):
+        recording = InputRecording()
+        for event in [0, 0, 0, 2, 2, 4, 0]:
+            recording.append(event)
+
+        assert recording._runs == [[0, 3], [2, 2], [4, 1], [0, 1]]
+        assert recording.frame_count == 7
+        assert list(recording.events()) == [0, 0, 0, 2, 2, 4, 0]
+
+    def test_write_and_read(self, tmp_path):
+        recording = InputRecording(
+            start_level_idx=3,
+            difficulty_parameters=DifficultyParameters(
+                platform_velocity=18.0, platform_width=3.5, ball_gravity=2.0
+            ),
+            is_fixed_point=True,
+            difficulty_curves=DEFAULT_CURVES._replace(
+                tier_count=3,
+                ball_gravity=Curve(start=1.0, per_level=0.25, maximum=4.0),
+            ),
+        )
+        for event in [0] * 1000 + [3] * 200 + [6]:
+            recording.append(event)
+        filename = str(tmp_path / "session.rec")
+
+        write_input_recording_to_file(recording, filename)
+        result = read_input_recording_from_file(filename)
+
+        assert result.start_level_idx == 3
+        assert result.difficulty_parameters.platform_velocity == 18.0
+        assert result.difficulty_parameters.platform_width == 3.5
+        assert result.difficulty_parameters.ball_gravity == 2.0
+        assert result.is_fixed_point
+        assert result.difficulty_curves == recording.difficulty_curves
+        assert list(result.events()) == list(recording.events())
+
+    def test_replay_starts_with_recorded_curves(self, tmp_path):
+        curves = DEFAULT_CURVES._replace(
+            ball_velocity=Curve(start=20.0, per_loop=2.0, maximum=30.0)
+        )
+        level_pack = LevelPack([("level1.json", generate_level_data(1))], {})
+        recorded = Simulation(level_pack, difficulty_curves=curves)
+        recording = InputRecording(difficulty_curves=curves)
+        for frame in range(300):
+            action = Action.SPACE if frame == 0 else Action(frame // 30 % 3)
+            recording.append(action.value)
+            recorded.step(action)
+        filename = tmp_path / "session.rec"
+        write_input_recording_to_file(recording, filename)
+        result = read_input_recording_from_file(filename)
+
+        replayed = Simulation(
+            level_pack,
+            difficulty_parameters=result.difficulty_parameters,
+            difficulty_curves=result.difficulty_curves,
+        )
+        for event in result.events():
+            replayed.step(Action(event))
+        assert result.difficulty_parameters.ball_velocity == 20.0
+        assert replayed.score == recorded.score
+        assert [
+            (ball.top_left.x, ball.top_left.y)
+            for ball in replayed.level.balls
+        ] == [
+            (ball.top_left.x, ball.top_left.y)
+            for ball in recorded.level.balls
+        ]
+
+    def test_read_invalid_file_throws_ValueError(self, tmp_path):
+        filename = tmp_path / "invalid.rec"
+        filename.write_bytes(b"no recording at all, just some bytes.....")
+        with pytest.raises(ValueError):
+            read_input_recording_from_file(str(filename))
+
+    def test_read_older_version_throws_ValueError(self, tmp_path):
+        filename = str(tmp_path / "session.rec")
+        write_input_recording_to_file(InputRecording(), filename)
+        data = bytearray(open(filename, "rb").read())
+        data[4] = VERSION - 1
+        with open(filename, "wb") as file:
+            file.write(data)
+        with pytest.raises(ValueError):
+            read_input_recording_from_file(filename)
+
+    def test_replay_input_handler_quits_after_last_frame(self):
+        recording = InputRecording()
+        recording.append(ReplayInputHandler._Event.right.value)
+        input_handler = ReplayInputHandler(recording)
+
+        input_handler._update_input_event()
+        assert input_handler._input_event == ReplayInputHandler._Event.right
+        input_handler._update_input_event()
+        assert input_handler._input_event == ReplayInputHandler._Event.quit
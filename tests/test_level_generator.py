@@ -0,0 +1,68 @@
+from bricks.level_generator import GeneratorParameters
+from bricks.level_generator import IndestructiblePattern
+from bricks.level_generator import generate_level
+from bricks.level_generator import generate_level_data
+from bricks.level_generator import write_level_to_json_file
+from bricks.level_pack import load_level_pack
+from bricks.level_pack import validate_level_data
+
+import pytest
+
+
+class TestLevelGenerator:
+    def test_same_seed_same_level(self):
+        assert generate_level_data(7) == generate_level_data(7)
+        assert generate_level_data(7) != generate_level_data(8)
+
+    @pytest.mark.parametrize("pattern", list(IndestructiblePattern))
+    def test_generated_levels_are_valid(self, pattern):
+        parameters = GeneratorParameters(
+            grid_width=40,
+            grid_height=30,
+            density=0.8,
+            indestructible_pattern=pattern,
+            indestructible_density=0.2,
+        )
+        for seed in range(20):
+            data = generate_level_data(seed, parameters)
+            assert validate_level_data(data) == []
+
+    def test_density_zero_has_one_brick(self):
+        parameters = GeneratorParameters(
+            density=0.0,
+            indestructible_pattern=IndestructiblePattern.RANDOM,
+            indestructible_density=1.0,
+        )
+        data = generate_level_data(3, parameters)
+        assert len(data["bricks"]) == 1
+        assert validate_level_data(data) == []
+
+    def test_hitpoint_weights(self):
+        parameters = GeneratorParameters(
+            density=1.0, hitpoint_weights=(0, 0, 0, 0, 0, 0, 0, 0, 1)
+        )
+        data = generate_level_data(1, parameters)
+        assert all(brick["hitpoints"] == 9 for brick in data["bricks"])
+
+    def test_invalid_hitpoint_weights_throws_ValueError(self):
+        with pytest.raises(ValueError):
+            GeneratorParameters(hitpoint_weights=(1, 2))
+
+    def test_generate_level_matches_level_data(self, tmp_path):
+        parameters = GeneratorParameters(
+            indestructible_pattern=IndestructiblePattern.PILLARS
+        )
+        write_level_to_json_file(
+            generate_level_data(5, parameters), str(tmp_path / "1.json")
+        )
+        from_file = load_level_pack(str(tmp_path)).make_level(1)
+        generated = generate_level(5, parameters)
+
+        assert len(generated.bricks) == len(from_file.bricks)
+        assert len(generated.indestructible_bricks) == len(
+            from_file.indestructible_bricks
+        )
+        for a, b in zip(generated.bricks, from_file.bricks):
+            assert a.top_left.x == b.top_left.x
+            assert a.top_left.y == b.top_left.y
+            assert a.hitpoints == b.hitpoints
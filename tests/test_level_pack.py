@@ -0,0 +1,175 @@
+from bricks import level_pack as level_pack_module
+from bricks.level_pack import load_level_pack
+from bricks.level_pack import validate_level_data
+from bricks.level_pack import _find_overlapping_rects
+
+import json
+import os
+import pytest
+
+
+def _brick(x, y, hitpoints=1, width=1.0, height=1.0):
+    return {
+        "top_left_x": x,
+        "top_left_y": y,
+        "width": width,
+        "height": height,
+        "hitpoints": hitpoints,
+    }
+
+
+def _level(bricks, indestructible_bricks=[]):
+    return {
+        "width": 26,
+        "height": 18,
+        "bricks": bricks,
+        "indestructible bricks": indestructible_bricks,
+    }
+
+
+class TestLevelPack:
+    def test_validate_valid_level(self):
+        data = _level([_brick(6.0, 5.0), _brick(7.0, 5.0)])
+        assert validate_level_data(data) == []
+
+    def test_validate_missing_size(self):
+        errors = validate_level_data({"bricks": []})
+        assert len(errors) == 2
+
+    @pytest.mark.parametrize("hitpoints", [(0), (10), (2.5)])
+    def test_validate_hitpoints_out_of_range(self, hitpoints):
+        errors = validate_level_data(_level([_brick(6.0, 5.0, hitpoints)]))
+        assert len(errors) == 1
+        assert "hitpoints" in errors[0]
+
+    def test_validate_missing_brick_keys(self):
+        errors = validate_level_data(_level([{"top_left_x": 1.0}]))
+        assert len(errors) == 4
+
+    @pytest.mark.parametrize(
+        "x, y", [(-1.0, 5.0), (25.5, 5.0), (6.0, -0.5), (6.0, 17.5)]
+    )
+    def test_validate_outside_of_board(self, x, y):
+        errors = validate_level_data(_level([_brick(x, y)]))
+        assert len(errors) == 1
+        assert "Outside" in errors[0]
+
+    def test_validate_overlap_with_indestructible_brick(self):
+        data = _level(
+            [_brick(6.0, 5.0)],
+            [
+                {
+                    "top_left_x": 6.5,
+                    "top_left_y": 3.0,
+                    "width": 0.5,
+                    "height": 10.0,
+                }
+            ],
+        )
+        errors = validate_level_data(data)
+        assert errors == ["bricks[0] overlaps with indestructible bricks[0]"]
+
+    def test_validate_reports_all_errors(self):
+        data = _level(
+            [_brick(6.0, 5.0, 0), _brick(30.0, 5.0), _brick(1.0, 1.0)]
+            + [_brick(1.5, 1.0)]
+        )
+        assert len(validate_level_data(data)) == 3
+
+    def test_find_overlapping_rects_touching_is_no_overlap(self):
+        rects = [
+            (0.0, 0.0, 1.0, 1.0, "a"),
+            (1.0, 0.0, 2.0, 1.0, "b"),
+            (0.0, 1.0, 1.0, 2.0, "c"),
+        ]
+        assert _find_overlapping_rects(rects) == []
+
+    def test_load_level_pack(self, tmp_path):
+        for idx in range(1, 4):
+            with open(tmp_path / ("%s.json" % idx), "w") as file:
+                json.dump(_level([_brick(float(idx), 5.0)]), file)
+        with open(tmp_path / "4.json", "w") as file:
+            file.write("{ no json")
+
+        level_pack = load_level_pack(str(tmp_path), max_workers=2)
+
+        assert len(level_pack) == 3
+        assert list(level_pack.errors) == [str(tmp_path / "4.json")]
+        level = level_pack.make_level(2)
+        assert level.bricks[0].top_left.x == 3.0
+        assert level_pack.make_level(2) is not level
+
+    def test_load_level_pack_in_parallel(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(level_pack_module, "PARALLEL_PARSE_MIN_BYTES", 0)
+        for idx in range(1, 4):
+            with open(tmp_path / ("%s.json" % idx), "w") as file:
+                json.dump(_level([_brick(float(idx), 5.0)]), file)
+        with open(tmp_path / "4.json", "w") as file:
+            file.write("{ no json")
+
+        level_pack = load_level_pack(str(tmp_path), max_workers=2)
+
+        assert len(level_pack) == 3
+        assert list(level_pack.errors) == [str(tmp_path / "4.json")]
+        assert level_pack.make_level(3).bricks[0].top_left.x == 4.0
+
+    def test_load_level_pack_uses_cache(self, tmp_path):
+        filename = tmp_path / "1.json"
+        with open(filename, "w") as file:
+            json.dump(_level([_brick(1.0, 5.0)]), file)
+        load_level_pack(str(tmp_path))
+
+        with open(filename, "w") as file:
+            json.dump(_level([_brick(2.0, 5.0)]), file)
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        level_pack = load_level_pack(str(tmp_path))
+        assert level_pack.make_level(1).bricks[0].top_left.x == 3.0
+
+    def test_load_level_pack_again_is_cache_hit(
+        self, tmp_path, data_dir, monkeypatch
+    ):
+        for idx in range(1, 3):
+            with open(tmp_path / ("%s.json" % idx), "w") as file:
+                json.dump(_level([_brick(float(idx), 5.0)]), file)
+        load_level_pack(str(tmp_path))
+        assert (data_dir / level_pack_module.CACHE_FILENAME).exists()
+        assert sorted(os.listdir(tmp_path)) == ["1.json", "2.json"]
+
+        def fail(content):
+            raise AssertionError("Level parsed again")
+
+        monkeypatch.setattr(level_pack_module, "_parse_and_validate", fail)
+        level_pack = load_level_pack(str(tmp_path))
+        assert level_pack.make_level(2).bricks[0].top_left.x == 3.0
+
+        # Like in a new process only the cache file is left.
+        monkeypatch.setattr(level_pack_module, "_cache", {})
+        level_pack = load_level_pack(str(tmp_path))
+        assert len(level_pack) == 2
+        assert level_pack.make_level(1).bricks[0].top_left.x == 2.0
+
+    def test_load_level_pack_keeps_cache_of_other_folders(
+        self, tmp_path_factory, data_dir
+    ):
+        folders = [tmp_path_factory.mktemp("levels") for _ in range(2)]
+        for folder in folders:
+            with open(folder / "1.json", "w") as file:
+                json.dump(_level([_brick(1.0, 5.0)]), file)
+            load_level_pack(str(folder), cache_dir=str(data_dir))
+
+        with open(data_dir / level_pack_module.CACHE_FILENAME) as file:
+            cached_folders = json.load(file)["folders"]
+        assert sorted(cached_folders) == sorted(str(f) for f in folders)
+
+    def test_load_level_pack_ignores_broken_cache_file(
+        self, tmp_path, data_dir
+    ):
+        with open(tmp_path / "1.json", "w") as file:
+            json.dump(_level([_brick(1.0, 5.0)]), file)
+        with open(data_dir / level_pack_module.CACHE_FILENAME, "w") as file:
+            file.write("{ no json")
+
+        level_pack = load_level_pack(str(tmp_path))
+        assert len(level_pack) == 1
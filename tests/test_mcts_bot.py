@@ -0,0 +1,105 @@
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+from bricks.mcts_bot import MctsBot
+from bricks.mcts_bot import SearchParameters
+from bricks.mcts_bot import play
+from bricks.simulation import Action
+from bricks.simulation import START_LIFES
+from bricks.simulation import Simulation
+
+import pytest
+
+
+def _make_level_pack():
+    return LevelPack([("level1.json", generate_level_data(1))], {})
+
+
+def _actions(bot, simulation, frame_count):
+    actions = []
+    for _ in range(frame_count):
+        action = bot.choose_action(simulation)
+        actions.append(action)
+        simulation.step(action)
+        simulation.event_queue.drain()
+    return actions
+
+
+class TestSearchParameters:
+    @pytest.mark.parametrize(
+        "frames_per_action, rollout_frames", [(0, 60), (4, 0)]
+    )
+    def test_init_throws_ValueError(self, frames_per_action, rollout_frames):
+        with pytest.raises(ValueError):
+            SearchParameters(
+                frames_per_action=frames_per_action,
+                rollout_frames=rollout_frames,
+            )
+
+
+class TestMctsBot:
+    def test_init_throws_ValueError(self):
+        with pytest.raises(ValueError):
+            MctsBot(_make_level_pack(), worker_count=0)
+
+    def test_starts_balls(self):
+        level_pack = _make_level_pack()
+        bot = MctsBot(level_pack, iteration_limit=1)
+        assert bot.choose_action(Simulation(level_pack)) == Action.SPACE
+        assert bot.last_iteration_count == 0
+
+    def test_searches_each_frame(self):
+        level_pack = _make_level_pack()
+        simulation = Simulation(level_pack, is_fixed_point=True)
+        bot = MctsBot(level_pack, is_fixed_point=True, iteration_limit=3)
+        _actions(bot, simulation, 10)
+        assert bot.last_iteration_count == 3
+
+    def test_is_repeatable_with_iteration_limit(self):
+        level_pack = _make_level_pack()
+        action_lists = []
+        for _ in range(2):
+            simulation = Simulation(level_pack, is_fixed_point=True)
+            bot = MctsBot(
+                level_pack, is_fixed_point=True, iteration_limit=2, seed=7
+            )
+            action_lists.append(_actions(bot, simulation, 120))
+        assert action_lists[0] == action_lists[1]
+        assert len(set(action_lists[0])) > 1
+
+    def test_does_not_change_played_simulation(self):
+        level_pack = _make_level_pack()
+        simulation = Simulation(level_pack, is_fixed_point=True)
+        simulation.step(Action.SPACE)
+        snapshot = simulation.snapshot()
+        bot = MctsBot(level_pack, is_fixed_point=True, iteration_limit=5)
+        bot.choose_action(simulation)
+        assert simulation.snapshot() == snapshot
+        assert len(simulation.event_queue) == 0
+
+    def test_keeps_the_ball(self):
+        level_pack = _make_level_pack()
+        simulation = Simulation(level_pack, is_fixed_point=True)
+        bot = MctsBot(level_pack, is_fixed_point=True, iteration_limit=2)
+        play(simulation, bot, 600)
+        assert simulation.lifes >= START_LIFES
+        assert simulation.score > 0
+
+    def test_thread_and_process_pool_give_same_actions(self):
+        level_pack = _make_level_pack()
+        action_lists = []
+        for use_processes in (False, True):
+            simulation = Simulation(level_pack, is_fixed_point=True)
+            bot = MctsBot(
+                level_pack,
+                is_fixed_point=True,
+                worker_count=2,
+                use_processes=use_processes,
+                iteration_limit=2,
+                seed=3,
+            )
+            try:
+                action_lists.append(_actions(bot, simulation, 40))
+            finally:
+                bot.close()
+            assert bot.last_iteration_count == 4
+        assert action_lists[0] == action_lists[1]
@@ -0,0 +1,12 @@
+from bricks.game_objects.wall import Wall
+from bricks.pixel_scaling import PixelScaling
+from bricks.types.point import Point
+
+
+class TestPixelScaling:
+    def test_to_pixel_rect_truncates(self):
+        scaling = PixelScaling(100, 50, 10, 20)
+        obj = Wall(top_left=Point(1.5, 3.0), width=0.75, height=1.1)
+        assert scaling.width_factor == 10.0
+        assert scaling.height_factor == 2.5
+        assert scaling.to_pixel_rect(obj) == (15, 7, 7, 2)
@@ -0,0 +1,122 @@
+from bricks.level_generator import generate_level
+from bricks.renderer import Renderer
+
+import numpy
+import pygame
+import pytest
+
+
+@pytest.fixture
+def level():
+    return generate_level(3)
+
+
+def _make_renderer(level, width=260, height=180):
+    return Renderer(
+        screen_width=width,
+        screen_height=height,
+        grid_width=level.grid_width,
+        grid_height=level.grid_height,
+        is_offscreen=True,
+    )
+
+
+class TestRenderer:
+    def test_offscreen_opens_no_window(self, level):
+        renderer = _make_renderer(level)
+        renderer.window_title = "title"
+        renderer.render(level)
+        assert renderer.is_offscreen
+        assert pygame.display.get_surface() is None
+
+    def test_frame_as_array(self, level):
+        renderer = _make_renderer(level)
+        renderer.render(level)
+        frame = renderer.frame_as_array()
+        assert frame.shape == (180, 260, 3)
+        assert frame.dtype == numpy.uint8
+        # background and brown top wall
+        assert tuple(frame[90, 130]) != (0, 0, 0)
+        assert tuple(frame[5, 130]) == (0xBF, 0x80, 0x40)
+
+    def test_frame_as_array_into_out(self, level):
+        renderer = _make_renderer(level, 104, 72)
+        renderer.render(level)
+        out = numpy.zeros((72, 104, 3), dtype=numpy.uint8)
+        assert renderer.frame_as_array(out) is out
+        assert numpy.array_equal(out, renderer.frame_as_array())
+
+    def test_pause_changes_colors(self, level):
+        renderer = _make_renderer(level)
+        renderer.render(level)
+        frame = renderer.frame_as_array()
+        renderer.is_paused = True
+        renderer.render(level)
+        assert not numpy.array_equal(frame, renderer.frame_as_array())
+
+    def test_resize(self, level):
+        renderer = _make_renderer(level)
+        renderer.render(level)
+        renderer.resize(520, 360)
+        renderer.render(level)
+        assert renderer.screen_size == (520, 360)
+        frame = renderer.frame_as_array()
+        assert frame.shape == (360, 520, 3)
+        assert numpy.array_equal(
+            frame, _rendered_frame(_make_renderer(level, 520, 360), level)
+        )
+
+    def test_resize_rejects_empty_size(self, level):
+        renderer = _make_renderer(level)
+        with pytest.raises(ValueError):
+            renderer.resize(0, 180)
+
+    def test_render_scale(self, level):
+        renderer = Renderer(
+            screen_width=260,
+            screen_height=180,
+            grid_width=level.grid_width,
+            grid_height=level.grid_height,
+            is_offscreen=True,
+            render_scale=0.5,
+        )
+        assert renderer.render_size == (130, 90)
+        frame = _rendered_frame(renderer, level)
+        assert frame.shape == (180, 260, 3)
+        assert tuple(frame[5, 130]) == (0xBF, 0x80, 0x40)
+
+    @pytest.mark.parametrize("render_scale", [0.0, 1.5])
+    def test_invalid_render_scale(self, level, render_scale):
+        with pytest.raises(ValueError):
+            Renderer(
+                screen_width=260,
+                screen_height=180,
+                grid_width=level.grid_width,
+                grid_height=level.grid_height,
+                is_offscreen=True,
+                render_scale=render_scale,
+            )
+
+    def test_cached_bricks_follow_level(self, level):
+        renderer = _make_renderer(level)
+        renderer.render(level)
+        level.bricks[0].hitpoints = 0
+        assert numpy.array_equal(
+            _rendered_frame(renderer, level),
+            _rendered_frame(_make_renderer(level), level),
+        )
+        other_level = generate_level(4)
+        assert numpy.array_equal(
+            _rendered_frame(renderer, other_level),
+            _rendered_frame(_make_renderer(other_level), other_level),
+        )
+        level.bricks = level.bricks[1:]
+        assert numpy.array_equal(
+            _rendered_frame(renderer, level),
+            _rendered_frame(_make_renderer(level), level),
+        )
+
+
+def _rendered_frame(renderer, level):
+    renderer.render(level)
+    return renderer.frame_as_array()
@@ -0,0 +1,120 @@
+from bricks import game
+from bricks import replay_exporter
+from bricks.input_recording import InputRecording
+from bricks.replay_exporter import FramePipe
+from bricks.replay_exporter import export_replay
+from bricks.replay_exporter import ffmpeg_command
+
+import os
+import sys
+
+import numpy
+import pygame
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _copy_command(filename, width, height, fps):
+    """Encoder which writes the raw frames unchanged to filename."""
+    return [
+        sys.executable,
+        "-c",
+        "import shutil, sys; "
+        "shutil.copyfileobj(sys.stdin.buffer, open(sys.argv[1], 'wb'))",
+        filename,
+    ]
+
+
+@pytest.fixture
+def game_environment(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.chdir(REPO_DIR)
+
+
+class TestFramePipe:
+    def test_frames_are_written_in_order(self, tmp_path):
+        filename = str(tmp_path / "frames.raw")
+        pipe = FramePipe(_copy_command(filename, 2, 2, 60.0), (2, 2, 3), 2)
+        for value in range(10):
+            frame = pipe.acquire()
+            frame.fill(value)
+            pipe.submit(frame)
+        pipe.close()
+        data = numpy.fromfile(filename, dtype=numpy.uint8)
+        assert numpy.array_equal(data, numpy.repeat(numpy.arange(10), 12))
+
+    def test_failing_encoder(self, tmp_path):
+        pipe = FramePipe([sys.executable, "-c", "exit(3)"], (2, 2, 3), 1)
+        for _ in range(3):
+            pipe.submit(pipe.acquire())
+        with pytest.raises(IOError):
+            pipe.close()
+
+
+class TestReplayExporter:
+    def test_ffmpeg_command(self):
+        command = ffmpeg_command("clip.mp4", 780, 540, 30.0)
+        assert command[0] == "ffmpeg"
+        assert "780x540" in command
+        assert command[-1] == "clip.mp4"
+        assert "paletteuse" in " ".join(ffmpeg_command("a.gif", 2, 2, 30.0))
+
+    @pytest.mark.parametrize(
+        "frame_skip, expected_frames", [(1, 121), (3, 41), (7, 18)]
+    )
+    def test_export_replay(
+        self, game_environment, tmp_path, frame_skip, expected_frames
+    ):
+        recording = InputRecording()
+        for event in [4] + [0] * 119:
+            recording.append(event)
+        filename = str(tmp_path / "clip.raw")
+        frame_count = export_replay(
+            recording,
+            filename,
+            scale=0.25,
+            frame_skip=frame_skip,
+            encoder_command=_copy_command,
+        )
+        assert frame_count == expected_frames
+        frame_size = 194 * 134 * 3
+        assert os.path.getsize(filename) == expected_frames * frame_size
+
+    def test_export_replay_is_silent_and_loads_levels_once(
+        self, game_environment, tmp_path, monkeypatch
+    ):
+        def fail():
+            raise AssertionError("Mixer opened")
+
+        loaded_folders = []
+        load_level_pack = replay_exporter.load_level_pack
+
+        def counting_load_level_pack(folder_name, **kwargs):
+            loaded_folders.append(folder_name)
+            return load_level_pack(folder_name, **kwargs)
+
+        monkeypatch.setattr(pygame.mixer, "init", fail)
+        monkeypatch.setattr(
+            replay_exporter, "load_level_pack", counting_load_level_pack
+        )
+        monkeypatch.setattr(game, "load_level_pack", counting_load_level_pack)
+        recording = InputRecording()
+        for event in [4] + [0] * 9:
+            recording.append(event)
+        frame_count = export_replay(
+            recording,
+            str(tmp_path / "clip.raw"),
+            scale=0.25,
+            encoder_command=_copy_command,
+        )
+        assert frame_count == 11
+        assert loaded_folders == ["level"]
+
+    def test_invalid_arguments(self, tmp_path):
+        filename = str(tmp_path / "clip.raw")
+        with pytest.raises(ValueError):
+            export_replay(InputRecording(), filename, scale=0.0)
+        with pytest.raises(ValueError):
+            export_replay(InputRecording(), filename, frame_skip=0)
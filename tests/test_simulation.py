@@ -0,0 +1,227 @@
+from bricks.difficulty_curve import Curve
+from bricks.difficulty_curve import DEFAULT_CURVES
+from bricks.game_events import BallLost
+from bricks.game_events import GameOver
+from bricks.game_events import LevelCleared
+from bricks.game_events import LevelStarted
+from bricks.level_generator import generate_level_data
+from bricks.level_pack import LevelPack
+from bricks.simulation import Action
+from bricks.simulation import START_LIFES
+from bricks.simulation import Simulation
+
+import pytest
+
+
+def _make_level_pack(level_count=2):
+    return LevelPack(
+        [
+            ("level%d.json" % seed, generate_level_data(seed))
+            for seed in range(1, level_count + 1)
+        ],
+        {},
+    )
+
+
+def _make_simulation(is_fixed_point=False, level_count=2):
+    return Simulation(
+        _make_level_pack(level_count), is_fixed_point=is_fixed_point
+    )
+
+
+def _state(simulation):
+    level = simulation.level
+    return (
+        simulation.score,
+        simulation.lifes,
+        simulation.level_idx,
+        [(ball.top_left.x, ball.top_left.y) for ball in level.balls],
+        level.platform.top_left.x,
+        [brick.hitpoints for brick in level.bricks],
+    )
+
+
+def _play(simulation, frame_count):
+    simulation.step(Action.SPACE)
+    for frame in range(frame_count):
+        action = Action.LEFT if frame % 40 < 20 else Action.RIGHT
+        simulation.step(action)
+        if simulation.is_game_over or simulation.is_level_cleared:
+            return
+
+
+class TestSimulation:
+    def test_init(self):
+        simulation = _make_simulation()
+        assert simulation.level_idx == 1
+        assert simulation.score == 0
+        assert simulation.lifes == START_LIFES
+        assert simulation.difficulty_tier == 0
+        assert not simulation.is_game_over
+        assert not simulation.is_level_cleared
+
+    def test_balls_do_not_move_before_space(self):
+        simulation = _make_simulation()
+        position = simulation.level.balls[0].top_left.y
+        for _ in range(10):
+            simulation.step(Action.NONE)
+        assert simulation.level.balls[0].top_left.y == position
+
+        simulation.step(Action.SPACE)
+        assert simulation.level.balls[0].top_left.y != position
+
+    def test_platform_moves_left_and_right(self):
+        simulation = _make_simulation()
+        x = simulation.level.platform.top_left.x
+        simulation.step(Action.LEFT)
+        assert simulation.level.platform.top_left.x < x
+        simulation.step(Action.RIGHT)
+        simulation.step(Action.RIGHT)
+        assert simulation.level.platform.top_left.x > x
+
+    def test_lost_ball_costs_a_life(self):
+        simulation = _make_simulation()
+        simulation.step(Action.SPACE)
+        while simulation.lifes == START_LIFES:
+            simulation.step(Action.NONE)
+        events = []
+        simulation.event_queue.subscribe(BallLost, events.append)
+        simulation.event_queue.drain()
+        assert simulation.lifes == START_LIFES - 1
+        assert len(events) == 1
+        assert events[0].lifes == START_LIFES - 1
+        assert events[0].miss_distance >= 0.0
+
+    def test_lost_ball_reports_miss_distance(self):
+        simulation = _make_simulation()
+        platform = simulation.level.platform
+        simulation.step(Action.SPACE)
+        while simulation.lifes == START_LIFES:
+            platform.top_left.x = 0.0
+            simulation.step(Action.NONE)
+        events = []
+        simulation.event_queue.subscribe(BallLost, events.append)
+        simulation.event_queue.drain()
+        assert events[0].miss_distance > 0.0
+
+    def test_game_over_starts_first_level_again(self):
+        simulation = _make_simulation()
+        while not simulation.is_game_over:
+            simulation.step(Action.SPACE)
+        assert simulation.lifes == 0
+        lost_balls = []
+        simulation.event_queue.subscribe(BallLost, lost_balls.append)
+        simulation.event_queue.drain()
+        assert lost_balls[-1].lifes == 0
+
+        events = []
+        simulation.event_queue.subscribe(GameOver, events.append)
+        simulation.event_queue.subscribe(LevelStarted, events.append)
+        simulation.start_next_level()
+        simulation.event_queue.drain()
+        assert [type(event) for event in events] == [GameOver, LevelStarted]
+        assert simulation.lifes == START_LIFES
+        assert simulation.score == 0
+        assert not simulation.is_game_over
+
+    def test_start_next_level_after_cleared_level(self):
+        simulation = _make_simulation()
+        for brick in simulation.level.bricks:
+            brick.hitpoints = 0
+        simulation.step(Action.SPACE)
+        assert simulation.is_level_cleared
+
+        events = []
+        simulation.event_queue.subscribe(LevelCleared, events.append)
+        simulation.start_next_level()
+        simulation.event_queue.drain()
+        assert len(events) == 1
+        assert simulation.level_idx == 2
+        assert not simulation.is_level_cleared
+
+    def test_difficulty_follows_curves(self):
+        curves = DEFAULT_CURVES._replace(
+            ball_velocity=Curve(start=10.0, per_level=1.0, per_loop=5.0)
+        )
+        simulation = Simulation(_make_level_pack(), difficulty_curves=curves)
+        assert simulation.level.balls[0].velocity == 10.0
+        for expected_velocity, expected_tier in ((11.0, 0), (15.0, 1)):
+            for brick in simulation.level.bricks:
+                brick.hitpoints = 0
+            simulation.step(Action.SPACE)
+            simulation.start_next_level()
+            assert simulation.difficulty_tier == expected_tier
+            assert simulation.difficulty_parameters.ball_velocity == (
+                expected_velocity
+            )
+            assert simulation.level.balls[0].velocity == expected_velocity
+
+    def test_set_difficulty_parameters_resets_ball(self):
+        simulation = _make_simulation()
+        parameters = simulation.difficulty_parameters
+        parameters.ball_velocity = 12.0
+        simulation.difficulty_parameters = parameters
+        assert simulation.level.balls[0].velocity == 12.0
+        assert not simulation.level.balls[0].is_active
+
+    def test_start_in_tier(self):
+        simulation = Simulation(_make_level_pack(), start_difficulty_tier=2)
+        assert simulation.difficulty_tier == 2
+        assert simulation.difficulty_parameters.ball_velocity == 20.0
+
+    @pytest.mark.parametrize("is_fixed_point", [(False), (True)])
+    def test_restored_snapshot_continues_identically(self, is_fixed_point):
+        simulation = _make_simulation(is_fixed_point)
+        _play(simulation, 100)
+        snapshot = simulation.snapshot()
+
+        _play(simulation, 300)
+        expected = _state(simulation)
+
+        simulation.restore(snapshot)
+        _play(simulation, 300)
+        assert _state(simulation) == expected
+
+    def test_restore_rewinds_bricks_and_score(self):
+        simulation = _make_simulation()
+        snapshot = simulation.snapshot()
+        expected = _state(simulation)
+
+        _play(simulation, 1000)
+        assert simulation.score > 0
+
+        simulation.restore(snapshot)
+        assert _state(simulation) == expected
+
+    def test_restore_in_other_simulation(self):
+        simulation = _make_simulation()
+        _play(simulation, 100)
+        other = _make_simulation()
+        other.restore(simulation.snapshot())
+        assert _state(other) == _state(simulation)
+        assert other.snapshot() == simulation.snapshot()
+
+    def test_restore_snapshot_of_other_level(self):
+        simulation = _make_simulation()
+        snapshot = simulation.snapshot()
+        simulation.start_next_level()
+        assert simulation.level_idx == 2
+
+        simulation.restore(snapshot)
+        assert simulation.level_idx == 1
+        assert _state(simulation) == _state(_make_simulation())
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            (lambda snapshot: b""),
+            (lambda snapshot: b"XXXX" + snapshot[4:]),
+            (lambda snapshot: snapshot[:-1]),
+            (lambda snapshot: snapshot + b"\x00"),
+        ],
+    )
+    def test_restore_invalid_snapshot_throws_ValueError(self, mutate):
+        simulation = _make_simulation()
+        snapshot = simulation.snapshot()
+        with pytest.raises(ValueError):
+            simulation.restore(mutate(snapshot))
@@ -1,5 +1,10 @@
+from bricks.types.angle import ANGLE_STEPS
 from bricks.types.angle import Angle
 from bricks.types.angle import Quadrant
+from bricks.types.angle import QuantizedAngle
+from bricks.types.angle import STEP_ANGLE
+from bricks.types.angle import angle_to_step
+from bricks.types.angle import step_to_angle
 from bricks.types.angle import _calc_quadrant
 from bricks.types.angle import _is_in_quadrant_I
 from bricks.types.angle import _is_in_quadrant_II
@@ -8,6 +13,7 @@ from bricks.types.angle import _is_in_quadrant_IV
 from bricks.types.angle import _calc_angle_if_out_of_rangle
 
 import pytest
+import random
 from pytest import approx
 from numpy import deg2rad
 
@@ -206,6 +212,8 @@ def test_is_in_quarant_IV_true(angle: Angle, result: bool):
         (-0.1, 359.9),
         (-360.0, 0.0),
         (-540.0, 180.0),
+        (1085.0, 5.0),
+        (-725.0, 355.0),
     ],
 )
 def test_calc_angle_if_out_of_range(angle, result_angle):
@@ -213,3 +221,73 @@ def test_calc_angle_if_out_of_range(angle, result_angle):
         deg2rad(result_angle)
     )
 
+
+
+class TestQuantizedAngle:
+    def test_init(self):
+        obj = QuantizedAngle()
+        assert obj.value == 0.0
+        assert obj.step == 0
+        assert obj.quadrant == Quadrant.I
+        assert obj.quadrant_step == 0
+
+    def test_value_is_within_half_a_step(self):
+        rng = random.Random(0)
+        for _ in range(1000):
+            value = rng.uniform(-4.0 * 3.14159, 4.0 * 3.14159)
+            expected = Angle()
+            expected.value = value
+            obj = QuantizedAngle(value)
+            assert abs(obj.value - expected.value) <= STEP_ANGLE / 2.0
+            assert abs(obj.quadrant_angle - expected.quadrant_angle) <= (
+                STEP_ANGLE / 2.0
+            )
+
+    @pytest.mark.parametrize(
+        "angle, quadrant, quadrant_step",
+        [
+            (0.0, Quadrant.I, 0),
+            (90.0, Quadrant.I, ANGLE_STEPS // 4),
+            (180.0, Quadrant.II, ANGLE_STEPS // 4),
+            (270.0, Quadrant.III, ANGLE_STEPS // 4),
+            (360.0, Quadrant.IV, ANGLE_STEPS // 4),
+        ],
+    )
+    def test_quadrant_on_borders_matches_angle(
+        self, angle, quadrant, quadrant_step
+    ):
+        obj = QuantizedAngle(deg2rad(angle))
+        assert obj.quadrant == quadrant == Angle(deg2rad(angle)).quadrant
+        assert obj.quadrant_step == quadrant_step
+
+    def test_from_angle_keeps_quadrant(self):
+        angle = Angle()
+        angle.quadrant = Quadrant.II
+        angle.quadrant_angle = 0.0
+        obj = QuantizedAngle.from_angle(angle)
+        assert obj.quadrant == Quadrant.II
+        assert obj.quadrant_step == 0
+        assert obj.value == approx(deg2rad(90.0))
+
+    @pytest.mark.parametrize("angle", [0.0, 30.0, 120.0, 240.0, 330.0])
+    def test_mirror_matches_angle(self, angle):
+        for mirror in ("mirror_horizontal", "mirror_vertical"):
+            expected = Angle(deg2rad(angle))
+            obj = QuantizedAngle(deg2rad(angle))
+            getattr(expected, mirror)()
+            getattr(obj, mirror)()
+            assert obj.quadrant == expected.quadrant
+            assert abs(obj.value - expected.value) <= STEP_ANGLE / 2.0
+
+    def test_mirror_twice_is_exact(self):
+        obj = QuantizedAngle(1.0)
+        step = obj.step
+        obj.mirror_horizontal()
+        obj.mirror_horizontal()
+        obj.mirror_vertical()
+        obj.mirror_vertical()
+        assert obj.step == step
+
+    def test_every_step_round_trips(self):
+        for step in range(ANGLE_STEPS + 1):
+            assert angle_to_step(step_to_angle(step)) == step
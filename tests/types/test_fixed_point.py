@@ -0,0 +1,42 @@
+from bricks.types.fixed_point import ONE
+from bricks.types.fixed_point import QUADRANT_STEPS
+from bricks.types.fixed_point import SIN_TABLE
+from bricks.types.fixed_point import multiply
+from bricks.types.fixed_point import to_fixed
+from bricks.types.fixed_point import to_float
+
+from math import pi
+from math import sin
+
+import pytest
+
+
+class TestFixedPoint:
+    @pytest.mark.parametrize("value", [(0.0), (1.0), (0.75), (12.5), (-3.25)])
+    def test_conversion_is_exact_for_dyadic_values(self, value):
+        assert to_float(to_fixed(value)) == value
+
+    def test_to_fixed_rounds(self):
+        assert to_fixed(1.0 / 3.0) == 21845
+        assert to_fixed(2.0 / 3.0) == 43691
+
+    def test_multiply(self):
+        assert multiply(to_fixed(1.5), to_fixed(2.25)) == to_fixed(3.375)
+        assert multiply(to_fixed(-0.5), to_fixed(0.5)) == to_fixed(-0.25)
+
+    def test_sin_table_bounds(self):
+        assert len(SIN_TABLE) == QUADRANT_STEPS + 1
+        assert SIN_TABLE[0] == 0
+        assert SIN_TABLE[-1] == ONE
+        assert all(a <= b for a, b in zip(SIN_TABLE, SIN_TABLE[1:]))
+
+    def test_sin_table_matches_sin(self):
+        for step, value in enumerate(SIN_TABLE):
+            expected = sin(step / QUADRANT_STEPS * pi / 2.0) * ONE
+            assert abs(value - expected) <= 0.5
+
+    def test_sin_table_checksum(self):
+        # The table is computed with integers only and must be identical on
+        # every machine.
+        assert sum(SIN_TABLE) == 170924102
+        assert SIN_TABLE[QUADRANT_STEPS // 2] == 46341